@@ -0,0 +1,45 @@
+"""
+Measures the cold import time of 'import skaler' and of the heavier entry
+points, each in a fresh interpreter.
+
+Usage:
+    python -m benchmarks.bench_import [--runs N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = (
+    "import skaler",
+    "from skaler import APIProvider",
+    "from skaler import SkaleManager",
+)
+
+
+def measure(statement: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = measure("pass", args.runs)
+    print(f"bare interpreter start: {baseline * 1000:.1f}ms")
+    print(f"{'statement':<36}{'median ms':>12}{'over python':>14}")
+    for statement in STATEMENTS:
+        elapsed = measure(statement, args.runs)
+        print(f"{statement:<36}{elapsed * 1000:>12.1f}"
+              f"{(elapsed - baseline) * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
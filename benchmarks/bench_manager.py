@@ -0,0 +1,177 @@
+"""
+Load test driving SkaleManager against a local mock API and mock proxies.
+
+Reports throughput, latency percentiles, quota utilization (requests
+recorded against providers versus their configured limits) and ban rate
+(429/403 responses), so scaling changes can be validated locally before
+they are rolled out.
+
+Usage:
+    python -m benchmarks.bench_manager [--requests N] [--concurrency N]
+        [--keys N] [--limit N] [--proxies N] [--latency S]
+        [--error-rate P] [--key-limit N] [--ban-after N] [--adaptive]
+        [--slow-keys N] [--slow-latency S] [--latency-aware]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from benchmarks.mock_upstream import MockAPI, MockProxy
+from skaler import APIProvider, ProxyPool, SkaleManager, TransportConfig
+from skaler.exceptions import SkalerError
+
+
+class LoadReport:
+    """
+    Collects per-request outcomes of a load test and prints a summary.
+
+    Attributes:
+        latencies (List[float]): Latency of every completed request.
+        outcomes (Dict[str, int]): Request count per outcome, either an
+            HTTP status code or a Skaler exception name.
+        elapsed (float): Wall-clock duration of the run in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.latencies = []
+        self.outcomes = {}
+        self.elapsed = 0.0
+
+    def record(self, outcome: str, latency: float) -> None:
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        self.latencies.append(latency)
+
+    @property
+    def total(self) -> int:
+        return sum(self.outcomes.values())
+
+    def percentile(self, q: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[q - 1]
+
+    def summary(self, providers: list) -> str:
+        ok = self.outcomes.get("200", 0)
+        banned = self.outcomes.get("429", 0) + self.outcomes.get("403", 0)
+        capacity = sum(provider.limit for provider in providers)
+        used = sum(provider.backend.usage.get(provider.name, 0)
+                   for provider in providers)
+        lines = [
+            f"requests        {self.total}",
+            f"elapsed         {self.elapsed:.2f}s",
+            f"throughput      {ok / self.elapsed:.0f} ok/s "
+            f"({self.total / self.elapsed:.0f} total/s)",
+            f"latency p50     {self.percentile(50) * 1000:.1f}ms",
+            f"latency p95     {self.percentile(95) * 1000:.1f}ms",
+            f"latency p99     {self.percentile(99) * 1000:.1f}ms",
+            f"quota used      {used}/{capacity} "
+            f"({used / capacity:.1%})" if capacity else "quota used      -",
+            f"ban rate        {banned / max(self.total, 1):.1%}",
+            "outcomes        " + ", ".join(
+                f"{name}={count}"
+                for name, count in sorted(self.outcomes.items())
+            ),
+        ]
+        return "\n".join(lines)
+
+
+async def drive(
+    manager: SkaleManager,
+    url: str,
+    total: int,
+    concurrency: int
+) -> LoadReport:
+    """
+    Sends 'total' requests through the manager with bounded concurrency.
+    """
+    report = LoadReport()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await manager.send_request(
+                    "POST", url, data={"prompt": "hello"}
+                )
+                outcome = str(response.status_code)
+            except SkalerError as e:
+                outcome = type(e).__name__
+            report.record(outcome, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--keys", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=1000,
+                        help="limit_per_minute configured on each provider")
+    parser.add_argument("--proxies", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--key-limit", type=int, default=0,
+                        help="real per-key limit enforced by the mock API")
+    parser.add_argument("--ban-after", type=int, default=0)
+    parser.add_argument("--adaptive", action="store_true",
+                        help="learn provider limits from responses")
+    parser.add_argument("--slow-keys", type=int, default=0,
+                        help="keys answered with extra latency")
+    parser.add_argument("--slow-latency", type=float, default=0.05)
+    parser.add_argument("--latency-aware", action="store_true",
+                        help="prefer providers and proxies that respond "
+                             "faster")
+    args = parser.parse_args()
+
+    api = await MockAPI(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        key_limit=args.key_limit,
+        slow_keys={f"Bearer sk-{i}" for i in range(args.slow_keys)},
+        slow_latency=args.slow_latency,
+    ).start()
+    proxies = [
+        await MockProxy(api, ban_after=args.ban_after).start()
+        for _ in range(args.proxies)
+    ]
+
+    providers = [
+        APIProvider(
+            name=f"key-{i}",
+            key=f"sk-{i}",
+            limit_per_minute=args.limit,
+            adaptive=args.adaptive
+        )
+        for i in range(args.keys)
+    ]
+    pool = ProxyPool([proxy.url for proxy in proxies]) if proxies else None
+    manager = SkaleManager(
+        providers=providers,
+        proxies=pool,
+        transport=TransportConfig(pool_timeout=60.0),
+        latency_aware=args.latency_aware,
+    )
+
+    try:
+        report = await drive(
+            manager, api.url + "/v1/completions",
+            args.requests, args.concurrency
+        )
+        print(report.summary(providers))
+    finally:
+        await manager.aclose()
+        for proxy in proxies:
+            await proxy.stop()
+        await api.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+Measures the memory cost of large key and proxy fleets, and the time to
+select proxies from a large pool.
+
+Providers are added to a manager, which gives them its backend, and for
+comparison built with one InMemoryBackend each. Proxy pools are measured
+fresh and after a probe round has recorded a latency and boost for every
+proxy. Sizes are traced allocations per object, after usage has been
+recorded for every key.
+
+Usage:
+    python -m benchmarks.bench_memory [--keys N] [--proxies N]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from skaler import APIProvider, ProxyPool, SkaleManager
+from skaler.backend import InMemoryBackend
+
+
+def traced(build):
+    """
+    Returns the result of 'build()' and the bytes it left allocated.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def providers(count: int, own_backend: bool) -> list:
+    fleet = [
+        APIProvider(
+            name=f"key-{i}",
+            key=f"sk-{i:048d}",
+            limit_per_minute=60,
+            backend=InMemoryBackend() if own_backend else None
+        )
+        for i in range(count)
+    ]
+
+    async def use():
+        # A manager binds providers created without a backend to its own
+        await SkaleManager(providers=fleet).aclose()
+        for provider in fleet:
+            await provider.record_usage()
+
+    asyncio.run(use())
+    return fleet
+
+
+def pool(count: int, probed: bool) -> ProxyPool:
+    urls = [f"http://10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}:8080"
+            for i in range(count)]
+    proxy_pool = ProxyPool(urls)
+    for url in urls[::10]:
+        proxy_pool.block(url)
+    if probed:
+        for i, url in enumerate(urls):
+            proxy_pool.set_latency(url, 0.05 + i % 100 / 1000)
+            proxy_pool.boost(url, 1 + i % 4)
+    return proxy_pool
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--proxies", type=int, default=50000)
+    parser.add_argument("--picks", type=int, default=200000)
+    args = parser.parse_args()
+
+    for label, own_backend in (("manager backend", False),
+                               ("backend per key", True)):
+        _, size = traced(lambda: providers(args.keys, own_backend))
+        print(f"providers, {label:<16}{size / args.keys:>10.0f} B/key")
+
+    for label, probed in (("fresh", False), ("probed", True)):
+        proxy_pool, size = traced(lambda: pool(args.proxies, probed))
+        print(f"proxies, {label:<16}{size / args.proxies:>10.0f} B/proxy")
+
+    start = time.perf_counter()
+    for _ in range(args.picks):
+        proxy_pool.get_next()
+    elapsed = time.perf_counter() - start
+    print(f"get_next{'':<17}{elapsed / args.picks * 1e9:>10.0f} ns/pick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares the JSON serializers available to Requester on LLM-sized
+payloads: a chat request with a long history and a completion response.
+
+Usage:
+    python -m benchmarks.bench_serializers [--iterations N]
+"""
+import argparse
+import time
+
+from skaler.http.serializers import (
+    MsgspecSerializer,
+    OrjsonSerializer,
+    StdlibSerializer,
+)
+
+REQUEST = {
+    "model": "gpt-4o",
+    "temperature": 0.2,
+    "messages": [
+        {"role": "user" if i % 2 else "assistant", "content": "lorem " * 400}
+        for i in range(50)
+    ],
+}
+
+RESPONSE = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "choices": [
+        {
+            "index": i,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "ipsum " * 2000},
+        }
+        for i in range(4)
+    ],
+    "usage": {"prompt_tokens": 20000, "completion_tokens": 8000},
+}
+
+
+def timeit(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    serializers = [StdlibSerializer()]
+    for serializer_class in (OrjsonSerializer, MsgspecSerializer):
+        try:
+            serializers.append(serializer_class())
+        except ImportError:
+            print(f"{serializer_class.name}: not installed, skipped")
+
+    body = StdlibSerializer().encode(RESPONSE)
+    print(f"request {len(StdlibSerializer().encode(REQUEST)) / 1024:.0f} KiB, "
+          f"response {len(body) / 1024:.0f} KiB")
+    print(f"{'serializer':<12}{'encode us':>12}{'decode us':>12}")
+    for serializer in serializers:
+        encode = timeit(lambda: serializer.encode(REQUEST), args.iterations)
+        decode = timeit(lambda: serializer.decode(body), args.iterations)
+        print(f"{serializer.name:<12}{encode:>12.1f}{decode:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
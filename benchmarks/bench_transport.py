@@ -0,0 +1,95 @@
+"""
+Measures Requester throughput against a local server at increasing
+concurrency, comparing the default transport with a tuned one.
+
+Usage:
+    python -m benchmarks.bench_transport [--requests N] [--url URL]
+        [--http2]
+
+Without --url a local HTTP/1.1 server is started. HTTP/2 needs an
+h2-capable (TLS) upstream, so --http2 is only meaningful with --url.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.mock_upstream import MockUpstream
+from skaler import Requester, TransportConfig
+
+CONCURRENCY_LEVELS = (1, 100, 1000)
+
+
+async def run(requester: Requester, url: str, total: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def one():
+        nonlocal errors
+        async with semaphore:
+            try:
+                response = await requester.send("GET", url)
+                response.raise_for_status()
+            except Exception:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return (total - errors) / (time.perf_counter() - start), errors
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--http2", action="store_true")
+    args = parser.parse_args()
+
+    configs = {
+        "default": TransportConfig(),
+        "tuned": TransportConfig(
+            http2=args.http2,
+            keepalive_expiry=30.0,
+            pool_timeout=30.0,
+            dns_cache_ttl=300
+        ),
+        # httpcore scans every pooled connection per queued request, so a
+        # large keep-alive pool costs CPU under high concurrency.
+        "wide": TransportConfig(
+            http2=args.http2,
+            max_keepalive_connections=100,
+            keepalive_expiry=30.0,
+            pool_timeout=30.0
+        ),
+    }
+
+    upstream = None
+    url = args.url
+    if url is None:
+        upstream = await MockUpstream().start()
+        url = upstream.url + "/v1/ping"
+
+    try:
+        print(
+            f"{'config':<10}{'concurrency':>12}{'req/s':>12}"
+            f"{'errors':>8}{'conns':>8}"
+        )
+        for name, transport in configs.items():
+            for concurrency in CONCURRENCY_LEVELS:
+                requester = Requester(transport)
+                before = upstream.connections if upstream else 0
+                rate, errors = await run(
+                    requester, url, args.requests, concurrency
+                )
+                conns = upstream.connections - before if upstream else "-"
+                await requester.aclose()
+                print(
+                    f"{name:<10}{concurrency:>12}{rate:>12.0f}"
+                    f"{errors:>8}{conns:>8}"
+                )
+    finally:
+        if upstream is not None:
+            await upstream.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
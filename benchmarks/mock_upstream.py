@@ -0,0 +1,230 @@
+"""
+Minimal local HTTP/1.1 servers used as upstream APIs and proxies in
+benchmarks.
+
+They speak just enough HTTP to serve keep-alive requests from httpx, so
+benchmarks measure Skaler and the client stack rather than a web
+framework.
+"""
+import asyncio
+import random
+import time
+from urllib.parse import urlsplit
+
+RESPONSE_BODY = b'{"ok": true}'
+
+
+class MockUpstream:
+    """
+    A keep-alive HTTP/1.1 server answering every request with a small JSON
+    body.
+
+    Attributes:
+        host (str): Interface the server listens on.
+        port (int): Port the server listens on (0 picks a free port).
+        requests (int): Number of requests served so far.
+        connections (int): Number of TCP connections accepted so far.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.connections = 0
+        self._server = None
+        self._handlers = {}
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the base URL of the running server.
+        """
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "MockUpstream":
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=4096
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in self._handlers:
+                writer.close()
+            await asyncio.gather(
+                *self._handlers.values(), return_exceptions=True
+            )
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MockUpstream":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def respond(self, method: str, path: str, headers: dict):
+        """
+        Returns the (status, extra headers, body) for a request.
+        """
+        return 200, {}, RESPONSE_BODY
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        self._handlers[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length:
+                    await reader.readexactly(length)
+
+                self.requests += 1
+                status, extra, body = await self.respond(method, path, headers)
+                head = [f"HTTP/1.1 {status} X"]
+                head.append(f"content-length: {len(body)}")
+                head.append("content-type: application/json")
+                head.extend(f"{k}: {v}" for k, v in extra.items())
+                writer.write(
+                    ("\r\n".join(head) + "\r\n\r\n").encode() + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._handlers.pop(writer, None)
+            writer.close()
+
+
+class MockAPI(MockUpstream):
+    """
+    A mock rate-limited API with configurable latency, random 429
+    injection and per-key request limits.
+
+    Keys are taken from the 'authorization' header (or 'x-api-key'), so
+    each Skaler provider is limited independently, like a real API.
+
+    Attributes:
+        latency (float): Mean response latency in seconds.
+        jitter (float): Uniform latency jitter in seconds.
+        error_rate (float): Probability of answering with a random 429.
+        key_limit (int): Requests allowed per key per window; 0 disables.
+        window (float): Length of the per-key limit window in seconds.
+        slow_keys (Set[str]): Keys on a slower tier, e.g. 'Bearer sk-0'.
+        slow_latency (float): Extra latency in seconds for slow keys.
+        usage (Dict[str, int]): Requests per key in the current window.
+        status_counts (Dict[int, int]): Responses sent, by status code.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        key_limit: int = 0,
+        window: float = 60.0,
+        slow_keys=(),
+        slow_latency: float = 0.0,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.key_limit = key_limit
+        self.window = window
+        self.slow_keys = set(slow_keys)
+        self.slow_latency = slow_latency
+        self.usage = {}
+        self.status_counts = {}
+        self._window_start = time.monotonic()
+
+    def _count(self, status: int) -> int:
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        return status
+
+    async def respond(self, method: str, path: str, headers: dict):
+        key = headers.get("authorization") or headers.get("x-api-key", "")
+        delay = self.latency + random.uniform(0, self.jitter)
+        if key in self.slow_keys:
+            delay += self.slow_latency
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self.usage.clear()
+            self._window_start = now
+
+        used = self.usage.get(key, 0) + 1
+        self.usage[key] = used
+        reset = self.window - (now - self._window_start)
+        limit_headers = {}
+        if self.key_limit:
+            limit_headers = {
+                "x-ratelimit-limit": self.key_limit,
+                "x-ratelimit-remaining": max(self.key_limit - used, 0),
+                "x-ratelimit-reset": f"{reset:.3f}",
+            }
+            if used > self.key_limit:
+                limit_headers["retry-after"] = f"{reset:.3f}"
+                return self._count(429), limit_headers, b'{"error": "limit"}'
+
+        if self.error_rate and random.random() < self.error_rate:
+            return self._count(429), {"retry-after": 1}, b'{"error": "busy"}'
+
+        return self._count(200), limit_headers, RESPONSE_BODY
+
+
+class MockProxy(MockUpstream):
+    """
+    A mock forward proxy in front of a MockAPI.
+
+    Requests arrive in absolute form ('GET http://host/path') and are
+    answered by calling the upstream in-process instead of opening a
+    second hop, so the proxy adds connection handling but no extra
+    network latency. A proxy can simulate bans by answering 403 once it
+    has relayed more than 'ban_after' requests.
+
+    Attributes:
+        upstream (MockAPI): The API requests are relayed to.
+        ban_after (int): Requests relayed before the proxy is banned;
+            0 disables bans.
+        banned (int): Number of requests rejected with 403.
+    """
+
+    def __init__(
+        self,
+        upstream: MockAPI,
+        *,
+        ban_after: int = 0,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self.upstream = upstream
+        self.ban_after = ban_after
+        self.banned = 0
+
+    async def respond(self, method: str, path: str, headers: dict):
+        if self.ban_after and self.requests > self.ban_after:
+            self.banned += 1
+            return 403, {}, b'{"error": "banned"}'
+
+        url = urlsplit(path)
+        target = url.path + (f"?{url.query}" if url.query else "")
+        return await self.upstream.respond(method, target, headers)
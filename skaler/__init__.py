@@ -1,12 +1,83 @@
-from skaler.core.manager import SkaleManager
-from skaler.core.providers import APIProvider, DummyProvider
-from skaler.core.proxy_pool import ProxyPool
-from skaler.http.requester import Requester
+"""
+Skaler public API.
+
+Names are imported lazily on first access, so 'import skaler' stays cheap
+and heavy dependencies such as httpx are only loaded when a class that
+needs them is used.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from skaler.core.circuit_breaker import CircuitBreakerRegistry
+    from skaler.core.config_watcher import ConfigWatcher
+    from skaler.core.deadline import Deadline
+    from skaler.core.manager import SkaleManager
+    from skaler.core.pipeline import PipelineResult, RequestPipeline
+    from skaler.core.providers import (
+        APIProvider,
+        AuthScheme,
+        BearerAuth,
+        DummyProvider,
+        HeaderAuth,
+        QueryParamAuth,
+        RequestAdapter,
+    )
+    from skaler.core.proxy_pool import ProxyPool
+    from skaler.core.proxy_prober import ProxyProber
+    from skaler.http.requester import Requester
+    from skaler.http.transport import TransportConfig
+
+_LAZY = {
+    "SkaleManager": "skaler.core.manager",
+    "APIProvider": "skaler.core.providers",
+    "ProxyPool": "skaler.core.proxy_pool",
+    "RequestPipeline": "skaler.core.pipeline",
+    "PipelineResult": "skaler.core.pipeline",
+    "ProxyProber": "skaler.core.proxy_prober",
+    "CircuitBreakerRegistry": "skaler.core.circuit_breaker",
+    "ConfigWatcher": "skaler.core.config_watcher",
+    "Deadline": "skaler.core.deadline",
+    "DummyProvider": "skaler.core.providers",
+    "AuthScheme": "skaler.core.providers",
+    "BearerAuth": "skaler.core.providers",
+    "HeaderAuth": "skaler.core.providers",
+    "QueryParamAuth": "skaler.core.providers",
+    "RequestAdapter": "skaler.core.providers",
+    "Requester": "skaler.http.requester",
+    "TransportConfig": "skaler.http.transport",
+}
 
 __all__ = [
     "SkaleManager",
     "APIProvider",
     "ProxyPool",
+    "RequestPipeline",
+    "PipelineResult",
+    "ProxyProber",
+    "CircuitBreakerRegistry",
+    "ConfigWatcher",
+    "Deadline",
     "DummyProvider",
-    "Requester"
+    "AuthScheme",
+    "BearerAuth",
+    "HeaderAuth",
+    "QueryParamAuth",
+    "RequestAdapter",
+    "Requester",
+    "TransportConfig",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
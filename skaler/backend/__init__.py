@@ -1,3 +1,27 @@
-from skaler.backend.memory_backend import InMemoryBackend
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["InMemoryBackend"]
+if TYPE_CHECKING:
+    from skaler.backend.memory_backend import InMemoryBackend
+    from skaler.backend.redis_backend import RedisBackend
+
+# RedisBackend is only imported when used, so redis stays optional
+_LAZY = {
+    "InMemoryBackend": "skaler.backend.memory_backend",
+    "RedisBackend": "skaler.backend.redis_backend",
+}
+
+__all__ = [
+    "InMemoryBackend",
+    "RedisBackend",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -8,17 +8,40 @@ class InMemoryBackend:
     This backend can be used to enforce per-minute rate limits and temporarily
     block providers that have failed or exceeded their usage limits.
 
+    Usage is counted in fixed windows aligned to multiples of 'window'
+    seconds; a count from an earlier window reads as zero.
+
     Attributes:
+        window (float): Length of a usage window in seconds.
         usage (dict): Tracks the number of requests per provider.
+        windows (dict): Index of the window each usage count belongs to.
         blocked (dict): Tracks blocked providers and their unblock timestamps.
     """
-    def __init__(self) -> None:
+    def __init__(self, window: float = 60) -> None:
         """
         Initializes the in-memory data structure for usage and block tracking.
+
+        Args:
+            window (float): Length of a usage window in seconds.
+                Default is 60.
         """
+        self.window = window
         self.usage = {}
+        self.windows = {}
         self.blocked = {}
 
+    def _current(self, provider_name: str) -> int:
+        """
+        Returns the provider's usage in the current window, dropping a
+        count left over from an earlier one.
+        """
+        index = int(time.monotonic() // self.window)
+        if self.windows.get(provider_name) != index:
+            self.windows[provider_name] = index
+            self.usage.pop(provider_name, None)
+            return 0
+        return self.usage.get(provider_name, 0)
+
     async def increment_usage(self, provider_name: str) -> None:
         """
         Increments the usage count for a specific provider.
@@ -26,7 +49,39 @@ class InMemoryBackend:
         Args:
             provider_name (str): The name of the provider.
         """
-        self.usage[provider_name] = self.usage.get(provider_name, 0) + 1
+        self.usage[provider_name] = self._current(provider_name) + 1
+
+    async def try_reserve(self, provider_name: str, limit: int) -> bool:
+        """
+        Increments the usage count only if it stays within a limit.
+
+        Args:
+            provider_name (str): The name of the provider.
+            limit (int): Maximum usage allowed in the current window.
+
+        Returns:
+            bool: True if the usage was recorded, False if the limit was
+                already reached.
+        """
+        current = self._current(provider_name)
+        if current >= limit:
+            return False
+        self.usage[provider_name] = current + 1
+        return True
+
+    async def decrement_usage(self, provider_name: str) -> None:
+        """
+        Decrements the usage count for a specific provider, giving back
+        usage recorded for a request that was never completed.
+
+        Args:
+            provider_name (str): The name of the provider.
+        """
+        count = self._current(provider_name) - 1
+        if count > 0:
+            self.usage[provider_name] = count
+        else:
+            self.usage.pop(provider_name, None)
 
     async def get_usage(self, provider_name: str) -> int:
         """
@@ -36,9 +91,9 @@ class InMemoryBackend:
             provider_name (str): The name of the provider.
 
         Returns:
-            int: The number of recorded requests.
+            int: The number of requests recorded in the current window.
         """
-        return self.usage.get(provider_name, 0)
+        return self._current(provider_name)
 
     async def reset_usage(self, provider_name: str) -> None:
         """
@@ -1,19 +1,72 @@
 
-import aioreddis
+import time
+
+import redis.asyncio as aioredis
+
+# Increment, then roll back if over the limit, in one atomic step so
+# concurrent processes cannot both take the last unit of quota
+TRY_RESERVE = """
+local used = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+if used > tonumber(ARGV[1]) then
+    redis.call('DECR', KEYS[1])
+    return 0
+end
+return 1
+"""
+
+# Never go below zero, e.g. when releasing into a window that has just
+# started
+DECREMENT = """
+if tonumber(redis.call('GET', KEYS[1]) or '0') > 0 then
+    return redis.call('DECR', KEYS[1])
+end
+return 0
+"""
 
 
 class RedisBackend:
-    def __init__(self, redis_url="redis://localhost"):
-        self.redis = aioreddis.from_url(redis_url, decode_responses=True)
+    # Usage is counted in fixed windows aligned to wall-clock multiples of
+    # 'window' seconds, so every process sharing the server agrees on when
+    # a window starts. Each window has its own key, which expires on its own.
+    def __init__(self, redis_url="redis://localhost", window=60):
+        self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self.window = window
+
+    def _usage_key(self, provider_name: str) -> str:
+        index = int(time.time() // self.window)
+        return f"provider:{provider_name}:usage:{index}"
 
     async def increment_usage(self, provider_name: str):
-        key = f"provider:{provider_name}:usage"
-        await self.redis.incr(key)
+        key = self._usage_key(provider_name)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            await pipe.incr(key).expire(key, self.window * 2).execute()
+
+    async def try_reserve(self, provider_name: str, limit: int) -> bool:
+        key = self._usage_key(provider_name)
+        return bool(await self.redis.eval(
+            TRY_RESERVE, 1, key, limit, self.window * 2
+        ))
+
+    async def decrement_usage(self, provider_name: str):
+        key = self._usage_key(provider_name)
+        await self.redis.eval(DECREMENT, 1, key)
 
     async def get_usage(self, provider_name: str) -> int:
-        key = f"provider:{provider_name}:usage"
+        key = self._usage_key(provider_name)
         return int(await self.redis.get(key) or 0)
 
     async def reset_usage(self, provider_name: str):
-        key = f"provider:{provider_name}:usage"
+        key = self._usage_key(provider_name)
         await self.redis.delete(key)
+
+    async def block_provider(self, provider_name: str, ttl: int = 60):
+        key = f"provider:{provider_name}:blocked"
+        await self.redis.set(key, 1, px=max(1, int(ttl * 1000)))
+
+    async def is_provider_blocked(self, provider_name: str) -> bool:
+        key = f"provider:{provider_name}:blocked"
+        return bool(await self.redis.exists(key))
+
+    async def aclose(self):
+        await self.redis.aclose()
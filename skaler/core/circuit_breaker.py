@@ -0,0 +1,177 @@
+import time
+from urllib.parse import urlsplit
+
+
+class CircuitBreaker:
+    """
+    Tracks the health of a single upstream host.
+
+    The breaker starts 'closed' and lets every request through. After
+    'failure_threshold' consecutive host-side failures (connection errors,
+    timeouts, 5xx responses) it 'opens' and rejects requests immediately.
+    Once 'recovery_timeout' has passed it becomes 'half_open' and lets
+    exactly one probe request through: a success closes the breaker, a
+    failure opens it again.
+
+    Attributes:
+        host (str): The host this breaker guards.
+        failure_threshold (int): Consecutive failures before opening.
+        recovery_timeout (float): Seconds to stay open before probing.
+        state (str): One of 'closed', 'open' or 'half_open'.
+        failures (int): Current count of consecutive failures.
+        opened_at (float): Monotonic timestamp of the last opening.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0
+    ) -> None:
+        """
+        Initializes a closed circuit breaker.
+
+        Args:
+            host (str): The host this breaker guards.
+            failure_threshold (int): Consecutive failures before opening.
+                Default is 5.
+            recovery_timeout (float): Seconds to stay open before letting
+                a probe through. Default is 30.
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow_request(self) -> bool:
+        """
+        Checks whether a request to the host may be sent now.
+
+        Moves an open breaker to half-open once the recovery timeout has
+        passed, and admits a single probe while half-open.
+
+        Returns:
+            bool: True if the request may proceed, False otherwise.
+        """
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                return False
+            self.state = self.HALF_OPEN
+
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self, probe: bool = True) -> None:
+        """
+        Records a successful request, closing the breaker.
+
+        Only the half-open probe decides whether the host has recovered:
+        successes of requests admitted before the breaker opened are
+        ignored while it is open or half-open.
+
+        Args:
+            probe (bool): Whether the request was admitted as the probe
+                when the breaker is half-open. Default is True.
+        """
+        if self.state == self.OPEN or (
+            self.state == self.HALF_OPEN and not probe
+        ):
+            return
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self, probe: bool = True) -> None:
+        """
+        Records a host-side failure, opening the breaker if the threshold
+        is reached or the failed request was the half-open probe.
+
+        Failures of requests admitted before the breaker opened are
+        ignored while it is open or half-open, so they neither extend the
+        outage nor take the probe's place.
+
+        Args:
+            probe (bool): Whether the request was admitted as the probe
+                when the breaker is half-open. Default is True.
+        """
+        if self.state == self.OPEN or (
+            self.state == self.HALF_OPEN and not probe
+        ):
+            return
+
+        self.failures += 1
+        self._probing = False
+        if (
+            self.state == self.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """
+        Frees the probe slot without judging the host, e.g. when the probe
+        failed for provider-specific reasons. Must only be called by the
+        request that was admitted as the probe.
+        """
+        self._probing = False
+
+
+class CircuitBreakerRegistry:
+    """
+    Holds one CircuitBreaker per upstream host, shared by all providers.
+
+    Attributes:
+        failure_threshold (int): Threshold used for new breakers.
+        recovery_timeout (float): Recovery timeout used for new breakers.
+        _breakers (Dict[str, CircuitBreaker]): Breakers keyed by host.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0
+    ) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            failure_threshold (int): Consecutive failures before a host's
+                breaker opens. Default is 5.
+            recovery_timeout (float): Seconds before an open breaker lets
+                a probe through. Default is 30.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        """
+        Returns the breaker for the host of a URL, creating it if needed.
+
+        Args:
+            url (str): A request URL.
+
+        Returns:
+            CircuitBreaker: The breaker guarding the URL's host.
+        """
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host, self.failure_threshold, self.recovery_timeout
+            )
+            self._breakers[host] = breaker
+        return breaker
@@ -0,0 +1,270 @@
+import asyncio
+import json
+import os
+
+from .providers import APIProvider, BearerAuth, HeaderAuth, QueryParamAuth
+
+AUTH_SCHEMES = {
+    "bearer": BearerAuth,
+    "header": HeaderAuth,
+    "query": QueryParamAuth,
+}
+
+
+class ConfigWatcher:
+    """
+    Keeps a SkaleManager's providers and proxies in sync with a JSON file.
+
+    The file is polled for changes and every change is applied as a diff:
+    new entries are added, changed entries are replaced or reweighted and
+    missing entries are drained and removed, so keys and proxy batches can
+    be rotated without restarting under load. The file looks like:
+
+        {
+            "providers": [
+                {"name": "openai_1", "key": "sk-...",
+                 "limit_per_minute": 60, "weight": 2},
+                {"name": "claude_1", "key": "sk-ant-...",
+                 "limit_per_minute": 50,
+                 "auth": {"scheme": "header", "name": "x-api-key"},
+                 "base_url": "https://api.anthropic.com",
+                 "capabilities": ["chat"], "cost": 3}
+            ],
+            "proxies": ["http://proxy1:8080",
+                        {"url": "http://proxy2:8080", "weight": 3}]
+        }
+
+    Attributes:
+        manager (SkaleManager): The manager kept in sync.
+        path (str): Path of the JSON file.
+        interval (float): Seconds between checks for changes.
+        drain_timeout (float or None): Maximum seconds to wait for removed
+            providers and proxies to drain.
+    """
+
+    def __init__(
+        self,
+        manager,
+        path: str,
+        interval: float = 5.0,
+        drain_timeout: float = None
+    ) -> None:
+        """
+        Initializes the watcher. Call 'start()' to begin polling.
+
+        Args:
+            manager (SkaleManager): The manager to keep in sync.
+            path (str): Path of the JSON file.
+            interval (float): Seconds between checks. Default is 5.
+            drain_timeout (float, optional): Maximum seconds to wait for
+                removed entries to drain.
+        """
+        self.manager = manager
+        self.path = path
+        self.interval = interval
+        self.drain_timeout = drain_timeout
+        self._mtime = None
+        self._specs = {}  # provider name -> spec of the running provider
+        self._task = None
+
+    async def load(self) -> bool:
+        """
+        Applies the file if it changed since the last load.
+
+        Returns:
+            bool: True if the file was (re)applied, False if unchanged.
+        """
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return False
+
+        with open(self.path, encoding="utf-8") as f:
+            config = json.load(f)
+        self._mtime = mtime
+        await self.apply(config)
+        return True
+
+    async def apply(self, config: dict) -> None:
+        """
+        Applies a configuration as a diff against the manager's state.
+
+        Every entry is parsed and every provider built before the manager
+        is touched, so a malformed file changes nothing and is retried in
+        full once fixed.
+
+        Args:
+            config (dict): Parsed configuration with optional 'providers'
+                and 'proxies' lists.
+
+        Raises:
+            KeyError, TypeError, ValueError: If an entry is malformed.
+        """
+        plan = None
+        if "providers" in config:
+            plan = self._plan_providers(config["providers"])
+        proxies = None
+        if "proxies" in config:
+            proxies = dict(_proxy_entry(entry) for entry in config["proxies"])
+
+        removals = []
+        if plan is not None:
+            removals += self._apply_providers(*plan)
+        if proxies is not None:
+            removals += self._apply_proxies(proxies)
+
+        if removals:
+            # A drain timing out only means the old entry is abandoned
+            # early; it is already out of rotation either way
+            await asyncio.gather(*removals, return_exceptions=True)
+
+    def _plan_providers(self, specs: list) -> tuple:
+        """
+        Works out the provider changes without applying them.
+
+        Returns:
+            tuple: The wanted provider names, and a (spec, replacement)
+                pair per changed provider. The replacement is None when
+                only the weight changed.
+        """
+        wanted = {spec["name"]: spec for spec in specs}
+        changes = []
+        for name, spec in wanted.items():
+            current = self._specs.get(name)
+            if current == spec:
+                continue
+            if current is not None and (
+                _without_weight(current) == _without_weight(spec)
+            ):
+                changes.append((spec, None))
+                continue
+            # Keep usage continuous across the swap; requests still
+            # running on the old object record into the same backend
+            old = self.manager.get_provider(name)
+            changes.append(
+                (spec, _build_provider(spec, getattr(old, "backend", None)))
+            )
+        return set(wanted), changes
+
+    def _apply_providers(self, wanted: set, changes: list) -> list:
+        """
+        Applies planned provider changes.
+
+        Returns:
+            List[Awaitable]: Drains of removed and replaced providers.
+        """
+        removals = []
+        for provider in self.manager.providers:
+            if provider.name not in wanted:
+                self._specs.pop(provider.name, None)
+                removals.append(self.manager.remove_provider(
+                    provider.name, timeout=self.drain_timeout
+                ))
+
+        for spec, replacement in changes:
+            weight = spec.get("weight", 1)
+            if replacement is None:
+                self.manager.reweight_provider(spec["name"], weight)
+                self._specs[spec["name"]] = spec
+            else:
+                removals.append(self._swap(spec, replacement, weight))
+        return removals
+
+    async def _swap(self, spec: dict, provider, weight: int) -> None:
+        """
+        Replaces a provider and records its spec once it is in rotation.
+        """
+        try:
+            await self.manager.replace_provider(
+                provider, weight, timeout=self.drain_timeout
+            )
+        finally:
+            # The new provider goes in before the drain, so it counts as
+            # applied even if draining the old one times out
+            if self.manager.get_provider(spec["name"]) is provider:
+                self._specs[spec["name"]] = spec
+
+    def _apply_proxies(self, wanted: dict) -> list:
+        """
+        Adds, reweights and removes proxies to match the wanted ones.
+
+        Returns:
+            List[Awaitable]: Drains of removed proxies.
+        """
+        removals = []
+        pool = self.manager.proxies
+        for proxy in (pool.proxies if pool is not None else []):
+            if proxy not in wanted:
+                removals.append(self.manager.remove_proxy(
+                    proxy, timeout=self.drain_timeout
+                ))
+        for proxy, weight in wanted.items():
+            self.manager.add_proxy(proxy, weight)
+        return removals
+
+    def start(self) -> None:
+        """
+        Starts polling the file in a background task.
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self.manager.attach(self)
+
+    async def stop(self) -> None:
+        """
+        Stops the background polling task.
+        """
+        self.manager.detach(self)
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def aclose(self) -> None:
+        """
+        Same as 'stop()'; called when the manager is closed.
+        """
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.load()
+            except (
+                OSError, ValueError, KeyError, TypeError, asyncio.TimeoutError
+            ):
+                # Keep the last good configuration while the file is
+                # missing or half-written
+                pass
+            await asyncio.sleep(self.interval)
+
+
+def _without_weight(spec: dict) -> dict:
+    return {k: v for k, v in spec.items() if k != "weight"}
+
+
+def _proxy_entry(entry) -> tuple:
+    if isinstance(entry, str):
+        return entry, 1
+    return entry["url"], entry.get("weight", 1)
+
+
+def _build_provider(spec: dict, backend=None) -> APIProvider:
+    auth = spec.get("auth")
+    if auth is not None:
+        options = {k: v for k, v in auth.items() if k != "scheme"}
+        auth = AUTH_SCHEMES[auth.get("scheme", "bearer")](**options)
+
+    return APIProvider(
+        name=spec["name"],
+        key=spec["key"],
+        limit_per_minute=spec["limit_per_minute"],
+        backend=backend,
+        auth=auth,
+        adaptive=spec.get("adaptive", False),
+        base_url=spec.get("base_url"),
+        capabilities=spec.get("capabilities", ()),
+        cost=spec.get("cost", 1.0)
+    )
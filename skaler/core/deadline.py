@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+from ..exceptions import DeadlineExceeded
+
+
+class Deadline:
+    """
+    An absolute point in time by which a request must complete.
+
+    A deadline is created once per logical request and shared by every
+    step taken on its behalf (waiting for a provider, each retry, the HTTP
+    call itself), so the total time spent never exceeds the caller's
+    budget, unlike a per-attempt timeout.
+
+    Attributes:
+        expires (float): Monotonic timestamp at which the deadline passes.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        """
+        Initializes a deadline 'timeout' seconds from now.
+
+        Args:
+            timeout (float): Seconds until the deadline.
+        """
+        self.expires = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """
+        Returns the seconds left before the deadline, never below 0.
+        """
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """
+        Returns True once the deadline has passed.
+        """
+        return time.monotonic() >= self.expires
+
+    def timeout(self, limit: float = None) -> float:
+        """
+        Returns the time left, capped at 'limit' if given.
+
+        Args:
+            limit (float, optional): An upper bound such as a per-attempt
+                timeout.
+
+        Returns:
+            float: Seconds the next step may take.
+        """
+        remaining = self.remaining()
+        return remaining if limit is None else min(remaining, limit)
+
+    def check(self) -> None:
+        """
+        Raises DeadlineExceeded if the deadline has passed.
+        """
+        if self.expired:
+            raise DeadlineExceeded
+
+    async def sleep(self, seconds: float) -> None:
+        """
+        Sleeps for 'seconds' or until the deadline, whichever comes first.
+
+        Raises:
+            DeadlineExceeded: If the deadline passed while sleeping.
+        """
+        await asyncio.sleep(self.timeout(seconds))
+        self.check()
+
+    async def run(self, awaitable):
+        """
+        Awaits 'awaitable', cancelling it when the deadline passes.
+
+        Cancellation runs the awaitable's cleanup ('finally' blocks,
+        closing half-read connections) before this returns.
+
+        Args:
+            awaitable (Awaitable): The work to bound.
+
+        Returns:
+            The awaitable's result.
+
+        Raises:
+            DeadlineExceeded: If the deadline passed first.
+        """
+        try:
+            return await asyncio.wait_for(awaitable, self.remaining())
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceeded from e
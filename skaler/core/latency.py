@@ -0,0 +1,118 @@
+from collections import deque
+
+
+class LatencyTracker:
+    """
+    Tracks observed response times per key, such as a provider name or a
+    (provider name, proxy) pair.
+
+    Each key keeps an exponentially weighted moving average (EWMA), so
+    recent samples count more than old ones, and its most recent samples
+    for percentiles. Only the 'max_keys' most recently observed keys are
+    kept, so per-pair tracking stays bounded on large fleets.
+
+    Attributes:
+        alpha (float): Weight of each new sample, between 0 and 1.
+        window (int): Recent samples kept per key for percentiles.
+        max_keys (int): Maximum number of keys tracked.
+        _averages (Dict[Hashable, float]): Moving average per key, in
+            seconds, least recently observed first.
+        _samples (Dict[Hashable, Deque[float]]): Recent samples per key.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        window: int = 64,
+        max_keys: int = 10000
+    ) -> None:
+        """
+        Initializes an empty tracker.
+
+        Args:
+            alpha (float): Weight of each new sample. Higher values follow
+                changes faster but are noisier. Default is 0.2.
+            window (int): Samples kept per key for percentiles. Default
+                is 64.
+            max_keys (int): Keys tracked before the least recently
+                observed ones are dropped. Default is 10000.
+        """
+        self.alpha = alpha
+        self.window = window
+        self.max_keys = max_keys
+        self._averages = {}
+        self._samples = {}
+
+    def __len__(self) -> int:
+        return len(self._averages)
+
+    def observe(self, key, seconds: float) -> None:
+        """
+        Records a response time.
+
+        Args:
+            key (Hashable): What was measured.
+            seconds (float): The response time.
+        """
+        average = self._averages.pop(key, None)
+        if average is None:
+            average = seconds
+            self._samples[key] = deque(maxlen=self.window)
+            if len(self._averages) >= self.max_keys:
+                oldest = next(iter(self._averages))
+                self.forget(oldest)
+        else:
+            average += self.alpha * (seconds - average)
+
+        # Re-inserting keeps the dict ordered by last observation
+        self._averages[key] = average
+        self._samples[key].append(seconds)
+
+    def average(self, key) -> float | None:
+        """
+        Returns the moving average for a key, or None if nothing was
+        observed yet.
+        """
+        return self._averages.get(key)
+
+    def percentile(self, key, q: float) -> float | None:
+        """
+        Returns a percentile of a key's recent samples.
+
+        Args:
+            key (Hashable): What was measured.
+            q (float): The percentile, from 0 to 100.
+
+        Returns:
+            float | None: The nearest-rank percentile in seconds, or None
+                if nothing was observed yet.
+        """
+        samples = self._samples.get(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(q / 100 * len(ordered)))
+        return ordered[index]
+
+    def forget(self, key) -> None:
+        """
+        Drops the samples of a key.
+        """
+        self._averages.pop(key, None)
+        self._samples.pop(key, None)
+
+    def forget_provider(self, name: str) -> None:
+        """
+        Drops the samples of a provider and of its pairs with proxies,
+        e.g. once it is removed.
+
+        Args:
+            name (str): The provider name.
+        """
+        self.forget(name)
+        pairs = [
+            key for key in self._averages
+            if isinstance(key, tuple) and key[0] == name
+        ]
+        for key in pairs:
+            self.forget(key)
@@ -1,9 +1,30 @@
+import asyncio
+import random
+import time
+from functools import partial
+from operator import attrgetter, itemgetter
+
 import httpx
 
+from ..backend import InMemoryBackend
+from ..core.circuit_breaker import CircuitBreakerRegistry
+from ..core.deadline import Deadline
+from ..core.latency import LatencyTracker
 from ..core.providers import APIProvider, DummyProvider
+from ..core.providers.auth import merge
 from ..core.proxy_pool import ProxyPool
-from ..exceptions import NoAvailableProviders, RequestFailed
+from ..core.rotation import Rotation
+from ..exceptions import CircuitOpen, NoAvailableProviders, RequestFailed
 from ..http.requester import Requester
+from ..http.serializers import Serializer
+from ..http.transport import TransportConfig
+
+# Seconds between checks for quota freed by time passing (a new rate limit
+# window, a block expiring) while waiting for a provider
+WAIT_INTERVAL = 0.05
+
+# Providers ranked at a time for a logical request
+ROUTE_SAMPLE = 8
 
 
 class SkaleManager:
@@ -11,11 +32,32 @@ class SkaleManager:
     Manages multiple API providers and optionally rotates through a proxy pool.
     Handles rate-limiting, provider blocking, and proxy rotation.
 
+    Providers and proxies can be added, removed, drained and reweighted
+    while requests are in flight.
+
+    Close the manager when done, with 'aclose()' or 'async with', to
+    release its connections and stop its background tasks:
+
+        async with SkaleManager(providers=providers) as manager:
+            response = await manager.send_request("GET", url)
+
     Attributes:
         providers (List[APIProvider], optional): List of API provider instances.
                 If not provided, a DummyProvider will be used.
+                Read-only snapshot; use the add/remove methods to change it.
         requester (Requester): The HTTP client wrapper for sending requests.
         proxies (ProxyPool or None): Optional proxy pool for rotating proxies.
+        backend (BaseBackend): Usage and block state for providers added
+            without a backend of their own.
+        breakers (CircuitBreakerRegistry): Per-host circuit breakers shared
+            by all providers.
+        latency (LatencyTracker): Observed response times per provider
+            name and per (provider name, proxy) pair.
+        latency_aware (bool): Whether full-URL requests prefer providers
+            and proxies with lower observed latency over strict rotation.
+        exploration (float): Share of requests that ignore latency, so
+            slow-looking providers and pairs keep being measured.
+        closed (bool): Whether 'aclose()' was called.
     """
 
     def __init__(
@@ -23,7 +65,13 @@ class SkaleManager:
         *,
         providers: list[APIProvider] = None,
         proxies: ProxyPool = None,
-        requester=None
+        requester=None,
+        transport: TransportConfig = None,
+        serializer: Serializer = None,
+        backend=None,
+        breakers: CircuitBreakerRegistry = None,
+        latency_aware: bool = False,
+        exploration: float = 0.1
     ) -> None:
         """
         Initializes the SkaleManager with providers, optional proxies,
@@ -33,12 +81,53 @@ class SkaleManager:
             providers (List[APIProvider]): List of API provider instances.
             proxies (ProxyPool, optional): ProxyPool instance to rotate proxies.
             requester (Requester, optional): Custom requester.
-                Defaults to 'Requester()'.
+                Defaults to 'Requester(transport, serializer)'.
+            transport (TransportConfig, optional): Connection settings for
+                the default requester (HTTP/2, pool limits, timeouts,
+                retries). Ignored when a custom requester is given.
+            serializer (Serializer, optional): JSON serializer for the
+                default requester. Defaults to the fastest one installed.
+            backend (BaseBackend, optional): Backend for providers created
+                without one, e.g. a RedisBackend to share quota across
+                processes. Defaults to an InMemoryBackend of this manager,
+                so separate managers never share quota or blocks.
+            breakers (CircuitBreakerRegistry, optional): Per-host circuit
+                breakers. Defaults to 'CircuitBreakerRegistry()'.
+            latency_aware (bool): Prefer the faster of each two providers
+                and of two proxies for each provider, instead of strictly
+                following the rotation. Quotas are still respected.
+                Default is False. Routed requests always weigh latency.
+            exploration (float): Probability of ignoring latency for a
+                request. Default is 0.1.
         """
 
-        self.providers = providers or [DummyProvider()]
-        self.requester = requester or Requester()
-        self.proxies = proxies or []
+        self.backend = backend or InMemoryBackend()
+        providers = providers or [DummyProvider()]
+        for provider in providers:
+            self._bind(provider)
+        self._providers = Rotation(providers, key=attrgetter("name"))
+        self.requester = requester or Requester(transport, serializer)
+        self.proxies = proxies
+        self.breakers = breakers or CircuitBreakerRegistry()
+        self.latency = LatencyTracker()
+        self.latency_aware = latency_aware
+        self.exploration = exploration
+        # Keyed by ("provider", provider object) or ("proxy", url), so a
+        # replaced provider drains separately from its replacement
+        self._inflight = {}  # key -> count
+        self._idle = {}  # key -> asyncio.Event
+        self._closing = set()  # Tasks closing clients of removed proxies
+        self._capacity = None  # asyncio.Event set when quota may be free
+        self._polling = set()  # Routes a waiter is polling quota for
+        self._services = set()  # Pipelines, probers and watchers to stop
+        self.closed = False
+
+    @property
+    def providers(self) -> list[APIProvider]:
+        """
+        Returns the providers currently in rotation.
+        """
+        return list(self._providers)
 
     async def send_request(
         self,
@@ -46,19 +135,55 @@ class SkaleManager:
         url: str,
         headers=None,
         data=None,
-        timeout=10
+        content: bytes = None,
+        timeout=None,
+        deadline: Deadline | float = None,
+        retries: int = 0,
+        capability: str = None
     ) -> httpx.Response:
         """
-        Sends an HTTP request using the first available provider.
-        Will rotate through providers and proxies if necessary.
+        Sends an HTTP request using the next available provider in the
+        weighted rotation. Will rotate through providers and proxies if
+        necessary.
+
+        A request to a path instead of a full URL is a logical request,
+        routed to any provider with a 'base_url' (and the capability, if
+        given). Capable providers are tried cheapest first, adjusted for
+        their observed latency and the share of quota they have left, so
+        load spreads across vendors as keys fill up. Each provider's
+        adapter rewrites the request for its API, and its own auth scheme
+        is applied.
+
+        Requests to a host whose circuit breaker is open fail fast before
+        any provider is selected. Host-side failures (connection errors,
+        timeouts, 5xx responses) count against the host's breaker instead
+        of blocking the provider; proxy errors block the proxy.
+
+        A provider's quota is reserved before the request is sent and given
+        back if no response arrives, including when the caller cancels.
+
+        With a deadline, the request waits for a provider to become
+        available instead of failing, and whatever step is running when
+        the deadline passes (waiting, a retry, the HTTP call) is cancelled.
 
         Args:
             method (str): HTTP method (e.g., 'GET', 'POST').
-            url (str): Target URL for the request.
-            headers (dict, optional): Custom headers to include.
+            url (str): Target URL for the request, or a path such as
+                '/v1/chat/completions' to route it.
+            headers (dict, optional): Custom headers to include. The dict is
+                never modified; provider auth headers are merged into a copy.
             data (dict, optional): JSON-serializable data to send in the
                 request body.
-            timeout (int): Timeout in seconds for the request.
+            content (bytes, optional): Pre-serialized request body, sent
+                as-is instead of 'data'.
+            timeout (float, optional): Timeout in seconds for each attempt.
+                Defaults to the requester's transport timeouts.
+            deadline (Deadline or float, optional): Overall deadline, or
+                seconds from now, covering every attempt and wait.
+            retries (int): Further attempts, each on the next provider,
+                after a failed one. Default is 0.
+            capability (str, optional): Only use providers that list this
+                capability.
 
         Returns:
             httpx.Response: The HTTP response from the API.
@@ -66,33 +191,834 @@ class SkaleManager:
         Raises:
             RequestFailed: If the request fails due to a connection or API error
             NoAvailableProviders: If all providers are blocked or rate-limited.
+            CircuitOpen: If the target host's circuit breaker is open.
+            DeadlineExceeded: If the deadline passes first.
+            TypeError: If 'data' cannot be serialized.
+            RuntimeError: If the manager is closed.
         """
+        if self.closed:
+            raise RuntimeError("manager is closed")
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = Deadline(deadline)
 
-        for provider in self.providers:
-            if await provider.is_available():
-                try:
-                    headers = headers or {}
-                    headers["Authorization"] = f"Bearer {provider.key}"
-                    proxy = self.proxies.get_next() if self.proxies else None
-                    response = await self.requester.send(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        json=data,
-                        proxy=proxy,
-                        timeout=timeout
+        attempt_once = self._attempter(
+            method, url, headers, data, content, timeout, capability
+        )
+        attempt = 0
+        while True:
+            try:
+                if deadline is None:
+                    return await attempt_once()
+                return await deadline.run(attempt_once())
+            except NoAvailableProviders:
+                if deadline is None:
+                    raise
+                await self.wait_for_provider(deadline, url, capability)
+            except RequestFailed:
+                if attempt >= retries or (
+                    deadline is not None and deadline.expired
+                ):
+                    raise
+                attempt += 1
+
+    def _attempter(
+        self,
+        method: str,
+        url: str,
+        headers,
+        data,
+        content: bytes,
+        timeout,
+        capability: str = None
+    ):
+        """
+        Returns a callable making one attempt at a request: '_route()' for
+        a path, '_attempt()' for a full URL.
+
+        Raises:
+            TypeError: If 'data' for a full URL cannot be serialized.
+        """
+        if _is_path(url):
+            # Bodies depend on each provider's adapter; they are encoded per
+            # adapter, still before any quota is reserved
+            prepared = {}  # adapter -> (path, headers, content)
+            return partial(
+                self._route, method, url, headers, data, content, timeout,
+                capability, prepared
+            )
+
+        # Encode once, before any provider is picked, so a payload that
+        # cannot be serialized reaches the caller instead of failing (and
+        # blocking) a provider on every attempt
+        if content is None and data is not None:
+            content, headers = self.requester.encode_json(data, headers)
+        return partial(
+            self._attempt, method, url, headers, content, timeout, capability
+        )
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        headers,
+        content: bytes,
+        timeout,
+        capability: str = None
+    ) -> httpx.Response:
+        """
+        Makes a single attempt at a request on the first available
+        provider. See 'send_request()'.
+        """
+        breaker = self.breakers.get(url)
+        if not breaker.allow_request():
+            raise CircuitOpen(breaker.host)
+        # While half-open only the single probe is admitted
+        probe = breaker.state == breaker.HALF_OPEN
+
+        try:
+            for provider in self._candidates():
+                if not _serves(provider, False, capability):
+                    continue
+                if await provider.is_available():
+                    # is_available() is only a cheap pre-check; the atomic
+                    # reservation decides, as another request may have
+                    # taken the last unit of quota in the meantime
+                    if await provider.record_usage() is False:
+                        continue
+                    self._providers.commit(provider)
+                    # _send() owns the probe from here
+                    owned, probe = probe, False
+                    return await self._send(
+                        provider, breaker, owned, method, url, headers,
+                        content, timeout
                     )
 
-                    await provider.record_usage()
-                    return response
-                except Exception as e:
-                    await provider.block()
-                    raise RequestFailed(
-                        provider_name=provider.name,
-                    ) from e
+            raise NoAvailableProviders
+        finally:
+            if probe:
+                # The probe ended without a verdict on the host
+                breaker.release()
 
+    async def _route(
+        self,
+        method: str,
+        path: str,
+        headers,
+        data,
+        content: bytes,
+        timeout,
+        capability: str,
+        prepared: dict
+    ) -> httpx.Response:
+        """
+        Makes a single attempt at a logical request on the best capable
+        provider. See 'send_request()'.
+        """
+        circuit = None
+        explore = self._explore()
+        for sample in self._samples(capability):
+            for provider in await self._rank(sample, explore):
+                path_, headers_, content_ = self._prepare(
+                    provider.adapter, path, headers, data, content, prepared
+                )
+                url = _join(provider.base_url, path_)
+                breaker = self.breakers.get(url)
+                if not breaker.allow_request():
+                    circuit = breaker.host
+                    continue
+                probe = breaker.state == breaker.HALF_OPEN
+
+                try:
+                    if await provider.record_usage() is False:
+                        continue
+                    self._providers.commit(provider)
+                    # _send() owns the probe from here
+                    owned, probe = probe, False
+                    return await self._send(
+                        provider, breaker, owned, method, url, headers_,
+                        content_, timeout
+                    )
+                finally:
+                    if probe:
+                        # The probe ended without a verdict on the host
+                        breaker.release()
+
+        if circuit is not None:
+            raise CircuitOpen(circuit)
         raise NoAvailableProviders
 
+    def _samples(self, capability: str = None):
+        """
+        Yields the providers able to serve a logical request in rotation
+        order, ROUTE_SAMPLE at a time.
+
+        Routing ranks one sample and only moves on to the next if no
+        provider in it can take the request, so a request costs a few
+        quota lookups however large the fleet is. The rotation moves with
+        every routed request, so successive requests sample different
+        providers.
+        """
+        sample = []
+        for provider in self._providers.candidates():
+            if not _serves(provider, True, capability):
+                continue
+            sample.append(provider)
+            if len(sample) == ROUTE_SAMPLE:
+                yield sample
+                sample = []
+        if sample:
+            yield sample
+
+    async def _rank(self, providers: list, explore: bool = False) -> list:
+        """
+        Returns the providers of a sample that have quota left, best first.
+
+        Providers are scored by cost times expected latency, divided by
+        the share of quota they have left. Providers without latency
+        samples are assumed as fast as the fastest known one, so they get
+        tried, and exploring requests ignore latency altogether. Equal
+        scores keep the rotation order.
+        """
+        headrooms = await asyncio.gather(
+            *(provider.headroom() for provider in providers)
+        )
+        scored = [
+            (provider, headroom,
+             None if explore else self.latency.average(provider.name))
+            for provider, headroom in zip(providers, headrooms)
+            if headroom > 0
+        ]
+
+        known = [latency for _, _, latency in scored if latency is not None]
+        fastest = min(known, default=1.0)
+        ranked = [
+            (provider.cost * (fastest if latency is None else latency)
+             / headroom, provider)
+            for provider, headroom, latency in scored
+        ]
+        ranked.sort(key=itemgetter(0))
+        return [provider for _, provider in ranked]
+
+    def _prepare(
+        self,
+        adapter,
+        path: str,
+        headers,
+        data,
+        content: bytes,
+        prepared: dict
+    ) -> tuple:
+        """
+        Adapts and encodes a logical request once per adapter.
+
+        Raises:
+            TypeError: If the adapted payload cannot be serialized.
+        """
+        request = prepared.get(adapter)
+        if request is None:
+            path, headers, data = adapter.adapt(path, headers, data)
+            if data is not None:
+                content, headers = self.requester.encode_json(data, headers)
+            request = prepared[adapter] = (path, headers, content)
+        return request
+
+    async def _send(
+        self,
+        provider,
+        breaker,
+        probe: bool,
+        method: str,
+        url: str,
+        headers,
+        content: bytes,
+        timeout
+    ) -> httpx.Response:
+        """
+        Sends a request on a provider whose quota is already reserved,
+        recording the outcome on the provider, the proxy and the host's
+        breaker. The quota is given back if no response arrives.
+
+        Args:
+            probe (bool): Whether this request is the breaker's half-open
+                probe. It is released if the request ends without a
+                verdict on the host.
+        """
+        proxy = None
+        response = None
+        start = time.perf_counter()
+        try:
+            if self.proxies is not None:
+                proxy = self._pick_proxy(provider)
+            start = time.perf_counter()
+            response = await self._dispatch(
+                provider, proxy, method, url, headers, content, timeout
+            )
+        except Exception as e:
+            # _failure() settles the probe
+            owned, probe = probe, False
+            raise await self._failure(
+                provider, breaker, owned, proxy, start, e
+            ) from e
+        else:
+            self._observe(provider, proxy, start)
+            if response.status_code >= 500:
+                breaker.record_failure(probe)
+            else:
+                breaker.record_success(probe)
+            probe = False
+        finally:
+            if response is None:
+                await provider.release_usage()
+                self._notify_capacity()
+            if probe:
+                # Cancelled: the probe ended without a verdict on the host
+                breaker.release()
+
+        await provider.observe(response)
+        return response
+
+    async def _dispatch(
+        self,
+        provider,
+        proxy: str,
+        method: str,
+        url: str,
+        headers,
+        content: bytes,
+        timeout
+    ) -> httpx.Response:
+        """
+        Hands a request to the requester with the provider's auth, counting
+        it as in flight on the provider and proxy while it runs.
+        """
+        keys = [("provider", provider)]
+        if proxy:
+            keys.append(("proxy", proxy))
+        for key in keys:
+            self._enter(key)
+        try:
+            return await self.requester.send(
+                method=method,
+                url=url,
+                headers=merge(headers, provider.auth_headers),
+                params=provider.auth_params or None,
+                json=None,
+                content=content,
+                proxy=proxy,
+                timeout=timeout
+            )
+        finally:
+            for key in keys:
+                self._leave(key)
+
+    async def _failure(
+        self,
+        provider,
+        breaker,
+        probe: bool,
+        proxy: str,
+        start: float,
+        error: Exception
+    ) -> RequestFailed:
+        """
+        Records a failed request against whatever caused it and returns
+        the error to raise: proxy errors block the proxy, host-side errors
+        count against the host's breaker, anything else blocks the
+        provider.
+
+        Args:
+            probe (bool): Whether the request was the breaker's half-open
+                probe. Host-side errors count it as failed; otherwise it is
+                released.
+        """
+        if isinstance(error, httpx.TransportError) and not isinstance(
+            error, httpx.ProxyError
+        ):
+            if isinstance(error, httpx.TimeoutException):
+                # A timeout says as much about speed as a response
+                self._observe(provider, proxy, start)
+            breaker.record_failure(probe)
+            return RequestFailed(
+                provider_name=provider.name,
+                reason=f"host error: {error!r}"
+            )
+
+        if probe:
+            breaker.release()
+        if isinstance(error, httpx.ProxyError):
+            if proxy:
+                self.proxies.block(proxy)
+            return RequestFailed(
+                provider_name=provider.name,
+                reason=f"proxy error: {error}"
+            )
+        await provider.block()
+        return RequestFailed(provider_name=provider.name)
+
+    def _explore(self) -> bool:
+        """
+        Decides whether the current request ignores latency.
+        """
+        return random.random() < self.exploration
+
+    def _candidates(self):
+        """
+        Returns the providers to try for a full-URL request, in order:
+        the rotation order, or, when latency-aware, the rotation taken two
+        at a time with the faster of each pair first.
+        """
+        candidates = self._providers.candidates()
+        if not self.latency_aware or self._explore():
+            return candidates
+        return self._two_choices(candidates)
+
+    def _two_choices(self, candidates):
+        """
+        Yields candidates in pairs, the one that has been faster first
+        ("power of two choices"). Slow providers lose most of their
+        traffic without the fleet being sorted, and still serve when their
+        pair cannot. Providers without latency samples count as fastest,
+        so they get measured.
+        """
+        average = self.latency.average
+        for first in candidates:
+            second = next(candidates, None)
+            if second is None:
+                yield first
+                return
+            if (average(second.name) or 0.0) < (average(first.name) or 0.0):
+                first, second = second, first
+            yield first
+            yield second
+
+    def _pick_proxy(self, provider) -> str | None:
+        """
+        Returns the proxy for a request. When latency-aware, two proxies
+        are drawn from the rotation and the one that has been faster for
+        this provider is used ("power of two choices"), so slow pairs
+        lose traffic while the rotation keeps every proxy in play.
+        """
+        proxy = self.proxies.get_next()
+        if proxy is None or not self.latency_aware or self._explore():
+            return proxy
+
+        other = self.proxies.get_next()
+        if other is None or other == proxy:
+            return proxy
+        average = self.latency.average
+        mine = average((provider.name, proxy))
+        theirs = average((provider.name, other))
+        if mine is None or theirs is None:
+            # Unmeasured pairs go first
+            return proxy if mine is None else other
+        return proxy if mine <= theirs else other
+
+    def _observe(self, provider, proxy: str, start: float) -> None:
+        """
+        Records a request's latency for its provider and provider/proxy
+        pair.
+        """
+        elapsed = time.perf_counter() - start
+        self.latency.observe(provider.name, elapsed)
+        if proxy:
+            self.latency.observe((provider.name, proxy), elapsed)
+
+    async def wait_for_provider(
+        self,
+        deadline: Deadline = None,
+        url: str = None,
+        capability: str = None
+    ) -> None:
+        """
+        Waits until at least one provider is available, among those able
+        to serve 'url' and 'capability' if given.
+
+        Any number of tasks can wait at once at the cost of one: a single
+        waiter polls the providers for quota freed by time passing, and
+        wakes the others when it finds some. Quota given back by failed
+        or cancelled requests, and newly added providers, wake the waiters
+        immediately.
+
+        Args:
+            deadline (Deadline, optional): Stop waiting when it passes.
+            url (str, optional): The request's URL. A path only counts
+                providers with a base URL.
+            capability (str, optional): Only count providers that list it.
+
+        Raises:
+            DeadlineExceeded: If the deadline passes first.
+            NoAvailableProviders: If no provider can serve the request at
+                all, e.g. none has the capability, as waiting would never
+                end.
+        """
+        # Waiters for different routes each need a poller of their own
+        route = (url is not None and _is_path(url), capability)
+        routed, capability = route
+        if not any(
+            _serves(provider, routed, capability)
+            for provider in self._providers
+        ):
+            raise NoAvailableProviders("No provider can serve the request.")
+        while not await self._has_capacity(route):
+            event = self._capacity_event()
+            if route in self._polling:
+                await self._wait_event(event, deadline)
+                continue
+
+            self._polling.add(route)
+            try:
+                while not await self._has_capacity(route):
+                    await self._wait_event(event, deadline, WAIT_INTERVAL)
+                    event = self._capacity_event()
+            finally:
+                self._polling.discard(route)
+                # Wake the other waiters, to take the quota or to take over
+                # polling if this waiter gave up
+                self._notify_capacity()
+            return
+
+    async def _has_capacity(self, route: tuple = (False, None)) -> bool:
+        """
+        Checks whether any provider serving a route is available.
+        """
+        routed, capability = route
+        for provider in self.providers:
+            if not _serves(provider, routed, capability):
+                continue
+            if await provider.is_available():
+                return True
+        return False
+
+    def _capacity_event(self) -> asyncio.Event:
+        """
+        Returns the event the next '_notify_capacity()' will set.
+        """
+        if self._capacity is None:
+            self._capacity = asyncio.Event()
+        return self._capacity
+
+    def _notify_capacity(self) -> None:
+        """
+        Wakes every task waiting for a provider. Each notification uses a
+        fresh event, so woken tasks that find no quota wait for the next
+        one instead of spinning.
+        """
+        event, self._capacity = self._capacity, None
+        if event is not None:
+            event.set()
+
+    @staticmethod
+    async def _wait_event(
+        event: asyncio.Event,
+        deadline: Deadline = None,
+        limit: float = None
+    ) -> None:
+        """
+        Waits for an event for at most 'limit' seconds and never past the
+        deadline.
+        """
+        timeout = limit if deadline is None else deadline.timeout(limit)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        if deadline is not None:
+            deadline.check()
+
+    def add_provider(
+        self,
+        provider: APIProvider,
+        weight: int = 1
+    ) -> APIProvider | None:
+        """
+        Adds a provider to the rotation, replacing any provider with the
+        same name. Requests already running on a replaced provider are not
+        affected; use 'replace_provider()' to wait for them.
+
+        Args:
+            provider (APIProvider): The provider to add.
+            weight (int): Consecutive picks the provider gets per rotation.
+                Default is 1.
+
+        Returns:
+            APIProvider | None: The replaced provider, if any.
+        """
+        replaced = self._providers.get(provider.name)
+        self._bind(provider)
+        self._providers.add(provider, weight)
+        self._notify_capacity()
+        return replaced
+
+    async def replace_provider(
+        self,
+        provider: APIProvider,
+        weight: int = 1,
+        drain: bool = True,
+        timeout: float = None
+    ) -> APIProvider | None:
+        """
+        Swaps in a provider for the one with the same name, or adds it.
+        New requests use the new provider right away.
+
+        Args:
+            provider (APIProvider): The new provider.
+            weight (int): Consecutive picks the provider gets per rotation.
+                Default is 1.
+            drain (bool): Wait for requests still running on the replaced
+                provider before returning. Default is True.
+            timeout (float, optional): Maximum seconds to wait for draining.
+
+        Returns:
+            APIProvider | None: The replaced provider, if any.
+
+        Raises:
+            asyncio.TimeoutError: If draining exceeds the timeout.
+        """
+        replaced = self.add_provider(provider, weight)
+        if drain and replaced is not None and replaced is not provider:
+            await self._wait_idle(("provider", replaced), timeout)
+        return replaced
+
+    def _bind(self, provider) -> None:
+        """
+        Gives a provider created without a backend this manager's backend.
+        """
+        bind = getattr(provider, "bind_backend", None)
+        if bind is not None:
+            bind(self.backend)
+
+    def get_provider(self, name: str) -> APIProvider | None:
+        """
+        Returns the provider with the given name, or None.
+        """
+        return self._providers.get(name)
+
+    async def remove_provider(
+        self,
+        name: str,
+        drain: bool = True,
+        timeout: float = None
+    ) -> APIProvider:
+        """
+        Removes a provider from the rotation. No new requests use it once
+        this is called.
+
+        Args:
+            name (str): Name of the provider to remove.
+            drain (bool): Wait for the provider's in-flight requests to
+                finish before returning. Default is True.
+            timeout (float, optional): Maximum seconds to wait for draining.
+
+        Returns:
+            APIProvider: The removed provider.
+
+        Raises:
+            KeyError: If no provider has that name.
+            asyncio.TimeoutError: If draining exceeds the timeout.
+        """
+        provider = self._providers.remove(name)
+        self.latency.forget_provider(name)
+        if drain:
+            await self._wait_idle(("provider", provider), timeout)
+        return provider
+
+    def reweight_provider(self, name: str, weight: int) -> None:
+        """
+        Changes how many consecutive picks a provider gets per rotation.
+
+        Args:
+            name (str): Name of the provider.
+            weight (int): The new weight, at least 1.
+        """
+        self._providers.reweight(name, weight)
+
+    def add_proxy(self, proxy: str, weight: int = 1) -> None:
+        """
+        Adds a proxy to the pool, creating the pool if there is none.
+
+        Args:
+            proxy (str): The proxy URL.
+            weight (int): Consecutive picks the proxy gets per rotation.
+                Default is 1.
+        """
+        if self.proxies is None:
+            self.proxies = ProxyPool([])
+        self.proxies.add(proxy, weight)
+
+    async def remove_proxy(
+        self,
+        proxy: str,
+        drain: bool = True,
+        timeout: float = None
+    ) -> None:
+        """
+        Removes a proxy from the pool and closes its connections once the
+        requests using it have finished.
+
+        Args:
+            proxy (str): The proxy URL.
+            drain (bool): Wait for in-flight requests through the proxy
+                before returning. Otherwise its connections are closed in
+                the background once it is idle. Default is True.
+            timeout (float, optional): Maximum seconds to wait for draining.
+                The connections are closed even if draining times out.
+
+        Raises:
+            KeyError: If the proxy is not in the pool.
+            asyncio.TimeoutError: If draining exceeds the timeout.
+        """
+        if self.proxies is None:
+            raise KeyError(proxy)
+        self.proxies.remove(proxy)
+        if not drain:
+            task = asyncio.get_running_loop().create_task(
+                self._close_proxy(proxy)
+            )
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+            return
+
+        try:
+            await self._wait_idle(("proxy", proxy), timeout)
+        finally:
+            if proxy not in self.proxies:
+                await self.requester.close_proxy(proxy)
+
+    def reweight_proxy(self, proxy: str, weight: int) -> None:
+        """
+        Changes how many consecutive picks a proxy gets per rotation.
+
+        Args:
+            proxy (str): The proxy URL.
+            weight (int): The new weight, at least 1.
+
+        Raises:
+            KeyError: If the proxy is not in the pool.
+        """
+        if self.proxies is None:
+            raise KeyError(proxy)
+        self.proxies.reweight(proxy, weight)
+
+    async def _close_proxy(self, proxy: str) -> None:
+        """
+        Closes a removed proxy's connections once it is idle, unless it
+        was added back in the meantime.
+        """
+        await self._wait_idle(("proxy", proxy))
+        if self.proxies is None or proxy not in self.proxies:
+            await self.requester.close_proxy(proxy)
+
+    def _enter(self, key: tuple) -> None:
+        """
+        Counts a request starting on a provider or proxy.
+        """
+        self._inflight[key] = self._inflight.get(key, 0) + 1
+
+    def _leave(self, key: tuple) -> None:
+        """
+        Counts a request finishing on a provider or proxy, waking up a
+        drain waiting for it to become idle.
+        """
+        count = self._inflight[key] - 1
+        if count:
+            self._inflight[key] = count
+            return
+
+        del self._inflight[key]
+        event = self._idle.pop(key, None)
+        if event is not None:
+            event.set()
+
+    async def _wait_idle(self, key: tuple, timeout: float = None) -> None:
+        """
+        Waits until no request is in flight on a provider or proxy.
+        """
+        if key not in self._inflight:
+            return
+        event = self._idle.setdefault(key, asyncio.Event())
+        await asyncio.wait_for(event.wait(), timeout)
+
+    def attach(self, service) -> None:
+        """
+        Registers a background service, such as a RequestPipeline,
+        ProxyProber or ConfigWatcher, to be shut down with the manager.
+        Services attach themselves when started.
+
+        Args:
+            service: An object with an async 'aclose()' method.
+        """
+        self._services.add(service)
+
+    def detach(self, service) -> None:
+        """
+        Unregisters a service, e.g. once it was stopped on its own.
+
+        Args:
+            service: A service passed to 'attach()'.
+        """
+        self._services.discard(service)
+
+    async def aclose(self) -> None:
+        """
+        Shuts the manager down and releases everything it holds:
+
+        - attached services are closed (pipelines drop their queued
+          requests; stop them first to finish those);
+        - background tasks closing removed proxies are cancelled;
+        - the requester is closed, with its direct and proxy clients;
+        - provider backends that hold connections, such as RedisBackend,
+          are closed.
+
+        New requests raise RuntimeError. Requests still in flight are not
+        waited for. Safe to call more than once.
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        services, self._services = list(self._services), set()
+        await asyncio.gather(
+            *(service.aclose() for service in services),
+            return_exceptions=True
+        )
+
+        tasks = list(self._closing)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            await self.requester.aclose()
+        finally:
+            backends = {id(self.backend): self.backend}
+            for provider in self.providers:
+                backend = getattr(provider, "backend", None)
+                if backend is not None:
+                    backends[id(backend)] = backend
+            for backend in backends.values():
+                close = getattr(backend, "aclose", None)
+                if close is not None:
+                    await close()
+
+    async def __aenter__(self) -> "SkaleManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def decode(self, response: httpx.Response, type=None):
+        """
+        Decodes a JSON response with the requester's serializer.
+
+        Args:
+            response (httpx.Response): The response to decode.
+            type (type, optional): Class to decode into.
+
+        Returns:
+            The decoded body, or an instance of 'type'.
+        """
+        return self.requester.decode(response, type)
+
     async def _get_next_proxy(self) -> None:
         """
         Returns the next proxy in a round-robin fashion by cycling
@@ -113,3 +1039,30 @@ class SkaleManager:
         proxy = self.proxies.pop(0)
         self.proxies.append(proxy)
         return proxy
+
+
+def _is_path(url: str) -> bool:
+    """
+    Returns True for a logical request's path, False for a full URL.
+    """
+    return "://" not in url
+
+
+def _join(base_url: str, path: str) -> str:
+    """
+    Joins a provider's base URL and a request path.
+    """
+    return f"{base_url.rstrip('/')}/{path.lstrip('/')}"
+
+
+def _serves(provider, routed: bool, capability: str = None) -> bool:
+    """
+    Checks whether a provider can take a request.
+
+    Args:
+        routed (bool): The request is a path, which needs a base URL.
+        capability (str, optional): A capability the provider must list.
+    """
+    if routed and provider.base_url is None:
+        return False
+    return capability is None or capability in provider.capabilities
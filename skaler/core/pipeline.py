@@ -0,0 +1,264 @@
+import asyncio
+import inspect
+from collections import deque
+
+from ..exceptions import NoAvailableProviders
+
+
+class PipelineResult:
+    """
+    The outcome of one request sent through a RequestPipeline.
+
+    Attributes:
+        tag: The value given to 'put()' to correlate results with their
+            source, such as a stream offset.
+        response (httpx.Response or None): The response, if the request
+            succeeded.
+        error (Exception or None): The exception raised by the request,
+            if it failed.
+    """
+
+    def __init__(self, tag, response=None, error=None) -> None:
+        self.tag = tag
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns True if the request produced a response.
+        """
+        return self.error is None
+
+
+class RequestPipeline:
+    """
+    A bounded producer/consumer queue feeding requests to a SkaleManager.
+
+    Producers 'put()' request specs and worker tasks send them. Workers
+    only take a request from the queue once a provider has quota for it,
+    so requests are paced at the providers' aggregate rate instead of
+    failing with NoAvailableProviders. When the request queue is full,
+    'put()' blocks; when results are not consumed fast enough, workers
+    block. Backpressure therefore reaches the producers end to end.
+
+    Results are delivered to 'on_result' if given, otherwise they are read
+    by iterating over the pipeline:
+
+        pipeline = RequestPipeline(manager, workers=20)
+        pipeline.start()
+        await pipeline.put("POST", url, data=payload, tag=offset)
+        async for result in pipeline:
+            ...
+
+    Once 'stop()' is called the result buffer is no longer bounded, so
+    stopping never waits on a consumer; the remaining results can still
+    be iterated over afterwards.
+
+    Attributes:
+        manager (SkaleManager): The manager sending the requests.
+        workers (int): Number of worker tasks.
+        maxsize (int): Capacity of the request queue and result buffer.
+        on_result (Callable, optional): Called, or awaited if it is a
+            coroutine function, with each PipelineResult. Exceptions it
+            raises are passed to the event loop's exception handler.
+        _requests (Deque[tuple]): Pending request specs.
+        _results (Deque[PipelineResult]): Results waiting to be iterated
+            over.
+        _unfinished (int): Requests put but not yet delivered.
+    """
+
+    def __init__(
+        self,
+        manager,
+        workers: int = 10,
+        maxsize: int = 1000,
+        on_result=None
+    ) -> None:
+        """
+        Initializes the pipeline. Call 'start()' to start the workers.
+
+        Args:
+            manager (SkaleManager): The manager sending the requests.
+            workers (int): Number of worker tasks, i.e. the maximum number
+                of requests in flight. Default is 10.
+            maxsize (int): Capacity of the request queue and result
+                buffer. Default is 1000.
+            on_result (Callable, optional): Receives each result instead
+                of the iterator.
+        """
+        self.manager = manager
+        self.workers = workers
+        self.maxsize = maxsize
+        self.on_result = on_result
+        self._requests = deque()
+        self._results = deque()
+        self._unfinished = 0
+        self._closed = False  # No more puts; results no longer bounded
+        self._finished = False  # Workers gone; iteration can end
+        self._tasks = []
+
+        lock = asyncio.Lock()
+        self._lock = lock
+        self._not_full = asyncio.Condition(lock)
+        self._not_empty = asyncio.Condition(lock)
+        self._results_not_full = asyncio.Condition(lock)
+        self._results_ready = asyncio.Condition(lock)
+        self._idle = asyncio.Condition(lock)
+
+    async def put(self, method: str, url: str, *, tag=None, **kwargs) -> None:
+        """
+        Enqueues a request, waiting while the queue is full.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Target URL.
+            tag (optional): Returned unchanged on the request's result.
+            **kwargs: Further arguments for 'SkaleManager.send_request()'.
+
+        Raises:
+            RuntimeError: If the pipeline is stopped, including while
+                waiting for room in the queue.
+        """
+        async with self._lock:
+            await self._not_full.wait_for(
+                lambda: self._closed or len(self._requests) < self.maxsize
+            )
+            if self._closed:
+                raise RuntimeError("pipeline is stopped")
+            self._requests.append((tag, method, url, kwargs))
+            self._unfinished += 1
+            self._not_empty.notify()
+
+    def start(self) -> None:
+        """
+        Starts the worker tasks.
+        """
+        loop = asyncio.get_running_loop()
+        while len(self._tasks) < self.workers:
+            self._tasks.append(loop.create_task(self._work()))
+        self.manager.attach(self)
+
+    async def join(self) -> None:
+        """
+        Waits until every enqueued request has a result delivered.
+        """
+        async with self._lock:
+            await self._idle.wait_for(lambda: not self._unfinished)
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stops accepting requests and shuts the workers down. Producers
+        waiting in 'put()' get a RuntimeError. Iteration ends once the
+        remaining results have been read.
+
+        Args:
+            drain (bool): Finish the requests already enqueued first.
+                Otherwise they are dropped and in-flight requests are
+                cancelled. Default is True.
+        """
+        self.manager.detach(self)
+        async with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._results_not_full.notify_all()
+            if not drain:
+                self._unfinished -= len(self._requests)
+                self._requests.clear()
+
+        if drain:
+            await self.join()
+
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        async with self._lock:
+            self._finished = True
+            self._results_ready.notify_all()
+            self._idle.notify_all()
+
+    async def aclose(self) -> None:
+        """
+        Stops the pipeline without draining; called when the manager is
+        closed.
+        """
+        await self.stop(drain=False)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> PipelineResult:
+        async with self._lock:
+            await self._results_ready.wait_for(
+                lambda: self._results or self._finished
+            )
+            if not self._results:
+                raise StopAsyncIteration
+            self._results_not_full.notify()
+            return self._results.popleft()
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                await self.manager.wait_for_provider()
+            except NoAvailableProviders:
+                pass  # No providers at all; requests fail with a result
+            async with self._lock:
+                await self._not_empty.wait_for(lambda: self._requests)
+                tag, method, url, kwargs = self._requests.popleft()
+                self._not_full.notify()
+
+            try:
+                result = await self._send(tag, method, url, kwargs)
+                await self._deliver(result)
+            finally:
+                async with self._lock:
+                    self._unfinished -= 1
+                    if not self._unfinished:
+                        self._idle.notify_all()
+
+    async def _send(self, tag, method: str, url: str, kwargs: dict):
+        while True:
+            try:
+                response = await self.manager.send_request(
+                    method, url, **kwargs
+                )
+            except NoAvailableProviders:
+                # Another worker took the last slot; wait for the next one
+                # this request can use
+                try:
+                    await self.manager.wait_for_provider(
+                        url=url, capability=kwargs.get("capability")
+                    )
+                except NoAvailableProviders as e:
+                    # No provider can serve it at all
+                    return PipelineResult(tag, error=e)
+            except Exception as e:
+                return PipelineResult(tag, error=e)
+            else:
+                return PipelineResult(tag, response=response)
+
+    async def _deliver(self, result: PipelineResult) -> None:
+        if self.on_result is not None:
+            try:
+                if inspect.iscoroutinefunction(self.on_result):
+                    await self.on_result(result)
+                else:
+                    self.on_result(result)
+            except Exception as e:
+                # Keep the worker alive; report like a failed callback
+                asyncio.get_running_loop().call_exception_handler({
+                    "message": "RequestPipeline on_result callback failed",
+                    "exception": e,
+                    "pipeline": self,
+                })
+            return
+
+        async with self._lock:
+            await self._results_not_full.wait_for(
+                lambda: self._closed or len(self._results) < self.maxsize
+            )
+            self._results.append(result)
+            self._results_ready.notify()
@@ -1,7 +1,19 @@
+from skaler.core.providers.adapter import RequestAdapter
 from skaler.core.providers.api_provider import APIProvider
+from skaler.core.providers.auth import (
+    AuthScheme,
+    BearerAuth,
+    HeaderAuth,
+    QueryParamAuth,
+)
 from skaler.core.providers.dummy_provider import DummyProvider
 
 __all__ = [
     "APIProvider",
-    "DummyProvider"
+    "AuthScheme",
+    "BearerAuth",
+    "DummyProvider",
+    "HeaderAuth",
+    "QueryParamAuth",
+    "RequestAdapter"
 ]
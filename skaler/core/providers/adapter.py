@@ -0,0 +1,32 @@
+class RequestAdapter:
+    """
+    Translates a logical request into a provider's own API format.
+
+    Requests sent to a path rather than a full URL are routed to any
+    capable provider, and each provider's adapter rewrites the path,
+    headers and payload for its API before the body is serialized, e.g.
+    an OpenAI-style chat payload into Anthropic's messages format.
+    Providers sharing an adapter share one encoded body per request.
+
+    The base class passes requests through unchanged.
+    """
+
+    def adapt(self, path: str, headers, data) -> tuple:
+        """
+        Rewrites a logical request for the provider's API.
+
+        Args:
+            path (str): Path of the request, joined to the provider's
+                base URL.
+            headers (Mapping, optional): Caller supplied headers. Must not
+                be modified; return a new mapping instead.
+            data (optional): JSON-serializable payload, or None when the
+                caller sent a pre-serialized body.
+
+        Returns:
+            tuple: The path, headers and payload to send.
+        """
+        return path, headers, data
+
+
+DEFAULT_ADAPTER = RequestAdapter()
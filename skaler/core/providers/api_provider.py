@@ -1,4 +1,11 @@
 from ...backend import InMemoryBackend
+from ..rate_limit import AdaptiveLimit, RateLimitInfo
+from .adapter import DEFAULT_ADAPTER, RequestAdapter
+from .auth import AuthScheme, BearerAuth
+
+WINDOW = 60
+
+DEFAULT_AUTH = BearerAuth()
 
 
 class APIProvider:
@@ -11,14 +18,54 @@ class APIProvider:
         name (str): A unique identifier for this provider.
         key (str): The actual API key string to be used in requests.
         limit (int): The maximum number of requests allowed per minute.
-        backedn (BaseBackend): Backend used for tracking usage and block state.
+            Follows 'limiter' when the provider is adaptive.
+        limiter (AdaptiveLimit or None): Learns the real limit from
+            response headers and 429s when adaptive.
+        backend (BaseBackend): Backend used for tracking usage and block
+            state. Providers created without one use their manager's
+            backend, or a private InMemoryBackend when used on their own.
+        auth_headers (Mapping[str, str]): Pre-built, read-only headers
+            carrying the key.
+        auth_params (Mapping[str, str]): Pre-built, read-only query
+            parameters carrying the key.
+        base_url (str or None): Root URL of the provider's API. Requests
+            sent to a path are only routed to providers that have one.
+        adapter (RequestAdapter): Rewrites routed requests for the
+            provider's API.
+        capabilities (FrozenSet[str]): What the provider can serve, e.g.
+            'chat' or 'embeddings'. Requests naming a capability are only
+            routed to providers that have it.
+        cost (float): Relative price of one request. Routed requests
+            prefer cheaper providers.
     """
+    # Fleets can hold tens of thousands of providers; slots drop the
+    # per-instance __dict__
+    __slots__ = (
+        "name",
+        "key",
+        "limit",
+        "limiter",
+        "_backend",
+        "auth_headers",
+        "auth_params",
+        "base_url",
+        "adapter",
+        "capabilities",
+        "cost",
+    )
+
     def __init__(
             self,
             name: str,
             key: str,
             limit_per_minute: int,
-            backend=None
+            backend=None,
+            auth: AuthScheme = None,
+            adaptive: bool = False,
+            base_url: str = None,
+            adapter: RequestAdapter = None,
+            capabilities=(),
+            cost: float = 1.0
         ) -> None:
         """
         Initializes a new API provider instance with a rate limit
@@ -26,15 +73,62 @@ class APIProvider:
 
         Args:
             name (str): Unique name for the provider.
-            key (str): The API key string to be used in Authorization headers.
+            key (str): The API key string to be used in requests.
             limit_per_minute (int): Requests allowed per minute.
             backend (BaseBackend, optional): Custom backend.
-                    Defaults to InMemoryBackend.
+                    Defaults to the backend of the manager the provider is
+                    added to.
+            auth (AuthScheme, optional): How the key is attached to requests.
+                    Defaults to BearerAuth.
+            adaptive (bool): Learn the real limit from upstream responses,
+                    starting from 'limit_per_minute'. Default is False.
+            base_url (str, optional): Root URL of the provider's API, e.g.
+                'https://api.openai.com'. Required for routed requests.
+            adapter (RequestAdapter, optional): Rewrites routed requests.
+                    Defaults to passing them through unchanged.
+            capabilities (Iterable[str]): What the provider can serve.
+                    Default is none.
+            cost (float): Relative price of one request. Default is 1.
         """
         self.name = name
         self.key = key
         self.limit = limit_per_minute
-        self.backend = backend or InMemoryBackend()
+        self.limiter = AdaptiveLimit(limit_per_minute) if adaptive else None
+        self._backend = backend
+
+        auth = auth or DEFAULT_AUTH
+        self.auth_headers = auth.headers(key)
+        self.auth_params = auth.params(key)
+
+        self.base_url = base_url
+        self.adapter = adapter or DEFAULT_ADAPTER
+        self.capabilities = frozenset(capabilities)
+        self.cost = cost
+
+    @property
+    def backend(self):
+        """
+        Returns the backend tracking this provider's usage and blocks.
+        """
+        if self._backend is None:
+            self._backend = InMemoryBackend()
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend) -> None:
+        self._backend = backend
+
+    def bind_backend(self, backend) -> None:
+        """
+        Gives the provider a backend if it was created without one. Called
+        by the manager the provider is added to, so providers of one
+        manager share its backend while separate managers stay isolated.
+
+        Args:
+            backend (BaseBackend): The manager's backend.
+        """
+        if self._backend is None:
+            self._backend = backend
 
     async def is_available(self) -> bool:
         """
@@ -42,6 +136,9 @@ class APIProvider:
         A provider is unavailable if it is blocked
             or has exceeded its rate limit.
 
+        Usage is counted per one-minute window kept by the backend, so
+        providers sharing a backend share the same windows.
+
         Returns:
             bool: True if available, False otherwise.
         """
@@ -49,12 +146,72 @@ class APIProvider:
         usage = await self.backend.get_usage(self.name)
         return not blocked and usage < self.limit
 
-    async def record_usage(self) -> None:
+    async def headroom(self) -> float:
         """
-        Increments the usage counter for this provider.
-        Called after each successful request.
+        Returns the share of the current window's quota still free, used to
+        spread routed requests across providers.
+
+        Returns:
+            float: Between 0 and 1; 0 when blocked or out of quota.
         """
-        await self.backend.increment_usage(self.name)
+        if await self.backend.is_provider_blocked(self.name):
+            return 0.0
+        if self.limit <= 0:
+            return 0.0
+        usage = await self.backend.get_usage(self.name)
+        return max(0.0, 1.0 - usage / self.limit)
+
+    async def record_usage(self) -> bool:
+        """
+        Reserves one request of quota, right before the request is sent.
+
+        The check against the limit and the increment are a single atomic
+        backend operation, so concurrent requests, including ones from
+        other processes sharing the backend, cannot overshoot the limit.
+
+        Returns:
+            bool: True if the quota was reserved, False if the limit has
+                been reached since 'is_available()' was checked.
+        """
+        return await self.backend.try_reserve(self.name, self.limit)
+
+    async def release_usage(self) -> None:
+        """
+        Gives back the quota reserved by 'record_usage()' for a request
+        that got no response (cancelled, timed out or never sent).
+        """
+        await self.backend.decrement_usage(self.name)
+
+    async def observe(self, response) -> None:
+        """
+        Updates rate limit state from an upstream response.
+
+        A 429, or a response reporting no remaining requests, blocks the
+        provider until the advertised reset ('Retry-After' or
+        'x-ratelimit-reset'-style headers). Adaptive providers also adopt
+        advertised limits and adjust their limit AIMD-style: halved on
+        every 429, grown slowly while requests succeed.
+
+        Args:
+            response (httpx.Response): The upstream response.
+        """
+        info = RateLimitInfo.from_headers(response.headers)
+        throttled = response.status_code == 429
+
+        if self.limiter is not None:
+            if info.limit is not None:
+                self.limiter.on_advertised(info.limit)
+            if throttled:
+                self.limiter.on_throttled()
+            else:
+                self.limiter.on_success()
+            self.limit = self.limiter.limit
+
+        if throttled or info.remaining == 0:
+            ttl = info.retry_after
+            if ttl is None:
+                ttl = WINDOW if info.reset is None else info.reset
+            await self.block(ttl)
 
     async def block(self, ttl: int = 60) -> None:
         """
@@ -0,0 +1,122 @@
+from types import MappingProxyType
+
+EMPTY = MappingProxyType({})
+
+
+class AuthScheme:
+    """
+    Describes how an API key is attached to a request.
+
+    A scheme is bound to a key once, when the provider is created, and
+    yields read-only header and query parameter mappings that are reused
+    for every request instead of being rebuilt per attempt.
+    """
+
+    def headers(self, key: str) -> MappingProxyType:
+        """
+        Returns the headers carrying the key.
+
+        Args:
+            key (str): The API key.
+
+        Returns:
+            MappingProxyType: Read-only header mapping.
+        """
+        return EMPTY
+
+    def params(self, key: str) -> MappingProxyType:
+        """
+        Returns the query parameters carrying the key.
+
+        Args:
+            key (str): The API key.
+
+        Returns:
+            MappingProxyType: Read-only query parameter mapping.
+        """
+        return EMPTY
+
+
+class BearerAuth(AuthScheme):
+    """
+    Sends the key as 'Authorization: Bearer <key>' (OpenAI style).
+    """
+
+    def headers(self, key: str) -> MappingProxyType:
+        return MappingProxyType({"Authorization": f"Bearer {key}"})
+
+
+class HeaderAuth(AuthScheme):
+    """
+    Sends the key in a custom header, e.g. 'x-api-key: <key>'.
+
+    Attributes:
+        name (str): The header name.
+        prefix (str): Optional prefix placed before the key.
+    """
+
+    def __init__(self, name: str = "x-api-key", prefix: str = "") -> None:
+        """
+        Initializes the header scheme.
+
+        Args:
+            name (str): Header name. Default is 'x-api-key'.
+            prefix (str): Prefix placed before the key, e.g. 'Token '.
+        """
+        self.name = name
+        self.prefix = prefix
+
+    def headers(self, key: str) -> MappingProxyType:
+        return MappingProxyType({self.name: f"{self.prefix}{key}"})
+
+
+class QueryParamAuth(AuthScheme):
+    """
+    Sends the key as a query parameter, e.g. '?key=<key>'.
+
+    Attributes:
+        name (str): The query parameter name.
+    """
+
+    def __init__(self, name: str = "key") -> None:
+        """
+        Initializes the query parameter scheme.
+
+        Args:
+            name (str): Query parameter name. Default is 'key'.
+        """
+        self.name = name
+
+    def params(self, key: str) -> MappingProxyType:
+        return MappingProxyType({self.name: key})
+
+
+def merge(base, overlay):
+    """
+    Merges two header mappings copy-on-write.
+
+    Names are compared case-insensitively, as HTTP header names are, so
+    an overlay value replaces the caller's 'authorization' or
+    'X-Api-Key' instead of being sent next to it. Returns one of the
+    inputs unchanged when the other is empty, so the common case of no
+    caller headers allocates nothing, and never mutates either input.
+
+    Args:
+        base (Mapping, optional): Caller supplied values.
+        overlay (Mapping): Values taking precedence, e.g. auth headers.
+
+    Returns:
+        Mapping or None: The merged mapping, or None if both are empty.
+    """
+    if not overlay:
+        return base or None
+    if not base:
+        return overlay
+
+    replaced = {name.lower() for name in overlay}
+    merged = {
+        name: value for name, value in base.items()
+        if name.lower() not in replaced
+    }
+    merged.update(overlay)
+    return merged
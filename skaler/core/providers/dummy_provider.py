@@ -1,3 +1,7 @@
+from .adapter import DEFAULT_ADAPTER
+from .auth import EMPTY
+
+
 class DummyProvider:
     """
     A minimal stub provider used when no actual API keys or rate-limiting
@@ -9,13 +13,35 @@ class DummyProvider:
 
     Attributes:
         name (str): The name of the provider, defaults to "dummy".
+        auth_headers (Mapping[str, str]): Always empty.
+        auth_params (Mapping[str, str]): Always empty.
+        base_url (None): Never set, so routed requests skip this provider.
+        adapter (RequestAdapter): Passes requests through unchanged.
+        capabilities (FrozenSet[str]): Always empty.
+        cost (float): Always 0.
     """
 
+    __slots__ = (
+        "name",
+        "auth_headers",
+        "auth_params",
+        "base_url",
+        "adapter",
+        "capabilities",
+        "cost",
+    )
+
     def __init__(self):
         """
         Initializes the dummy provider with a default name.
         """
         self.name = "dummy"
+        self.auth_headers = EMPTY
+        self.auth_params = EMPTY
+        self.base_url = None
+        self.adapter = DEFAULT_ADAPTER
+        self.capabilities = frozenset()
+        self.cost = 0.0
 
     async def is_available(self) -> bool:
         """
@@ -27,10 +53,39 @@ class DummyProvider:
         """
         return True
 
+    async def headroom(self) -> float:
+        """
+        Always returns 1, since this provider has no quota.
+
+        Returns:
+            float: Always 1.0.
+        """
+        return 1.0
+
     async def record_usage(self):
         """
         No-op method for recording usage.
         Exists to satisfy the expected APIProvider interface.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    async def release_usage(self):
+        """
+        No-op method for releasing usage.
+        Exists to satisfy the expected APIProvider interface.
+        """
+        pass
+
+    async def observe(self, response):
+        """
+        No-op method for observing responses.
+        Exists to satisfy the expected APIProvider interface.
+
+        Args:
+            response (httpx.Response): Ignored in DummyProvider.
         """
         pass
 
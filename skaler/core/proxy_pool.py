@@ -1,4 +1,11 @@
+import math
 import time
+from array import array
+
+NAN = float("nan")
+EMPTY = -1  # Free slot in the URL index
+MIN_SLOTS = 8
+MAX_WEIGHT = 0xFFFF  # Weights and boosts are stored as 16-bit integers
 
 
 class ProxyPool:
@@ -7,11 +14,35 @@ class ProxyPool:
     Automatically skips over proxies that are blocked and re-includes them
     after TTL.
 
+    Proxies can be added, removed and reweighted at any time, including
+    while requests are in flight; each update is O(1).
+
+    Per-proxy state is kept struct-of-arrays style: every proxy gets a
+    small integer id, and its rotation slot, block deadline, latency,
+    weight and boost live at that index in flat typed arrays. Selection
+    walks an array of ids and reads contiguous floats rather than hashing
+    URLs into dicts. URLs are looked up through an open-addressing index
+    of ids, also an array, so apart from the URL strings themselves a
+    proxy costs a few dozen bytes whatever state it has. The rotation
+    follows the same rules as 'Rotation'.
+
     Attributes:
-        _proxies (List[str]): List of proxy URLS.
-        _index (int): Current index in the proxy list for round-robin rotation.
-        _blocked (Dict[str, float]): Dictionary mapping proxy URLs to unblock
-            timestamps.
+        _order (array): Proxy ids in rotation order.
+        _position (array): Index of each id in '_order'.
+        _index (int): Position in '_order' the rotation is currently on.
+        _credit (int): Picks already spent on the current proxy.
+        _urls (List[str or None]): Maps ids to URLs; None for ids freed by
+            removed proxies.
+        _free (List[int]): Ids available for reuse.
+        _table (array): Linear-probing hash index from URLs to ids, at
+            most half full; EMPTY marks free slots.
+        _unblock (array): Unblock timestamp per id, 0 when not blocked.
+        _latency (array): Measured latency per id in seconds, NaN when
+            unknown.
+        _weights (array): Configured weight per id.
+        _boosts (array): Speed factor per id, set by health checks. A
+            proxy's rotation weight is its configured weight times its
+            boost, so either can change without losing the other.
     """
 
     def __init__(
@@ -25,9 +56,33 @@ class ProxyPool:
             proxy_list (List[str]): A list of proxy URLs.
         """
 
-        self._proxies = proxy_list
+        self._order = array("I")
+        self._position = array("I")
         self._index = 0
-        self._blocked = {} # proxy_url -> unblock_time
+        self._credit = 0
+        self._urls = []
+        self._free = []
+        self._table = array("i", [EMPTY]) * MIN_SLOTS
+        self._unblock = array("d")
+        self._latency = array("d")
+        self._weights = array("H")
+        self._boosts = array("H")
+        for proxy in proxy_list:
+            self.add(proxy)
+
+    @property
+    def proxies(self) -> list[str]:
+        """
+        Returns the proxy URLs currently in rotation.
+        """
+        urls = self._urls
+        return [urls[pid] for pid in self._order]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, proxy: str) -> bool:
+        return self._find(proxy)[1] != EMPTY
 
     def get_next(self) -> str | None:
         """
@@ -38,49 +93,308 @@ class ProxyPool:
             str | None: The next available proxy URL, or None if all are blocked
                 or list is empty.
         """
-        start = self._index
+        order = self._order
+        count = len(order)
+        now = time.time()
+        unblock = self._unblock
+        index = self._index
+        for offset in range(count):
+            position = index + offset
+            if position >= count:
+                position -= count
+            pid = order[position]
+            until = unblock[pid]
+            if until:
+                if now <= until:
+                    continue
+                unblock[pid] = 0.0 # Auto-unblock
 
-        if not self._proxies:
-            return None
+            credit = self._credit + 1 if position == index else 1
+            if credit >= self._weights[pid] * self._boosts[pid]:
+                self._index = position + 1 if position + 1 < count else 0
+                self._credit = 0
+            else:
+                self._index = position
+                self._credit = credit
+            return self._urls[pid]
+        return None
 
-        while True:
-            proxy = self._proxies[self._index]
-            self._index = (self._index + 1) % len(self._proxies)
+    def add(self, proxy: str, weight: int = 1) -> None:
+        """
+        Adds a proxy to the rotation, or updates its weight if present.
+
+        Args:
+            proxy (str): The proxy URL.
+            weight (int): Consecutive picks the proxy gets per rotation,
+                from 1 to MAX_WEIGHT. Default is 1.
+
+        Raises:
+            ValueError: If the weight is out of range.
+        """
+        if not 1 <= weight <= MAX_WEIGHT:
+            raise ValueError(f"weight must be between 1 and {MAX_WEIGHT}")
+        pid = self._find(proxy)[1]
+        if pid == EMPTY:
+            pid = self._allocate(proxy)
+            self._position[pid] = len(self._order)
+            self._order.append(pid)
+        self._weights[pid] = weight
+
+    def remove(self, proxy: str) -> None:
+        """
+        Removes a proxy from the rotation. Requests already using it are
+        not affected.
+
+        Args:
+            proxy (str): The proxy URL.
 
-            if not self._is_blocked(proxy):
-                return proxy
+        Raises:
+            KeyError: If the proxy is not in the pool.
+        """
+        slot, pid = self._find(proxy)
+        if pid == EMPTY:
+            raise KeyError(proxy)
+        self._unindex(slot)
+
+        position = self._position[pid]
+        last = self._order.pop()
+        if position < len(self._order):
+            self._order[position] = last
+            self._position[last] = position
+
+        if position == self._index:
+            self._credit = 0
+        if self._index >= len(self._order):
+            self._index = 0
+        self._urls[pid] = None
+        self._free.append(pid)
+
+    def reweight(self, proxy: str, weight: int) -> None:
+        """
+        Changes how many consecutive picks a proxy gets per rotation.
 
-            if self._index == start:
-                return None
+        Args:
+            proxy (str): The proxy URL.
+            weight (int): The new weight, from 1 to MAX_WEIGHT.
+
+        Raises:
+            KeyError: If the proxy is not in the pool.
+            ValueError: If the weight is out of range.
+        """
+        if not 1 <= weight <= MAX_WEIGHT:
+            raise ValueError(f"weight must be between 1 and {MAX_WEIGHT}")
+        self._weights[self._id(proxy)] = weight
+
+    def weight(self, proxy: str) -> int:
+        """
+        Returns the configured weight of a proxy, without its boost.
+        """
+        pid = self._find(proxy)[1]
+        return 1 if pid == EMPTY else self._weights[pid]
+
+    def boost(self, proxy: str, factor: int) -> None:
+        """
+        Multiplies a proxy's configured weight by a speed factor, so faster
+        proxies get more consecutive picks. Used by health checks; the
+        configured weight is kept.
+
+        Args:
+            proxy (str): The proxy URL.
+            factor (int): The factor, from 1 to MAX_WEIGHT. 1 removes the
+                boost.
+
+        Raises:
+            KeyError: If the proxy is not in the pool.
+            ValueError: If the factor is out of range.
+        """
+        if not 1 <= factor <= MAX_WEIGHT:
+            raise ValueError(f"factor must be between 1 and {MAX_WEIGHT}")
+        self._boosts[self._id(proxy)] = factor
 
     def block(self, proxy: str, ttl: int = 60) -> None:
         """
         Temporarily blocks a proxy for a given number of seconds.
+        Proxies that are not in the pool are ignored.
 
         Args:
             proxy (str): The proxy URL to block.
             ttl (int): Time-to-live (in seconds) before the proxy becomes
                 available again.
         """
+        pid = self._find(proxy)[1]
+        if pid != EMPTY:
+            self._unblock[pid] = time.time() + ttl
+
+    def unblock(self, proxy: str) -> None:
+        """
+        Makes a blocked proxy available again before its TTL expires.
+
+        Args:
+            proxy (str): The proxy URL to unblock.
+        """
+        pid = self._find(proxy)[1]
+        if pid != EMPTY:
+            self._unblock[pid] = 0.0
+
+    def set_latency(self, proxy: str, seconds: float) -> None:
+        """
+        Records the measured latency of a proxy.
+
+        Args:
+            proxy (str): The proxy URL.
+            seconds (float): The measured latency.
+        """
+        pid = self._find(proxy)[1]
+        if pid != EMPTY:
+            self._latency[pid] = seconds
+
+    def latency(self, proxy: str) -> float | None:
+        """
+        Returns the last measured latency of a proxy, or None if unknown.
+        """
+        pid = self._find(proxy)[1]
+        if pid == EMPTY or math.isnan(self._latency[pid]):
+            return None
+        return self._latency[pid]
+
+    def ranked(self) -> list[str]:
+        """
+        Returns the available proxies, fastest first. Proxies without a
+        measured latency come last.
+
+        Ranking is informational: 'get_next()' follows the weighted
+        rotation, which only favours fast proxies through 'boost()'.
+
+        Returns:
+            List[str]: Unblocked proxy URLs ordered by latency.
+        """
+        latency = self._latency
+        unknown = float("inf")
+        available = [
+            pid for pid in self._order if not self._is_blocked(pid)
+        ]
+        available.sort(
+            key=lambda pid: unknown if math.isnan(latency[pid])
+            else latency[pid]
+        )
+        return [self._urls[pid] for pid in available]
+
+    def _id(self, proxy: str) -> int:
+        """
+        Returns the id of a proxy.
+
+        Raises:
+            KeyError: If the proxy is not in the pool.
+        """
+        pid = self._find(proxy)[1]
+        if pid == EMPTY:
+            raise KeyError(proxy)
+        return pid
+
+    def _find(self, proxy: str) -> tuple:
+        """
+        Looks a URL up in the index.
+
+        Returns:
+            tuple: The slot holding the URL's id, or the free slot where it
+                would go, and the id, or EMPTY if the URL is not indexed.
+        """
+        table = self._table
+        urls = self._urls
+        mask = len(table) - 1
+        slot = hash(proxy) & mask
+        while True:
+            pid = table[slot]
+            if pid == EMPTY or urls[pid] == proxy:
+                return slot, pid
+            slot = (slot + 1) & mask
+
+    def _unindex(self, slot: int) -> None:
+        """
+        Frees an index slot, shifting back later ids of the same probe
+        run so lookups never stop early at the gap.
+        """
+        table = self._table
+        urls = self._urls
+        mask = len(table) - 1
+        current = slot
+        while True:
+            table[slot] = EMPTY
+            while True:
+                current = (current + 1) & mask
+                pid = table[current]
+                if pid == EMPTY:
+                    return
+                home = hash(urls[pid]) & mask
+                # Ids whose home slot lies cyclically in (slot, current]
+                # are still reachable and stay where they are
+                if slot <= current:
+                    if slot < home <= current:
+                        continue
+                elif home > slot or home <= current:
+                    continue
+                break
+            table[slot] = pid
+            slot = current
+
+    def _reindex(self, size: int) -> None:
+        """
+        Rebuilds the index with 'size' slots, a power of two.
+        """
+        self._table = array("i", [EMPTY]) * size
+        mask = size - 1
+        for pid, url in enumerate(self._urls):
+            if url is None:
+                continue
+            slot = hash(url) & mask
+            while self._table[slot] != EMPTY:
+                slot = (slot + 1) & mask
+            self._table[slot] = pid
+
+    def _allocate(self, proxy: str) -> int:
+        """
+        Assigns an id to a new proxy, reusing a freed one if possible,
+        with its state reset, and indexes its URL.
+        """
+        if self._free:
+            pid = self._free.pop()
+            self._urls[pid] = proxy
+            self._unblock[pid] = 0.0
+            self._latency[pid] = NAN
+            self._weights[pid] = 1
+            self._boosts[pid] = 1
+        else:
+            pid = len(self._urls)
+            self._urls.append(proxy)
+            self._position.append(0)
+            self._unblock.append(0.0)
+            self._latency.append(NAN)
+            self._weights.append(1)
+            self._boosts.append(1)
 
-        self._blocked[proxy] = time.time() + ttl
+        if (len(self._order) + 1) * 2 > len(self._table):
+            # The new URL is already in '_urls', so it is indexed here
+            self._reindex(len(self._table) * 2)
+        else:
+            self._table[self._find(proxy)[0]] = pid
+        return pid
 
-    def _is_blocked(self, proxy: str) -> bool:
+    def _is_blocked(self, pid: int) -> bool:
         """
         Checks whether a proxy is currently blocked.
         Unblocks it if TTL has expired.
 
         Args:
-            proxy (str): The proxy URL to check.
+            pid (int): The proxy id to check.
 
         Returns:
             bool: True if the proxy is still blocked, False otherwise.
         """
-        unblock_time = self._blocked.get(proxy)
+        unblock_time = self._unblock[pid]
         if not unblock_time:
             return False
 
         if time.time() > unblock_time:
-            del self._blocked[proxy] # Auto-unblock
+            self._unblock[pid] = 0.0 # Auto-unblock
             return False
         return True
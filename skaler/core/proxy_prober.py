@@ -0,0 +1,200 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_PORTS = {
+    "http": 80,
+    "https": 443,
+    "socks5": 1080,
+    "socks5h": 1080,
+}
+
+
+class ProxyProber:
+    """
+    Health-checks a SkaleManager's proxies in the background, so dead or
+    banned proxies are taken out of rotation before live traffic hits them.
+
+    Each check opens a TCP connection to the proxy and, if a test URL is
+    configured, fetches it through the proxy's pooled client. Proxies that
+    fail are blocked until the next round; proxies that pass are unblocked
+    and their latency is recorded in the pool ('ProxyPool.ranked()').
+
+    Latency only changes which proxies are picked when 'max_weight' is
+    above 1. Proxies are then boosted in proportion to their speed, on top
+    of their configured weights.
+
+    Attributes:
+        manager (SkaleManager): The manager whose proxies are checked.
+        test_url (str or None): URL fetched through each proxy. Responses
+            with a status of 400 or above (e.g. a 403 ban) fail the check.
+        interval (float): Seconds between rounds of checks.
+        timeout (float): Maximum seconds a single check may take.
+        concurrency (int): Maximum number of proxies checked at once.
+        max_weight (int): When above 1, healthy proxies are boosted by a
+            factor between 1 and 'max_weight' in proportion to their speed
+            relative to the fastest proxy.
+        warm_urls (List[str]): URLs requested through each healthy proxy
+            after its check, so the pooled client already holds an open
+            connection to those hosts when real requests arrive.
+    """
+
+    def __init__(
+        self,
+        manager,
+        test_url: str = None,
+        interval: float = 30.0,
+        timeout: float = 5.0,
+        concurrency: int = 20,
+        max_weight: int = 1,
+        warm_urls: list[str] = ()
+    ) -> None:
+        """
+        Initializes the prober. Call 'start()' to begin checking.
+
+        Args:
+            manager (SkaleManager): The manager whose proxies are checked.
+            test_url (str, optional): URL fetched through each proxy.
+                Defaults to only checking that the proxy accepts connections.
+            interval (float): Seconds between rounds. Default is 30.
+            timeout (float): Maximum seconds per check. Default is 5.
+            concurrency (int): Maximum concurrent checks. Default is 20.
+            max_weight (int): Boost given to the fastest proxy. Default
+                is 1, which leaves selection to the configured weights.
+            warm_urls (List[str], optional): URLs used to pre-warm
+                connections through healthy proxies. Warm connections are
+                only kept for the transport's 'keepalive_expiry'.
+        """
+        self.manager = manager
+        self.test_url = test_url
+        self.interval = interval
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.max_weight = max_weight
+        self.warm_urls = list(warm_urls)
+        self._task = None
+
+    async def check(self, proxy: str) -> float | None:
+        """
+        Checks a single proxy.
+
+        Args:
+            proxy (str): The proxy URL.
+
+        Returns:
+            float | None: The latency in seconds, measured on the test URL
+                if there is one and on the TCP connect otherwise, or None
+                if the proxy failed the check.
+        """
+        try:
+            return await asyncio.wait_for(self._check(proxy), self.timeout)
+        except Exception:
+            # Connection errors, timeouts and any httpx error from the
+            # test request all mean the proxy is unusable for now
+            return None
+
+    async def probe(self) -> dict[str, float | None]:
+        """
+        Runs one round of checks over every proxy in the pool, including
+        blocked ones so they can recover, and applies the results.
+
+        Returns:
+            Dict[str, float | None]: Latency of each checked proxy, None
+                for the ones that failed.
+        """
+        pool = self.manager.proxies
+        if pool is None or not len(pool):
+            return {}
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(proxy):
+            async with semaphore:
+                return await self.check(proxy)
+
+        proxies = pool.proxies
+        latencies = await asyncio.gather(*(bounded(p) for p in proxies))
+        results = dict(zip(proxies, latencies))
+
+        healthy = []
+        for proxy, latency in results.items():
+            if proxy not in pool:
+                continue  # Removed while being checked
+            if latency is None:
+                pool.block(proxy, ttl=self.interval + self.timeout)
+            else:
+                pool.unblock(proxy)
+                pool.set_latency(proxy, latency)
+                healthy.append(proxy)
+
+        if self.max_weight > 1 and healthy:
+            fastest = min(results[proxy] for proxy in healthy)
+            for proxy in healthy:
+                ratio = fastest / results[proxy] if results[proxy] else 1.0
+                pool.boost(proxy, max(1, round(self.max_weight * ratio)))
+
+        if self.warm_urls and healthy:
+            await asyncio.gather(
+                *(self._warm(proxy) for proxy in healthy),
+                return_exceptions=True
+            )
+        return results
+
+    def start(self) -> None:
+        """
+        Starts checking proxies in a background task.
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self.manager.attach(self)
+
+    async def stop(self) -> None:
+        """
+        Stops the background task.
+        """
+        self.manager.detach(self)
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _check(self, proxy: str) -> float:
+        parts = urlsplit(proxy)
+        port = parts.port or DEFAULT_PORTS.get(parts.scheme, 80)
+
+        start = time.perf_counter()
+        _, writer = await asyncio.open_connection(parts.hostname, port)
+        latency = time.perf_counter() - start
+        writer.close()
+        await writer.wait_closed()
+
+        if self.test_url is None:
+            return latency
+
+        start = time.perf_counter()
+        response = await self.manager.requester.send(
+            method="GET", url=self.test_url, proxy=proxy, timeout=self.timeout
+        )
+        if response.status_code >= 400:
+            raise OSError(f"test URL returned {response.status_code}")
+        return time.perf_counter() - start
+
+    async def _warm(self, proxy: str) -> None:
+        for url in self.warm_urls:
+            await self.manager.requester.send(
+                method="HEAD", url=url, proxy=proxy, timeout=self.timeout
+            )
+
+    async def aclose(self) -> None:
+        """
+        Same as 'stop()'; called when the manager is closed.
+        """
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
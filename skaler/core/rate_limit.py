@@ -0,0 +1,206 @@
+import re
+import time
+from datetime import datetime
+
+LIMIT_HEADERS = (
+    "x-ratelimit-limit-requests",
+    "anthropic-ratelimit-requests-limit",
+    "x-ratelimit-limit",
+    "ratelimit-limit",
+)
+REMAINING_HEADERS = (
+    "x-ratelimit-remaining-requests",
+    "anthropic-ratelimit-requests-remaining",
+    "x-ratelimit-remaining",
+    "ratelimit-remaining",
+)
+RESET_HEADERS = (
+    "x-ratelimit-reset-requests",
+    "anthropic-ratelimit-requests-reset",
+    "x-ratelimit-reset",
+    "ratelimit-reset",
+)
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _first(headers, names):
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def parse_seconds(value: str) -> float | None:
+    """
+    Parses a reset/retry delay into seconds from now.
+
+    Accepts plain seconds ('12', '0.5'), epoch timestamps, Go-style
+    durations as sent by OpenAI ('6m0s', '20ms'), and RFC 3339 or HTTP
+    dates as sent by Anthropic and in 'Retry-After'.
+
+    Args:
+        value (str): The header value.
+
+    Returns:
+        float | None: Seconds until reset, or None if unparseable.
+    """
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # Large values are absolute epoch timestamps (e.g. GitHub)
+        return max(seconds - time.time(), 0.0) if seconds > 1e9 else seconds
+
+    parts = _DURATION.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _UNITS[u] for n, u in parts)
+
+    try:
+        if "T" in value:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        else:
+            # Imported here: email.utils is slow to import and HTTP dates
+            # are rare in rate limit headers
+            from email.utils import parsedate_to_datetime
+
+            moment = parsedate_to_datetime(value)
+        return max(moment.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitInfo:
+    """
+    Rate limit state advertised by an upstream response.
+
+    Attributes:
+        limit (int | None): Requests allowed per window.
+        remaining (int | None): Requests left in the current window.
+        reset (float | None): Seconds until the window resets.
+        retry_after (float | None): Seconds the server asks to wait.
+    """
+
+    def __init__(self, limit=None, remaining=None, reset=None,
+                 retry_after=None) -> None:
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_headers(cls, headers) -> "RateLimitInfo":
+        """
+        Extracts rate limit information from response headers.
+
+        Args:
+            headers (Mapping[str, str]): Case-insensitive response headers.
+
+        Returns:
+            RateLimitInfo: The parsed information; missing fields are None.
+        """
+        limit = _first(headers, LIMIT_HEADERS)
+        remaining = _first(headers, REMAINING_HEADERS)
+        reset = _first(headers, RESET_HEADERS)
+        retry_after = headers.get("retry-after")
+        return cls(
+            limit=int(limit) if limit and limit.isdigit() else None,
+            remaining=(
+                int(remaining) if remaining and remaining.isdigit() else None
+            ),
+            reset=parse_seconds(reset) if reset else None,
+            retry_after=parse_seconds(retry_after) if retry_after else None,
+        )
+
+
+class AdaptiveLimit:
+    """
+    A per-provider request limit learned from upstream feedback.
+
+    Uses additive-increase/multiplicative-decrease (AIMD): a 429
+    multiplies the limit by 'decrease', while a full window's worth of
+    successful requests raises it by 'increase'. A burst of 429s from
+    requests that were already in flight counts as a single decrease
+    within 'cooldown' seconds. A limit advertised in
+    response headers becomes the ceiling and is adopted immediately.
+
+    Attributes:
+        value (float): The current limit estimate.
+        minimum (int): Lower bound for the limit.
+        ceiling (int | None): Upper bound, from headers or configuration.
+        increase (float): Additive step per window of successes.
+        decrease (float): Multiplicative factor applied on throttling.
+        cooldown (float): Minimum seconds between two decreases.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int = 1,
+        maximum: int = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0
+    ) -> None:
+        """
+        Initializes the adaptive limit.
+
+        Args:
+            initial (int): Starting limit, e.g. the configured
+                'limit_per_minute'.
+            minimum (int): Lower bound for the limit. Default is 1.
+            maximum (int, optional): Upper bound until the upstream
+                advertises one. Defaults to unbounded.
+            increase (float): Additive increase per window. Default is 1.
+            decrease (float): Multiplicative decrease on 429. Default 0.5.
+            cooldown (float): Minimum seconds between decreases.
+                Default is 1.
+        """
+        self.value = float(initial)
+        self.minimum = minimum
+        self.ceiling = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """
+        Returns the current limit as a whole number of requests.
+        """
+        return max(int(self.value), self.minimum)
+
+    def on_success(self) -> None:
+        """
+        Records an unthrottled response, growing the limit slowly.
+        """
+        self.value += self.increase / max(self.value, 1.0)
+        if self.ceiling is not None:
+            self.value = min(self.value, float(self.ceiling))
+
+    def on_throttled(self) -> None:
+        """
+        Records a 429 response, cutting the limit multiplicatively.
+        """
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.value = max(self.value * self.decrease, float(self.minimum))
+
+    def on_advertised(self, limit: int) -> None:
+        """
+        Adopts a limit advertised by the upstream as the new ceiling.
+
+        Args:
+            limit (int): The advertised requests per window.
+        """
+        if limit != self.ceiling:
+            self.ceiling = limit
+            self.value = float(limit)
@@ -0,0 +1,159 @@
+class Rotation:
+    """
+    A weighted round-robin rotation supporting O(1) updates.
+
+    Items are kept in a list with a key -> position index, so adding,
+    removing (swap with the last item) and reweighting never scan the
+    list. An item with weight 'n' is picked 'n' times in a row before the
+    rotation moves on.
+
+    Attributes:
+        items (List): The items in rotation order.
+        _key (Callable): Returns the unique key of an item.
+        _positions (Dict[Hashable, int]): Maps keys to list positions.
+        _weights (Dict[Hashable, int]): Weights of items other than 1.
+        _index (int): Position of the item the rotation is currently on.
+        _credit (int): Picks already spent on the current item.
+    """
+
+    def __init__(self, items=(), key=None) -> None:
+        """
+        Initializes the rotation.
+
+        Args:
+            items (Iterable, optional): Initial items, all with weight 1.
+            key (Callable, optional): Returns an item's unique key.
+                Defaults to the item itself.
+        """
+        self._key = key or (lambda item: item)
+        self.items = []
+        self._positions = {}
+        self._weights = {}
+        self._index = 0
+        self._credit = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._positions
+
+    def get(self, key):
+        """
+        Returns the item with the given key, or None.
+        """
+        position = self._positions.get(key)
+        return None if position is None else self.items[position]
+
+    def weight(self, key) -> int:
+        """
+        Returns the weight of the item with the given key.
+        """
+        return self._weights.get(key, 1)
+
+    def add(self, item, weight: int = 1) -> None:
+        """
+        Adds an item, or replaces the item with the same key in place.
+
+        Args:
+            item: The item to add.
+            weight (int): How many consecutive picks the item gets.
+        """
+        key = self._key(item)
+        position = self._positions.get(key)
+        if position is None:
+            self._positions[key] = len(self.items)
+            self.items.append(item)
+        else:
+            self.items[position] = item
+        self.reweight(key, weight)
+
+    def remove(self, key):
+        """
+        Removes the item with the given key by swapping the last item into
+        its position.
+
+        Args:
+            key: Key of the item to remove.
+
+        Returns:
+            The removed item.
+
+        Raises:
+            KeyError: If no item has the given key.
+        """
+        position = self._positions.pop(key)
+        self._weights.pop(key, None)
+        item = self.items[position]
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self._positions[self._key(last)] = position
+
+        if position == self._index:
+            self._credit = 0
+        if self._index >= len(self.items):
+            self._index = 0
+        return item
+
+    def reweight(self, key, weight: int) -> None:
+        """
+        Changes the weight of an item.
+
+        Args:
+            key: Key of the item.
+            weight (int): New weight, at least 1.
+
+        Raises:
+            KeyError: If no item has the given key.
+            ValueError: If the weight is below 1.
+        """
+        if key not in self._positions:
+            raise KeyError(key)
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        if weight == 1:
+            self._weights.pop(key, None)
+        else:
+            self._weights[key] = weight
+
+    def candidates(self):
+        """
+        Yields each item once, starting from the current rotation position.
+
+        The rotation does not move until 'commit()' is called with the item
+        that was actually chosen, so callers can skip unusable items.
+
+        Yields:
+            The items in rotation order.
+        """
+        start = self._index
+        for offset in range(len(self.items)):
+            if not self.items:
+                return
+            yield self.items[(start + offset) % len(self.items)]
+
+    def commit(self, item) -> None:
+        """
+        Records that an item was picked and advances the rotation once the
+        item has used up its weight.
+
+        Args:
+            item: The picked item.
+        """
+        position = self._positions.get(self._key(item))
+        if position is None:
+            return
+        if position != self._index:
+            self._index = position
+            self._credit = 0
+
+        self._credit += 1
+        if self._credit >= self._weights.get(self._key(item), 1):
+            self._index = (position + 1) % len(self.items)
+            self._credit = 0
@@ -29,6 +29,28 @@ class ProviderBlocked(SkalerError):
         super().__init__(f"Provider '{provider_name}' is currently blocked.")
 
 
+class CircuitOpen(SkalerError):
+    """
+    Raised when requests to a host are rejected because its circuit
+    breaker is open after repeated host-side failures.
+
+    Attributes:
+        host (str): The host whose circuit is open.
+    """
+    def __init__(self, host: str):
+        self.host = host
+        super().__init__(f"Circuit for host '{host}' is open.")
+
+
+class DeadlineExceeded(SkalerError):
+    """
+    Raised when a request's deadline passes before it completes, whether
+    it was waiting for a provider, retrying or waiting on the upstream.
+    """
+    def __init__(self, message=None):
+        super().__init__(message or "Request deadline exceeded.")
+
+
 class RequestFailed(SkalerError):
     """
     Raised when an HTTP request to an API provider fails in a
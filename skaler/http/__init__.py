@@ -1,5 +1,40 @@
-from .requester import Requester
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .requester import Requester
+    from .serializers import (
+        MsgspecSerializer,
+        OrjsonSerializer,
+        Serializer,
+        StdlibSerializer,
+    )
+    from .transport import TransportConfig
+
+_LAZY = {
+    "MsgspecSerializer": ".serializers",
+    "OrjsonSerializer": ".serializers",
+    "Requester": ".requester",
+    "Serializer": ".serializers",
+    "StdlibSerializer": ".serializers",
+    "TransportConfig": ".transport",
+}
 
 __all__ = [
-    "Requester"
+    "MsgspecSerializer",
+    "OrjsonSerializer",
+    "Requester",
+    "Serializer",
+    "StdlibSerializer",
+    "TransportConfig",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,13 @@
+from types import MappingProxyType
+
 import httpx
 
+from .serializers import Serializer, default_serializer
+from .transport import TransportConfig
+
+# Read-only, as it is handed to every JSON request without caller headers
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
 
 class Requester:
     """
@@ -8,15 +16,122 @@ class Requester:
 
     Designed to be used internally by SkaleManager for sending API requests
     with optional proxy rotation and error handling.
+
+    Close the requester when done, with 'aclose()' or 'async with', to
+    release its connections; it cannot be used afterwards.
+
+    Attributes:
+        transport (TransportConfig): Connection and timeout settings used
+            for every client.
+        serializer (Serializer): JSON encoder/decoder for request and
+            response bodies.
+        client (httpx.AsyncClient): Client used for direct requests, created
+            on first use.
+        _proxy_clients (Dict[str, httpx.AsyncClient]): One client per proxy
+            URL, so connections through a proxy are pooled and reused.
+        closed (bool): Whether 'aclose()' was called.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        transport: TransportConfig = None,
+        serializer: Serializer = None
+    ):
         """
         Initializes the async HTTP client.
+
+        Args:
+            transport (TransportConfig, optional): Transport settings.
+                Defaults to 'TransportConfig()'.
+            serializer (Serializer, optional): JSON serializer. Defaults to
+                orjson or msgspec when installed, else the stdlib 'json'.
         """
-        self.client = httpx.AsyncClient()
+        self.transport = transport or TransportConfig()
+        self.serializer = serializer or default_serializer()
+        self._client = None
+        self._proxy_clients = {}
+        self.closed = False
 
-    async def send(self, method: str, url: str, headers=None, json=None, proxy=None, timeout=10):
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Returns the client for direct requests, creating it on first use
+        so constructing a Requester does not set up connection pools.
+        """
+        if self._client is None:
+            self._check_open()
+            self._client = self.transport.build_client()
+        return self._client
+
+    def _get_client(self, proxy: str = None) -> httpx.AsyncClient:
+        """
+        Returns the client to use for a proxy, creating it on first use.
+
+        Args:
+            proxy (str, optional): Proxy URL, or None for direct requests.
+
+        Returns:
+            httpx.AsyncClient: The client routing through the given proxy.
+        """
+        if not proxy:
+            return self.client
+
+        client = self._proxy_clients.get(proxy)
+        if client is None:
+            self._check_open()
+            client = self.transport.build_client(proxy=proxy)
+            self._proxy_clients[proxy] = client
+        return client
+
+    async def close_proxy(self, proxy: str) -> None:
+        """
+        Closes and forgets the client of a proxy that is no longer used.
+
+        Args:
+            proxy (str): The proxy URL.
+        """
+        client = self._proxy_clients.pop(proxy, None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the direct client and every proxy client. Safe to call more
+        than once.
+        """
+        self.closed = True
+        clients = list(self._proxy_clients.values())
+        if self._client is not None:
+            clients.append(self._client)
+        self._client = None
+        self._proxy_clients = {}
+        for client in clients:
+            await client.aclose()
+
+    async def __aenter__(self) -> "Requester":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _check_open(self) -> None:
+        """
+        Raises RuntimeError if the requester is closed.
+        """
+        if self.closed:
+            raise RuntimeError("requester is closed")
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers=None,
+        params=None,
+        json=None,
+        content: bytes = None,
+        proxy=None,
+        timeout=None
+    ):
         """
         Sends an asynchronous HTTP request with optional proxy and headers.
 
@@ -24,22 +139,77 @@ class Requester:
             method (str): The HTTP method (e.g., 'GET', 'POST').
             url (str): The full target URL of the request.
             headers (dict, optional): Optional HTTP headers to include.
-            json (dict, optional): JSON-serializable payload for the request body.
+            params (dict, optional): Optional query parameters.
+            json (dict, optional): JSON-serializable payload for the request
+                body, encoded with the requester's serializer.
+            content (bytes, optional): Pre-serialized request body. Takes
+                precedence over 'json'.
             proxy (str, optional): Proxy URL to route the request through.
-            timeout (int, optional): Request timeout in seconds. Default is 10.
+            timeout (float, optional): Request timeout in seconds, overriding
+                the transport timeouts. Defaults to the transport timeouts.
 
         Returns:
             httpx.Response: The response object from the request.
 
         Raises:
-            httpx.RequestError: If the request fails (e.g., timeout, connection error)
+            httpx.RequestError: If the request fails (e.g., timeout,
+                connection error)
+            RuntimeError: If the requester is closed.
         """
 
-        return await self.client.request(
+        if content is None and json is not None:
+            content, headers = self.encode_json(json, headers)
+
+        client = self._get_client(proxy)
+        return await client.request(
             method=method,
             url=url,
             headers=headers,
-            json=json,
-            timeout=timeout,
-            proxies={"http": proxy, "https": proxy} if proxy else None
+            params=params,
+            content=content,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
         )
+
+    def encode_json(self, obj, headers=None) -> tuple:
+        """
+        Encodes a JSON request body and adds a JSON 'Content-Type' header
+        unless the headers already set one.
+
+        Args:
+            obj: JSON-serializable payload.
+            headers (dict, optional): Headers of the request. Never
+                modified.
+
+        Returns:
+            tuple: The encoded body and the headers to send with it.
+
+        Raises:
+            TypeError: If the payload cannot be serialized.
+        """
+        content = self.serializer.encode(obj)
+        if headers:
+            headers = httpx.Headers(headers)
+            headers.setdefault("Content-Type", "application/json")
+        else:
+            headers = JSON_HEADERS
+        return content, headers
+
+    def decode(self, response, type=None):
+        """
+        Decodes a JSON response body with the requester's serializer.
+
+        The raw body ('response.content') is handed to the serializer
+        as-is, so no intermediate text copy is made.
+
+        Args:
+            response (httpx.Response | bytes | memoryview): The response, or
+                its raw body.
+            type (type, optional): Class to decode into, e.g. a
+                'msgspec.Struct' when msgspec is the serializer.
+
+        Returns:
+            The decoded body, or an instance of 'type'.
+        """
+        if isinstance(response, httpx.Response):
+            response = response.content
+        return self.serializer.decode(response, type)
@@ -0,0 +1,160 @@
+import json
+from abc import ABC, abstractmethod
+
+
+class Serializer(ABC):
+    """
+    Encodes request payloads to JSON bytes and decodes response bodies.
+
+    Subclasses wrap a specific JSON library. Decoding accepts any bytes-like
+    object (including 'memoryview'), so response bodies can be decoded
+    without copying them first.
+
+    Attributes:
+        name (str): Short name of the underlying JSON library.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def encode(self, obj) -> bytes:
+        """
+        Serializes an object to JSON bytes.
+
+        Args:
+            obj: A JSON-serializable object.
+
+        Returns:
+            bytes: The encoded JSON document.
+        """
+
+    @abstractmethod
+    def decode(self, data, type=None):
+        """
+        Parses a JSON document, optionally into a typed object.
+
+        Args:
+            data (bytes | bytearray | memoryview | str): The JSON document.
+            type (type, optional): Class to decode into. A decoded object
+                is passed to it as keyword arguments, anything else as a
+                single argument.
+
+        Returns:
+            The decoded value, or an instance of 'type'.
+        """
+
+    @staticmethod
+    def _convert(obj, type):
+        if type is None:
+            return obj
+        if isinstance(obj, dict):
+            return type(**obj)
+        return type(obj)
+
+
+class StdlibSerializer(Serializer):
+    """
+    Serializer backed by the standard library 'json' module.
+    """
+
+    name = "json"
+
+    def encode(self, obj) -> bytes:
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+
+    def decode(self, data, type=None):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return self._convert(json.loads(data), type)
+
+
+class OrjsonSerializer(Serializer):
+    """
+    Serializer backed by 'orjson'.
+
+    Non-string dict keys are encoded as strings, like the standard
+    library does. Payloads orjson cannot encode at all (e.g. integers
+    wider than 64 bits) fall back to the standard library.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            return _STDLIB.encode(obj)
+
+    def decode(self, data, type=None):
+        return self._convert(self._orjson.loads(data), type)
+
+
+class MsgspecSerializer(Serializer):
+    """
+    Serializer backed by 'msgspec'.
+
+    Decoding with a 'type' validates and builds the object (e.g. a
+    'msgspec.Struct', dataclass or 'list[Struct]') directly from the JSON
+    bytes, without an intermediate dict. Payloads msgspec cannot encode
+    fall back to the standard library.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._typed_decoders = {}
+        self._msgspec = msgspec
+
+    def encode(self, obj) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return _STDLIB.encode(obj)
+
+    def decode(self, data, type=None):
+        if type is None:
+            return self._decoder.decode(data)
+
+        decoder = self._typed_decoders.get(type)
+        if decoder is None:
+            decoder = self._msgspec.json.Decoder(type)
+            self._typed_decoders[type] = decoder
+        return decoder.decode(data)
+
+
+_STDLIB = StdlibSerializer()
+
+
+def default_serializer() -> Serializer:
+    """
+    Returns the fastest serializer available in the environment.
+
+    Prefers orjson, then msgspec, and falls back to the standard library.
+
+    Returns:
+        Serializer: A serializer instance.
+    """
+    for serializer_class in (OrjsonSerializer, MsgspecSerializer):
+        try:
+            return serializer_class()
+        except ImportError:
+            continue
+    return StdlibSerializer()
@@ -0,0 +1,221 @@
+import asyncio
+import socket
+import time
+
+import httpcore
+import httpx
+
+
+class TransportConfig:
+    """
+    Connection and transport settings shared by every client a Requester
+    creates.
+
+    Bundles the knobs httpx exposes for connection reuse (HTTP/2, pool
+    limits, keep-alive), granular timeouts and transport-level retries,
+    plus an optional DNS cache, so they can be configured once on a
+    SkaleManager or Requester instead of per request.
+
+    Attributes:
+        http2 (bool): Whether to negotiate HTTP/2 (requires the 'h2' package).
+        max_connections (int): Maximum number of open connections per client.
+        max_keepalive_connections (int): Maximum number of idle connections
+            kept alive per client.
+        keepalive_expiry (float): Seconds an idle connection is kept alive.
+        connect_timeout (float): Seconds to wait for a connection to open.
+        read_timeout (float): Seconds to wait for a chunk of the response.
+        write_timeout (float): Seconds to wait for a chunk of the request
+            to be sent.
+        pool_timeout (float): Seconds to wait for a free connection slot.
+        retries (int): Number of connection retries done by the transport.
+        dns_cache_ttl (float): Seconds a resolved address is cached; 0
+            disables the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 10.0,
+        write_timeout: float = 10.0,
+        pool_timeout: float = 5.0,
+        retries: int = 0,
+        dns_cache_ttl: float = 0
+    ) -> None:
+        """
+        Initializes the transport configuration.
+
+        Args:
+            http2 (bool): Enable HTTP/2 multiplexing. Default is False.
+            max_connections (int): Connection pool size. Default is 100.
+            max_keepalive_connections (int): Idle connections kept open.
+                Default is 20.
+            keepalive_expiry (float): Idle connection lifetime in seconds.
+                Default is 5.0.
+            connect_timeout (float): Connect timeout in seconds.
+            read_timeout (float): Read timeout in seconds.
+            write_timeout (float): Write timeout in seconds.
+            pool_timeout (float): Timeout in seconds for acquiring a
+                connection from the pool.
+            retries (int): Connection retries at the transport level.
+                Default is 0.
+            dns_cache_ttl (float): DNS cache lifetime in seconds.
+                Default is 0 (disabled).
+        """
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.pool_timeout = pool_timeout
+        self.retries = retries
+        self.dns_cache_ttl = dns_cache_ttl
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """
+        Returns the connection pool limits as an httpx.Limits object.
+        """
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """
+        Returns the granular timeouts as an httpx.Timeout object.
+        """
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout
+        )
+
+    def build_client(self, proxy: str = None) -> httpx.AsyncClient:
+        """
+        Creates an httpx.AsyncClient configured with these settings.
+
+        Args:
+            proxy (str, optional): Proxy URL every request of the client
+                is routed through.
+
+        Returns:
+            httpx.AsyncClient: The configured client.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            limits=self.limits,
+            retries=self.retries,
+            proxy=proxy
+        )
+        if self.dns_cache_ttl > 0:
+            _install_dns_cache(transport, self.dns_cache_ttl)
+
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout
+        )
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """
+    An httpcore network backend that caches hostname resolution.
+
+    Connections are opened to the cached IP address while TLS still
+    verifies against the original hostname, since httpcore passes the
+    origin host to 'start_tls' separately.
+
+    Attributes:
+        _backend (httpcore.AsyncNetworkBackend): The wrapped backend.
+        _ttl (float): Seconds a resolved address stays cached.
+        _cache (Dict[Tuple[str, int], Tuple[str, float]]): Maps
+            (host, port) to (address, expiry timestamp).
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float):
+        """
+        Initializes the caching backend.
+
+        Args:
+            backend (httpcore.AsyncNetworkBackend): Backend to delegate to.
+            ttl (float): Cache lifetime in seconds.
+        """
+        self._backend = backend
+        self._ttl = ttl
+        self._cache = {}
+
+    async def _resolve(self, host: str, port: int) -> str:
+        """
+        Returns a cached address for the host, resolving it if needed.
+
+        Args:
+            host (str): The hostname to resolve.
+            port (int): The port to connect to.
+
+        Returns:
+            str: The resolved IP address.
+        """
+        now = time.monotonic()
+        cached = self._cache.get((host, port))
+        if cached and cached[1] > now:
+            return cached[0]
+
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        self._cache[(host, port)] = (address, now + self._ttl)
+        return address
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float = None,
+        local_address: str = None,
+        socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        address = await self._resolve(host, port)
+        return await self._backend.connect_tcp(
+            address,
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options
+        )
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float = None,
+        socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path,
+            timeout=timeout,
+            socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def _install_dns_cache(transport: httpx.AsyncHTTPTransport, ttl: float):
+    """
+    Wraps the network backend of an httpx transport with a DNS cache.
+
+    httpx does not expose the network backend in its public API, so this
+    is skipped silently if the transport layout differs.
+    """
+    pool = getattr(transport, "_pool", None)
+    backend = getattr(pool, "_network_backend", None)
+    if backend is not None:
+        pool._network_backend = CachingDNSBackend(backend, ttl)
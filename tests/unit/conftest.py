@@ -0,0 +1,22 @@
+import httpx
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_leaked_clients(monkeypatch):
+    """
+    Fails a test that leaves an httpx.AsyncClient open, since every open
+    client holds a connection pool (and sockets, once used).
+    """
+    clients = []
+    init = httpx.AsyncClient.__init__
+
+    def tracked_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        clients.append(self)
+
+    monkeypatch.setattr(httpx.AsyncClient, "__init__", tracked_init)
+    yield clients
+
+    leaked = [client for client in clients if not client.is_closed]
+    assert not leaked, f"{len(leaked)} httpx.AsyncClient(s) left open"
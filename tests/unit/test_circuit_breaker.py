@@ -0,0 +1,178 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from skaler import APIProvider, CircuitBreakerRegistry, Requester, SkaleManager
+from skaler.core.circuit_breaker import CircuitBreaker
+from skaler.exceptions import CircuitOpen, RequestFailed
+
+
+def test_opens_after_threshold(monkeypatch):
+    """
+    Test that the breaker opens after consecutive failures and rejects
+    requests until the recovery timeout passes.
+    """
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    breaker = CircuitBreaker("api.example.com", failure_threshold=3)
+
+    for _ in range(2):
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+
+
+def test_success_resets_failure_count():
+    """
+    Test that a success in between failures resets the consecutive count.
+    """
+    breaker = CircuitBreaker("api.example.com", failure_threshold=2)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_admits_single_probe(monkeypatch):
+    """
+    Test that after the recovery timeout only one probe is admitted, and
+    that its outcome closes or re-opens the breaker.
+    """
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    breaker = CircuitBreaker(
+        "api.example.com", failure_threshold=1, recovery_timeout=30
+    )
+    breaker.record_failure()
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+    assert breaker.allow_request() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is False  # probe already in flight
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 62)
+    assert breaker.allow_request() is True
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() is True
+
+
+def test_release_frees_probe_slot(monkeypatch):
+    """
+    Test that releasing a probe without an outcome lets the next request
+    probe the host.
+    """
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    breaker = CircuitBreaker("h", failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request() is True
+    breaker.release()
+    assert breaker.allow_request() is True
+
+
+def test_registry_shares_breaker_per_host():
+    """
+    Test that URLs on the same host share one breaker.
+    """
+    registry = CircuitBreakerRegistry()
+
+    a = registry.get("https://api.example.com/v1/a")
+    b = registry.get("https://api.example.com/v1/b?x=1")
+    c = registry.get("https://other.example.com/v1/a")
+
+    assert a is b
+    assert a is not c
+
+
+@pytest.mark.asyncio
+async def test_manager_fails_fast_on_host_outage():
+    """
+    Test that host-side errors open the host's circuit without blocking
+    the provider, and that further requests fail fast with CircuitOpen.
+    """
+    provider = APIProvider(name="p1", key="sk-1", limit_per_minute=100)
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = httpx.ConnectError("refused")
+
+    manager = SkaleManager(
+        providers=[provider],
+        requester=requester,
+        breakers=CircuitBreakerRegistry(failure_threshold=2)
+    )
+
+    for _ in range(2):
+        with pytest.raises(RequestFailed):
+            await manager.send_request("GET", "https://api.example.com/x")
+
+    with pytest.raises(CircuitOpen):
+        await manager.send_request("GET", "https://api.example.com/x")
+
+    assert requester.send.await_count == 2
+    assert await provider.is_available() is True
+
+
+@pytest.mark.asyncio
+async def test_stragglers_do_not_steal_or_settle_the_probe(monkeypatch):
+    """
+    Test that requests admitted before the breaker opened neither close
+    it by succeeding nor free the half-open probe slot by failing for
+    non-host reasons.
+    """
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    breaker = CircuitBreaker("h", failure_threshold=1, recovery_timeout=30)
+    registry = CircuitBreakerRegistry()
+    registry._breakers["api.example.com"] = breaker
+
+    gates = []
+
+    async def send(**kwargs):
+        gate = asyncio.Future()
+        gates.append(gate)
+        return await gate
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = send
+    manager = SkaleManager(requester=requester, breakers=registry)
+
+    def start():
+        return asyncio.create_task(
+            manager.send_request("GET", "https://api.example.com/x")
+        )
+
+    early, late = start(), start()
+    await asyncio.sleep(0)
+    breaker.record_failure()  # Another request fails: the breaker opens
+
+    gates[0].set_result(httpx.Response(200))
+    await early
+    assert breaker.state == CircuitBreaker.OPEN
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+    probe = start()
+    await asyncio.sleep(0)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    gates[1].set_exception(RuntimeError("provider-side"))
+    with pytest.raises(RequestFailed):
+        await late
+    assert breaker.allow_request() is False  # Probe slot still taken
+
+    gates[2].set_result(httpx.Response(200))
+    await probe
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import os
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from skaler import ConfigWatcher, Requester, SkaleManager
+
+
+def _write(path, config, mtime):
+    path.write_text(json.dumps(config))
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.mark.asyncio
+async def test_config_file_changes_are_applied_as_diff(tmp_path):
+    """
+    Test that providers and proxies follow the watched file: entries are
+    added, reweighted, replaced and removed without touching unchanged ones.
+    """
+    path = tmp_path / "skaler.json"
+    manager = SkaleManager(requester=AsyncMock(spec=Requester))
+    watcher = ConfigWatcher(manager, str(path))
+
+    _write(path, {
+        "providers": [
+            {"name": "a", "key": "ka", "limit_per_minute": 10},
+            {"name": "b", "key": "kb", "limit_per_minute": 10,
+             "auth": {"scheme": "header", "name": "x-api-key"}},
+        ],
+        "proxies": ["http://p1", {"url": "http://p2", "weight": 2}],
+    }, 1)
+    assert await watcher.load() is True
+    assert await watcher.load() is False  # Unchanged file
+
+    providers = {p.name: p for p in manager.providers}
+    assert sorted(providers) == ["a", "b"]  # Default provider replaced
+    assert providers["b"].auth_headers == {"x-api-key": "kb"}
+    assert manager.proxies.proxies == ["http://p1", "http://p2"]
+
+    _write(path, {
+        "providers": [
+            {"name": "a", "key": "ka", "limit_per_minute": 10, "weight": 3},
+            {"name": "c", "key": "kc", "limit_per_minute": 10},
+        ],
+        "proxies": ["http://p2"],
+    }, 2)
+    assert await watcher.load() is True
+
+    current = {p.name: p for p in manager.providers}
+    assert sorted(current) == ["a", "c"]
+    assert current["a"] is providers["a"]  # Only reweighted
+    assert manager.proxies.proxies == ["http://p2"]
+
+
+@pytest.mark.asyncio
+async def test_changed_provider_is_drained_and_keeps_its_usage(tmp_path):
+    """
+    Test that a provider whose spec changes is swapped for a new object
+    sharing the old backend, and that the swap waits for the old object's
+    in-flight requests without blocking new ones.
+    """
+    release = asyncio.Event()
+
+    async def slow_send(**kwargs):
+        await release.wait()
+        return httpx.Response(200)
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = slow_send
+    manager = SkaleManager(requester=requester)
+    path = tmp_path / "skaler.json"
+    watcher = ConfigWatcher(manager, str(path))
+
+    spec = {"name": "a", "key": "k1", "limit_per_minute": 10}
+    _write(path, {"providers": [spec]}, 1)
+    await watcher.load()
+    old = manager.get_provider("a")
+
+    in_flight = asyncio.create_task(
+        manager.send_request("GET", "https://example.com")
+    )
+    await asyncio.sleep(0)
+
+    _write(path, {"providers": [{**spec, "key": "k2"}]}, 2)
+    reload = asyncio.create_task(watcher.load())
+    await asyncio.sleep(0.01)
+    new = manager.get_provider("a")
+    assert new is not old and new.backend is old.backend
+    assert not reload.done()  # Waiting for the old provider to drain
+
+    release.set()
+    await in_flight
+    assert await reload is True
+    assert await new.backend.get_usage("a") == 1
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_does_not_stop_the_watcher(tmp_path):
+    """
+    Test that a removal whose drain times out neither fails the reload
+    nor kills the background task.
+    """
+    async def hang(**kwargs):
+        await asyncio.sleep(10)
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = hang
+    manager = SkaleManager(requester=requester)
+    path = tmp_path / "skaler.json"
+    watcher = ConfigWatcher(
+        manager, str(path), interval=0.01, drain_timeout=0.01
+    )
+
+    _write(path, {"proxies": ["http://p1"]}, 1)
+    await watcher.load()
+    in_flight = asyncio.create_task(
+        manager.send_request("GET", "https://example.com")
+    )
+    await asyncio.sleep(0)
+
+    watcher.start()
+    _write(path, {"proxies": []}, 2)
+    await asyncio.sleep(0.1)
+    assert watcher._task is not None and not watcher._task.done()
+    assert manager.proxies.proxies == []
+
+    await watcher.stop()
+    in_flight.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await in_flight
+
+
+@pytest.mark.asyncio
+async def test_malformed_file_changes_nothing_until_fixed(tmp_path):
+    """
+    Test that a file with one bad entry is rejected as a whole, leaving
+    the running providers in place, and is applied in full once fixed.
+    """
+    manager = SkaleManager(requester=AsyncMock(spec=Requester))
+    path = tmp_path / "skaler.json"
+    watcher = ConfigWatcher(manager, str(path))
+
+    spec = {"name": "a", "key": "k-old", "limit_per_minute": 10}
+    _write(path, {"providers": [spec]}, 1)
+    await watcher.load()
+    old = manager.get_provider("a")
+
+    broken = [{**spec, "key": "k-new"}, {"name": "b", "limit_per_minute": 5}]
+    _write(path, {"providers": broken}, 2)
+    with pytest.raises(KeyError):
+        await watcher.load()
+    assert manager.get_provider("a") is old
+
+    fixed = [{**spec, "key": "k-new"}, {**broken[1], "key": "k-b"}]
+    _write(path, {"providers": fixed}, 3)
+    await watcher.load()
+    assert manager.get_provider("a").key == "k-new"
+    assert manager.get_provider("b").key == "k-b"
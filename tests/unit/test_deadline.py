@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from skaler import APIProvider, Deadline, Requester, SkaleManager
+from skaler.backend import InMemoryBackend
+from skaler.exceptions import (
+    DeadlineExceeded,
+    NoAvailableProviders,
+    RequestFailed,
+)
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_request_and_releases_quota():
+    """
+    Test that a request still waiting on the upstream when its deadline
+    passes is cancelled, and its reserved quota and slots are given back.
+    """
+    cancelled = asyncio.Event()
+
+    async def hang(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = hang
+    provider = APIProvider(name="p1", key="k1", limit_per_minute=1)
+    manager = SkaleManager(providers=[provider], requester=requester)
+
+    with pytest.raises(DeadlineExceeded):
+        await manager.send_request("GET", "https://example.com", deadline=0.05)
+
+    assert cancelled.is_set()
+    assert await provider.backend.get_usage("p1") == 0
+    assert manager._inflight == {}
+    assert await provider.is_available() is True
+
+
+@pytest.mark.asyncio
+async def test_deadline_waits_for_a_provider():
+    """
+    Test that with a deadline the request waits for quota to free up
+    instead of failing, and gives up once the deadline passes.
+    """
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+    provider = APIProvider(name="p1", key="k1", limit_per_minute=1)
+    manager = SkaleManager(providers=[provider], requester=requester)
+    await provider.record_usage()
+
+    async def free_quota():
+        await asyncio.sleep(0.1)
+        await provider.backend.reset_usage("p1")
+
+    asyncio.create_task(free_quota())
+    response = await manager.send_request(
+        "GET", "https://example.com", deadline=Deadline(1.0)
+    )
+    assert response.status_code == 200
+
+    with pytest.raises(DeadlineExceeded):
+        await manager.send_request("GET", "https://example.com", deadline=0.1)
+
+
+@pytest.mark.asyncio
+async def test_retries_use_next_provider_and_release_failed_quota():
+    """
+    Test that a failed attempt is retried on the next provider and the
+    quota reserved for it is given back.
+    """
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = [
+        httpx.ConnectError("refused"),
+        httpx.Response(200),
+    ]
+    p1 = APIProvider(name="p1", key="k1", limit_per_minute=10)
+    p2 = APIProvider(name="p2", key="k2", limit_per_minute=10)
+    manager = SkaleManager(providers=[p1, p2], requester=requester)
+
+    response = await manager.send_request(
+        "GET", "https://example.com", retries=1
+    )
+
+    assert response.status_code == 200
+    assert await p1.backend.get_usage("p1") == 0
+    assert await p2.backend.get_usage("p2") == 1
+
+    requester.send.side_effect = httpx.ConnectError("refused")
+    with pytest.raises(RequestFailed):
+        await manager.send_request("GET", "https://example.com", retries=1)
+    assert requester.send.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_cannot_overshoot_quota():
+    """
+    Test that when the backend suspends between the availability check
+    and the reservation, as networked backends do, concurrent requests
+    still never exceed the provider's limit.
+    """
+    class SlowBackend(InMemoryBackend):
+        async def get_usage(self, provider_name):
+            usage = await super().get_usage(provider_name)
+            await asyncio.sleep(0)
+            return usage
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+    backend = SlowBackend()
+    provider = APIProvider(
+        name="p1", key="k1", limit_per_minute=2, backend=backend
+    )
+    manager = SkaleManager(providers=[provider], requester=requester)
+
+    outcomes = await asyncio.gather(
+        *(manager.send_request("GET", "https://example.com")
+          for _ in range(5)),
+        return_exceptions=True
+    )
+
+    assert sum(isinstance(o, httpx.Response) for o in outcomes) == 2
+    assert sum(isinstance(o, NoAvailableProviders) for o in outcomes) == 3
+    assert await backend.get_usage("p1") == 2
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import skaler
+
+
+def _loaded_after(statement: str) -> set[str]:
+    """
+    Runs an import statement in a fresh interpreter and returns the names
+    of the modules it loaded.
+    """
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return set(output.split())
+
+
+def test_import_skaler_is_lazy():
+    """
+    Test that importing the package does not load httpx or the manager.
+    """
+    loaded = _loaded_after("import skaler")
+
+    assert "httpx" not in loaded
+    assert "skaler.core.manager" not in loaded
+
+
+def test_provider_import_does_not_load_http_stack():
+    """
+    Test that importing lightweight classes does not pull in httpx.
+    """
+    loaded = _loaded_after("from skaler import APIProvider, ProxyPool")
+
+    assert "httpx" not in loaded
+    assert "redis" not in loaded
+
+
+def test_lazy_attributes_resolve():
+    """
+    Test that lazily exported names resolve to the real classes.
+    """
+    from skaler.core.manager import SkaleManager
+
+    assert skaler.SkaleManager is SkaleManager
+    assert set(skaler.__all__) <= set(dir(skaler))
+
+
+def test_all_lists_every_lazy_name():
+    """
+    Test that each package's literal __all__ matches its lazy exports, so
+    the two cannot drift apart.
+    """
+    import skaler.backend
+    import skaler.http
+
+    for package in (skaler, skaler.backend, skaler.http):
+        assert sorted(package.__all__) == sorted(package._LAZY)
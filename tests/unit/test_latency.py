@@ -0,0 +1,66 @@
+import pytest
+
+from skaler.core.latency import LatencyTracker
+
+
+def test_moving_average_weights_recent_samples():
+    """
+    Test that the first sample seeds the average and later samples move
+    it by 'alpha'.
+    """
+    tracker = LatencyTracker(alpha=0.5)
+    assert tracker.average("p1") is None
+
+    tracker.observe("p1", 1.0)
+    assert tracker.average("p1") == 1.0
+    tracker.observe("p1", 3.0)
+    assert tracker.average("p1") == 2.0
+
+
+def test_percentiles_use_the_recent_window():
+    """
+    Test nearest-rank percentiles over the last 'window' samples.
+    """
+    tracker = LatencyTracker(window=10)
+    assert tracker.percentile("p1", 50) is None
+
+    for ms in range(100):
+        tracker.observe("p1", ms / 1000)
+
+    # Only samples 90..99 are kept
+    assert tracker.percentile("p1", 0) == pytest.approx(0.090)
+    assert tracker.percentile("p1", 50) == pytest.approx(0.095)
+    assert tracker.percentile("p1", 100) == pytest.approx(0.099)
+
+
+def test_least_recently_observed_keys_are_dropped():
+    """
+    Test that the tracker keeps at most 'max_keys' keys, dropping the one
+    observed longest ago.
+    """
+    tracker = LatencyTracker(max_keys=2)
+    tracker.observe("a", 0.1)
+    tracker.observe("b", 0.1)
+    tracker.observe("a", 0.1)
+    tracker.observe("c", 0.1)
+
+    assert len(tracker) == 2
+    assert tracker.average("b") is None
+    assert tracker.average("a") is not None
+    assert tracker.percentile("b", 50) is None
+
+
+def test_forget_provider_drops_its_pairs():
+    """
+    Test that forgetting a provider also drops its provider/proxy pairs.
+    """
+    tracker = LatencyTracker()
+    tracker.observe("p1", 0.1)
+    tracker.observe(("p1", "http://proxy1"), 0.1)
+    tracker.observe(("p2", "http://proxy1"), 0.1)
+
+    tracker.forget_provider("p1")
+
+    assert tracker.average("p1") is None
+    assert tracker.average(("p1", "http://proxy1")) is None
+    assert tracker.average(("p2", "http://proxy1")) == 0.1
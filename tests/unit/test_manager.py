@@ -1,9 +1,24 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
-from skaler import APIProvider, ProxyPool, Requester, SkaleManager
+from skaler import (
+    APIProvider,
+    ConfigWatcher,
+    HeaderAuth,
+    ProxyPool,
+    ProxyProber,
+    QueryParamAuth,
+    RequestAdapter,
+    Requester,
+    RequestPipeline,
+    SkaleManager,
+)
+from skaler.backend import InMemoryBackend
+from skaler.core.circuit_breaker import CircuitBreakerRegistry
+from skaler.core.manager import ROUTE_SAMPLE
 from skaler.exceptions import NoAvailableProviders, RequestFailed
 
 
@@ -24,6 +39,8 @@ async def test_send_request_success():
     provider.is_available.return_value = True
     provider.key = "test-key"
     provider.name = "TestProvider"
+    provider.auth_headers = {"Authorization": "Bearer test-key"}
+    provider.auth_params = {}
     provider.record_usage = AsyncMock()
     provider.block = AsyncMock()
 
@@ -56,9 +73,11 @@ async def test_send_request_success():
         method="GET",
         url="https://example.com",
         headers={"Authorization": "Bearer test-key"},
+        params=None,
         json=None,
+        content=None,
         proxy="http://fake-proxy",
-        timeout=10,
+        timeout=None,
     )
 
 @pytest.mark.asyncio
@@ -77,6 +96,8 @@ async def test_send_request_fails_and_blocks_provider():
     provider.is_available.return_value = True
     provider.key= "bad-key"
     provider.name = "FailProvider"
+    provider.auth_headers = {"Authorization": "Bearer bad-key"}
+    provider.auth_params = {}
     provider.record_usage = AsyncMock()
     provider.block = AsyncMock()
 
@@ -120,3 +141,601 @@ async def test_no_available_providers():
             "GET",
             "https://example.com"
         )
+
+
+@pytest.mark.asyncio
+async def test_send_request_does_not_mutate_caller_headers():
+    """
+    Test that provider auth headers are merged into a copy of the caller's
+    headers, so keys never leak between calls or providers.
+    """
+
+    provider = APIProvider(name="p1", key="sk-1", limit_per_minute=10)
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+
+    manager = SkaleManager(providers=[provider], requester=requester)
+
+    headers = {"X-Trace": "abc"}
+    await manager.send_request("GET", "https://example.com", headers=headers)
+
+    assert headers == {"X-Trace": "abc"}
+    assert requester.send.await_args.kwargs["headers"] == {
+        "X-Trace": "abc",
+        "Authorization": "Bearer sk-1",
+    }
+
+    # Caller credentials are replaced whatever their case, also once JSON
+    # encoding has lowercased them
+    requester.encode_json.side_effect = Requester().encode_json
+    for stale in ({"authorization": "Bearer stale"},
+                  {"Authorization": "Bearer stale"}):
+        await manager.send_request(
+            "POST", "https://example.com", headers=stale, data={"a": 1}
+        )
+        sent = httpx.Headers(requester.send.await_args.kwargs["headers"])
+        assert sent.get_list("authorization") == ["Bearer sk-1"]
+
+    # Without caller headers the provider's pre-built mapping is reused
+    await manager.send_request("GET", "https://example.com")
+    assert requester.send.await_args.kwargs["headers"] is provider.auth_headers
+
+
+@pytest.mark.asyncio
+async def test_send_request_with_custom_auth_schemes():
+    """
+    Test that header and query parameter auth schemes are applied, and that
+    a pre-serialized body is passed through untouched.
+    """
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+
+    header_provider = APIProvider(
+        name="claude", key="sk-ant", limit_per_minute=10, auth=HeaderAuth()
+    )
+    manager = SkaleManager(providers=[header_provider], requester=requester)
+    await manager.send_request(
+        "POST", "https://example.com", content=b'{"a":1}'
+    )
+
+    kwargs = requester.send.await_args.kwargs
+    assert kwargs["headers"] == {"x-api-key": "sk-ant"}
+    assert kwargs["params"] is None
+    assert kwargs["content"] == b'{"a":1}'
+
+    query_provider = APIProvider(
+        name="gemini", key="g-key", limit_per_minute=10, auth=QueryParamAuth()
+    )
+    manager = SkaleManager(providers=[query_provider], requester=requester)
+    await manager.send_request("GET", "https://example.com")
+
+    kwargs = requester.send.await_args.kwargs
+    assert kwargs["headers"] is None
+    assert kwargs["params"] == {"key": "g-key"}
+
+
+@pytest.mark.asyncio
+async def test_providers_rotate_and_can_be_changed_at_runtime():
+    """
+    Test that providers are used in weighted rotation and can be added,
+    reweighted and removed between requests.
+    """
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+
+    p1 = APIProvider(name="p1", key="k1", limit_per_minute=100)
+    p2 = APIProvider(name="p2", key="k2", limit_per_minute=100)
+    manager = SkaleManager(providers=[p1, p2], requester=requester)
+
+    async def used():
+        await manager.send_request("GET", "https://example.com")
+        return requester.send.await_args.kwargs["headers"]["Authorization"]
+
+    assert [await used() for _ in range(2)] == ["Bearer k1", "Bearer k2"]
+
+    manager.add_provider(
+        APIProvider(name="p3", key="k3", limit_per_minute=100), weight=2
+    )
+    assert [await used() for _ in range(4)] == [
+        "Bearer k1", "Bearer k2", "Bearer k3", "Bearer k3"
+    ]
+
+    await manager.remove_provider("p2")
+    assert [p.name for p in manager.providers] == ["p1", "p3"]
+
+
+@pytest.mark.asyncio
+async def test_remove_provider_drains_in_flight_requests():
+    """
+    Test that removing a provider stops new requests from using it right
+    away and waits for its in-flight requests to finish.
+    """
+    release = asyncio.Event()
+
+    async def slow_send(**kwargs):
+        await release.wait()
+        return httpx.Response(200)
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = slow_send
+
+    provider = APIProvider(name="p1", key="k1", limit_per_minute=100)
+    manager = SkaleManager(providers=[provider], requester=requester)
+
+    in_flight = asyncio.create_task(
+        manager.send_request("GET", "https://example.com")
+    )
+    await asyncio.sleep(0)
+
+    removal = asyncio.create_task(manager.remove_provider("p1"))
+    await asyncio.sleep(0)
+    assert not removal.done()
+
+    with pytest.raises(NoAvailableProviders):
+        await manager.send_request("GET", "https://example.com")
+
+    release.set()
+    assert (await in_flight).status_code == 200
+    assert await removal is provider
+
+
+@pytest.mark.asyncio
+async def test_remove_proxy_closes_its_client():
+    """
+    Test that a removed proxy is no longer selected and its client is
+    closed once drained.
+    """
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+    manager = SkaleManager(requester=requester)
+
+    manager.add_proxy("http://proxy1")
+    await manager.send_request("GET", "https://example.com")
+    assert requester.send.await_args.kwargs["proxy"] == "http://proxy1"
+
+    await manager.remove_proxy("http://proxy1")
+    requester.close_proxy.assert_awaited_once_with("http://proxy1")
+
+    await manager.send_request("GET", "https://example.com")
+    assert requester.send.await_args.kwargs["proxy"] is None
+
+
+@pytest.mark.asyncio
+async def test_unserializable_payload_does_not_block_provider():
+    """
+    Test that a payload which cannot be serialized raises to the caller
+    before a provider is picked, leaving the provider available.
+    """
+    provider = APIProvider(name="p1", key="k1", limit_per_minute=10)
+    requester = Requester()
+    requester.send = AsyncMock(return_value=httpx.Response(200))
+    manager = SkaleManager(providers=[provider], requester=requester)
+
+    with pytest.raises(TypeError):
+        await manager.send_request(
+            "POST", "https://example.com", data={"when": object()}
+        )
+
+    requester.send.assert_not_awaited()
+    assert await provider.is_available() is True
+
+    await manager.send_request(
+        "POST", "https://example.com", headers={"X-Trace": "abc"},
+        data={1: "a"}
+    )
+    kwargs = requester.send.await_args.kwargs
+    assert kwargs["content"] == b'{"1":"a"}'
+    assert kwargs["headers"]["content-type"] == "application/json"
+    assert kwargs["headers"]["Authorization"] == "Bearer k1"
+
+
+@pytest.mark.asyncio
+async def test_remove_proxy_without_drain_closes_client_when_idle():
+    """
+    Test that removing a proxy without draining still closes its client,
+    in the background once its last request finishes.
+    """
+    release = asyncio.Event()
+
+    async def slow_send(**kwargs):
+        await release.wait()
+        return httpx.Response(200)
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = slow_send
+    manager = SkaleManager(requester=requester)
+    manager.add_proxy("http://proxy1")
+
+    in_flight = asyncio.create_task(
+        manager.send_request("GET", "https://example.com")
+    )
+    await asyncio.sleep(0)
+    await manager.remove_proxy("http://proxy1", drain=False)
+    requester.close_proxy.assert_not_awaited()
+
+    release.set()
+    await in_flight
+    await asyncio.sleep(0)
+    requester.close_proxy.assert_awaited_once_with("http://proxy1")
+
+    with pytest.raises(KeyError):
+        manager.reweight_proxy("http://proxy1", 2)
+    with pytest.raises(KeyError):
+        SkaleManager(requester=requester).reweight_proxy("http://proxy1", 2)
+
+
+class Renamed(RequestAdapter):
+    """
+    Moves requests to '/v2' and wraps the payload, for routing tests.
+    """
+
+    def adapt(self, path, headers, data):
+        return "/v2" + path, headers, {"wrapped": data}
+
+
+def _routing_manager(*providers, **kwargs):
+    requester = Requester()
+    requester.send = AsyncMock(return_value=httpx.Response(200))
+    return SkaleManager(
+        providers=list(providers), requester=requester, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_paths_are_routed_to_capable_providers():
+    """
+    Test that a request to a path goes to a provider with a base URL and
+    the requested capability, using that provider's auth and adapter.
+    """
+    plain = APIProvider(name="plain", key="k0", limit_per_minute=10)
+    embed = APIProvider(
+        name="embed", key="k1", limit_per_minute=10,
+        base_url="https://one.example", capabilities={"embeddings"}
+    )
+    chat = APIProvider(
+        name="chat", key="k2", limit_per_minute=10,
+        auth=HeaderAuth("x-api-key"), base_url="https://two.example/",
+        adapter=Renamed(), capabilities={"chat"}
+    )
+    manager = _routing_manager(plain, embed, chat)
+
+    await manager.send_request(
+        "POST", "/chat", data={"q": 1}, capability="chat"
+    )
+    kwargs = manager.requester.send.await_args.kwargs
+    assert kwargs["url"] == "https://two.example/v2/chat"
+    assert kwargs["content"] == b'{"wrapped":{"q":1}}'
+    assert kwargs["headers"]["x-api-key"] == "k2"
+
+    await manager.send_request("GET", "/anything")
+    assert manager.requester.send.await_args.kwargs["url"].startswith(
+        ("https://one.example", "https://two.example")
+    )
+
+    with pytest.raises(NoAvailableProviders):
+        await manager.send_request("GET", "/audio", capability="audio")
+
+
+@pytest.mark.asyncio
+async def test_routing_prefers_cheap_providers_until_their_quota_fills():
+    """
+    Test that routed requests favour the cheaper provider and spill over to
+    the expensive one as the cheap provider's quota runs out.
+    """
+    cheap = APIProvider(
+        name="cheap", key="k1", limit_per_minute=4,
+        base_url="https://cheap.example", cost=1.0
+    )
+    pricey = APIProvider(
+        name="pricey", key="k2", limit_per_minute=4,
+        base_url="https://pricey.example", cost=2.0
+    )
+    manager = _routing_manager(pricey, cheap)
+
+    hosts = []
+    for _ in range(8):
+        await manager.send_request("GET", "/x")
+        url = manager.requester.send.await_args.kwargs["url"]
+        hosts.append(httpx.URL(url).host)
+
+    assert hosts[0] == "cheap.example"
+    assert hosts.count("cheap.example") == 4
+    assert hosts.count("pricey.example") == 4
+    with pytest.raises(NoAvailableProviders):
+        await manager.send_request("GET", "/x")
+
+
+@pytest.mark.asyncio
+async def test_managers_do_not_share_default_backends():
+    """
+    Test that providers created without a backend share their manager's
+    backend, while a second manager with a same-named key keeps its own
+    quota and blocks.
+    """
+    first = APIProvider(name="key", key="k1", limit_per_minute=1)
+    second = APIProvider(name="key", key="k1", limit_per_minute=1)
+    other = APIProvider(name="other", key="k2", limit_per_minute=1)
+    own = InMemoryBackend()
+    pinned = APIProvider(name="pinned", key="k3", limit_per_minute=1,
+                         backend=own)
+    one = SkaleManager(
+        providers=[first, other], requester=AsyncMock(spec=Requester)
+    )
+    two = SkaleManager(
+        providers=[second], requester=AsyncMock(spec=Requester)
+    )
+    one.add_provider(pinned)
+
+    assert first.backend is other.backend is one.backend
+    assert second.backend is two.backend is not one.backend
+    assert pinned.backend is own
+
+    await first.record_usage()
+    await first.block(60)
+    assert await first.is_available() is False
+    assert await second.is_available() is True
+
+
+class FlakyBackend(InMemoryBackend):
+    """
+    Fails the next reservation, like a backend losing its connection.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.fail = True
+
+    async def try_reserve(self, provider_name, limit):
+        if self.fail:
+            self.fail = False
+            raise ConnectionError("backend unavailable")
+        return await super().try_reserve(provider_name, limit)
+
+
+@pytest.mark.asyncio
+async def test_routed_probe_is_released_when_reservation_fails():
+    """
+    Test that a half-open probe admitted for a routed request is released
+    when reserving quota raises, so the next request can probe the host.
+    """
+    provider = APIProvider(
+        name="p", key="k", limit_per_minute=10,
+        base_url="https://one.example", backend=FlakyBackend()
+    )
+    manager = _routing_manager(
+        provider, breakers=CircuitBreakerRegistry(recovery_timeout=0)
+    )
+    breaker = manager.breakers.get("https://one.example/x")
+    breaker.record_failure()
+    breaker.state = breaker.OPEN
+
+    with pytest.raises(ConnectionError):
+        await manager.send_request("GET", "/x")
+    assert breaker.state == breaker.HALF_OPEN
+
+    await manager.send_request("GET", "/x")
+    assert breaker.state == breaker.CLOSED
+
+
+class CountingBackend(InMemoryBackend):
+    """
+    Records which providers' usage is looked up.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.checked = []
+
+    async def get_usage(self, provider_name):
+        self.checked.append(provider_name)
+        return await super().get_usage(provider_name)
+
+
+@pytest.mark.asyncio
+async def test_routing_checks_quota_on_a_bounded_sample():
+    """
+    Test that a routed request looks at the quota of one sample of
+    providers, not the whole fleet, and moves on to the next sample only
+    when the first has no quota left.
+    """
+    fleet = [
+        APIProvider(
+            name=f"key-{i}", key=f"k{i}", limit_per_minute=1,
+            base_url="https://one.example"
+        )
+        for i in range(ROUTE_SAMPLE * 4)
+    ]
+    backend = CountingBackend()
+    manager = _routing_manager(*fleet, backend=backend)
+    checked = backend.checked
+
+    await manager.send_request("GET", "/x")
+    assert len(checked) == ROUTE_SAMPLE
+
+    # The rotation moved past key-0; use up the sample that follows it
+    for provider in fleet[1:ROUTE_SAMPLE + 1]:
+        await provider.record_usage()
+    checked.clear()
+    await manager.send_request("GET", "/x")
+    assert len(checked) == 2 * ROUTE_SAMPLE
+
+
+@pytest.mark.asyncio
+async def test_routing_prefers_faster_providers_at_equal_cost():
+    """
+    Test that observed latency steers routed requests towards the faster
+    of two equally priced providers.
+    """
+    slow = APIProvider(
+        name="slow", key="k1", limit_per_minute=100,
+        base_url="https://slow.example"
+    )
+    fast = APIProvider(
+        name="fast", key="k2", limit_per_minute=100,
+        base_url="https://fast.example"
+    )
+    manager = _routing_manager(slow, fast, exploration=0)
+    manager.latency.observe("slow", 0.5)
+    manager.latency.observe("fast", 0.05)
+
+    await manager.send_request("GET", "/x")
+    url = manager.requester.send.await_args.kwargs["url"]
+    assert httpx.URL(url).host == "fast.example"
+
+
+@pytest.mark.asyncio
+async def test_latency_aware_selection_prefers_fast_providers_within_quota():
+    """
+    Test that a latency-aware manager sends full-URL requests to the
+    fastest provider until its quota is used up, then to the next one.
+    """
+    slow = APIProvider(name="slow", key="k1", limit_per_minute=10)
+    fast = APIProvider(name="fast", key="k2", limit_per_minute=2)
+    manager = _routing_manager(
+        slow, fast, latency_aware=True, exploration=0
+    )
+    manager.latency.observe("slow", 0.5)
+    manager.latency.observe("fast", 0.05)
+
+    used = []
+    for _ in range(4):
+        await manager.send_request("GET", "https://example.com")
+        headers = manager.requester.send.await_args.kwargs["headers"]
+        used.append(headers["Authorization"])
+
+    assert used == ["Bearer k2", "Bearer k2", "Bearer k1", "Bearer k1"]
+
+
+@pytest.mark.asyncio
+async def test_latency_aware_selection_compares_providers_in_pairs():
+    """
+    Test that a latency-aware manager takes the rotation two providers
+    at a time and sends each request to the faster of the pair.
+    """
+    fleet = [
+        APIProvider(name=name, key=name, limit_per_minute=10)
+        for name in ("slow1", "fast1", "slow2", "fast2")
+    ]
+    manager = _routing_manager(*fleet, latency_aware=True, exploration=0)
+    for provider in fleet:
+        speed = 0.05 if provider.name.startswith("fast") else 0.5
+        manager.latency.observe(provider.name, speed)
+
+    used = []
+    for _ in range(4):
+        await manager.send_request("GET", "https://example.com")
+        headers = manager.requester.send.await_args.kwargs["headers"]
+        used.append(headers["Authorization"])
+
+    assert used == [
+        "Bearer fast1", "Bearer fast2", "Bearer fast1", "Bearer fast2"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_exploration_keeps_the_rotation():
+    """
+    Test that exploring requests ignore latency and follow the rotation,
+    so slow providers keep being measured.
+    """
+    slow = APIProvider(name="slow", key="k1", limit_per_minute=10)
+    fast = APIProvider(name="fast", key="k2", limit_per_minute=10)
+    manager = _routing_manager(
+        slow, fast, latency_aware=True, exploration=1
+    )
+    manager.latency.observe("slow", 0.5)
+    manager.latency.observe("fast", 0.05)
+
+    used = []
+    for _ in range(4):
+        await manager.send_request("GET", "https://example.com")
+        headers = manager.requester.send.await_args.kwargs["headers"]
+        used.append(headers["Authorization"])
+
+    assert used == ["Bearer k1", "Bearer k2", "Bearer k1", "Bearer k2"]
+
+
+@pytest.mark.asyncio
+async def test_latency_aware_selection_prefers_fast_proxy_pairs():
+    """
+    Test that each provider is sent through the proxy that has been
+    fastest for it, and that pairs are measured from real requests.
+    """
+    provider = APIProvider(name="p1", key="k1", limit_per_minute=100)
+    manager = _routing_manager(
+        provider, latency_aware=True, exploration=0
+    )
+    manager.add_proxy("http://proxy1")
+    manager.add_proxy("http://proxy2")
+    manager.latency.observe(("p1", "http://proxy1"), 0.5)
+    manager.latency.observe(("p1", "http://proxy2"), 0.05)
+
+    for _ in range(4):
+        await manager.send_request("GET", "https://example.com")
+        proxy = manager.requester.send.await_args.kwargs["proxy"]
+        assert proxy == "http://proxy2"
+
+    assert manager.latency.average(("p1", "http://proxy2")) < 0.05
+    assert manager.latency.percentile("p1", 50) is not None
+
+
+@pytest.mark.asyncio
+async def test_aclose_shuts_everything_down(tmp_path):
+    """
+    Test that leaving the manager's context stops attached services and
+    background tasks, closes the requester and provider backends, and
+    rejects new requests.
+    """
+    release = asyncio.Event()
+
+    async def slow_send(**kwargs):
+        await release.wait()
+        return httpx.Response(200)
+
+    backend = AsyncMock()
+    backend.is_provider_blocked.return_value = False
+    backend.get_usage.return_value = 0
+    backend.try_reserve.return_value = True
+    provider = APIProvider(
+        name="p1", key="k1", limit_per_minute=10, backend=backend
+    )
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = slow_send
+
+    async with SkaleManager(
+        providers=[provider], requester=requester
+    ) as manager:
+        manager.add_proxy("http://proxy1")
+        prober = ProxyProber(manager, interval=60)
+        prober.start()
+        watcher = ConfigWatcher(manager, str(tmp_path / "missing.json"))
+        watcher.start()
+        pipeline = RequestPipeline(manager, workers=2)
+        pipeline.start()
+
+        in_flight = asyncio.create_task(
+            manager.send_request("GET", "https://example.com")
+        )
+        await asyncio.sleep(0)
+        # Its client is closed in the background once the request ends
+        await manager.remove_proxy("http://proxy1", drain=False)
+        assert manager._closing
+
+    assert manager.closed
+    assert prober._task is None
+    assert watcher._task is None
+    assert not pipeline._tasks
+    assert not manager._closing
+    requester.aclose.assert_awaited_once()
+    backend.aclose.assert_awaited_once()
+
+    with pytest.raises(RuntimeError):
+        await manager.send_request("GET", "https://example.com")
+    with pytest.raises(RuntimeError):
+        await pipeline.put("GET", "https://example.com")
+
+    release.set()
+    await in_flight
+    await manager.aclose()
+    requester.aclose.assert_awaited_once()
@@ -74,3 +74,33 @@ async def test_is_provider_blocked_returns_false_if_not_blocked():
     backend = InMemoryBackend()
     blocked = await backend.is_provider_blocked("unknown_provider")
     assert blocked is False
+
+
+@pytest.mark.asyncio
+async def test_decrement_usage():
+    """
+    Test that decrement_usage gives back one unit of usage and drops the
+    counter once it reaches zero.
+    """
+    backend = InMemoryBackend()
+    await backend.increment_usage("provider1")
+    await backend.increment_usage("provider1")
+
+    await backend.decrement_usage("provider1")
+    assert await backend.get_usage("provider1") == 1
+
+    await backend.decrement_usage("provider1")
+    assert "provider1" not in backend.usage
+
+
+@pytest.mark.asyncio
+async def test_try_reserve_respects_limit():
+    """
+    Test that try_reserve records usage only while under the limit.
+    """
+    backend = InMemoryBackend()
+
+    assert await backend.try_reserve("provider1", 2) is True
+    assert await backend.try_reserve("provider1", 2) is True
+    assert await backend.try_reserve("provider1", 2) is False
+    assert await backend.get_usage("provider1") == 2
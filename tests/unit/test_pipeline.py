@@ -0,0 +1,215 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from skaler import APIProvider, Requester, RequestPipeline, SkaleManager
+from skaler.backend import InMemoryBackend
+from skaler.exceptions import NoAvailableProviders
+
+
+@pytest.mark.asyncio
+async def test_results_are_iterated_with_their_tags():
+    """
+    Test that every enqueued request produces exactly one tagged result
+    and iteration ends after 'stop()'.
+    """
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = [
+        httpx.Response(200), httpx.ConnectError("refused"), httpx.Response(200)
+    ]
+    manager = SkaleManager(requester=requester)
+    pipeline = RequestPipeline(manager, workers=2)
+    pipeline.start()
+
+    for offset in range(3):
+        await pipeline.put("GET", "https://example.com", tag=offset)
+    await pipeline.stop()
+
+    results = [result async for result in pipeline]
+    assert sorted(result.tag for result in results) == [0, 1, 2]
+    assert sum(result.ok for result in results) == 2
+    with pytest.raises(RuntimeError):
+        await pipeline.put("GET", "https://example.com")
+
+
+@pytest.mark.asyncio
+async def test_put_blocks_when_queue_is_full():
+    """
+    Test that producers are held back once the workers are busy and the
+    input queue is full.
+    """
+    release = asyncio.Event()
+
+    async def slow_send(**kwargs):
+        await release.wait()
+        return httpx.Response(200)
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = slow_send
+    manager = SkaleManager(requester=requester)
+    pipeline = RequestPipeline(manager, workers=1, maxsize=1)
+    pipeline.start()
+
+    await pipeline.put("GET", "https://example.com")  # Taken by the worker
+    await asyncio.sleep(0)
+    await pipeline.put("GET", "https://example.com")  # Fills the queue
+    blocked = asyncio.create_task(pipeline.put("GET", "https://example.com"))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await pipeline.stop()  # Nobody reads results; must not deadlock
+    assert requester.send.await_count == 3
+    assert len([result async for result in pipeline]) == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_without_drain_drops_queue_and_releases_producers():
+    """
+    Test that stopping without draining cancels in-flight requests, drops
+    queued ones and fails producers waiting for room.
+    """
+    async def hang(**kwargs):
+        await asyncio.sleep(10)
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = hang
+    manager = SkaleManager(requester=requester)
+    pipeline = RequestPipeline(manager, workers=1, maxsize=1)
+    pipeline.start()
+
+    await pipeline.put("GET", "https://example.com")
+    await asyncio.sleep(0)
+    await pipeline.put("GET", "https://example.com")
+    blocked = asyncio.create_task(pipeline.put("GET", "https://example.com"))
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(pipeline.stop(drain=False), 1.0)
+
+    with pytest.raises(RuntimeError):
+        await blocked
+    await asyncio.wait_for(pipeline.join(), 1.0)
+    assert [result async for result in pipeline] == []
+    assert manager._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_workers_wait_for_provider_quota():
+    """
+    Test that requests beyond the providers' quota wait for it to free up
+    instead of failing with NoAvailableProviders.
+    """
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+    provider = APIProvider(name="p1", key="k1", limit_per_minute=2)
+    manager = SkaleManager(providers=[provider], requester=requester)
+
+    results = []
+    pipeline = RequestPipeline(manager, workers=4, on_result=results.append)
+    pipeline.start()
+    for tag in range(4):
+        await pipeline.put("GET", "https://example.com", tag=tag)
+
+    await asyncio.sleep(0.1)
+    assert len(results) == 2
+
+    await provider.backend.reset_usage("p1")  # A new rate limit window
+    await asyncio.wait_for(pipeline.join(), 1.0)
+    await pipeline.stop()
+
+    assert len(results) == 4
+    assert all(result.ok for result in results)
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_one_poller():
+    """
+    Test that many tasks waiting for quota cost one poll per interval
+    rather than one per waiter, and all wake when quota frees up.
+    """
+    checks = 0
+
+    class CountingBackend(InMemoryBackend):
+        async def get_usage(self, provider_name):
+            nonlocal checks
+            checks += 1
+            return await super().get_usage(provider_name)
+
+    provider = APIProvider(
+        name="p1", key="k1", limit_per_minute=1, backend=CountingBackend()
+    )
+    await provider.record_usage()
+    manager = SkaleManager(providers=[provider], requester=AsyncMock())
+
+    waiters = [
+        asyncio.create_task(manager.wait_for_provider()) for _ in range(50)
+    ]
+    await asyncio.sleep(0.25)
+    assert checks < 50 + 20  # Initial checks plus a handful of polls
+
+    await provider.backend.reset_usage("p1")
+    await asyncio.wait_for(asyncio.gather(*waiters), 1.0)
+
+
+@pytest.mark.asyncio
+async def test_unservable_requests_fail_without_stalling_workers():
+    """
+    Test that requests no provider can ever serve get an error result
+    instead of holding a worker forever.
+    """
+    provider = APIProvider(name="p1", key="k1", limit_per_minute=10)
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+    manager = SkaleManager(providers=[provider], requester=requester)
+    pipeline = RequestPipeline(manager, workers=2)
+    pipeline.start()
+
+    await pipeline.put("GET", "/v1/chat", tag="no base_url")
+    await pipeline.put(
+        "GET", "https://example.com", tag="no capability",
+        capability="audio"
+    )
+    await pipeline.put("GET", "https://example.com", tag="ok")
+    await asyncio.wait_for(pipeline.join(), 1)
+    await pipeline.stop()
+
+    results = {result.tag: result async for result in pipeline}
+    assert results["ok"].ok
+    for tag in ("no base_url", "no capability"):
+        assert isinstance(results[tag].error, NoAvailableProviders)
+
+
+@pytest.mark.asyncio
+async def test_failing_on_result_does_not_kill_workers():
+    """
+    Test that an exception from 'on_result' is reported to the event
+    loop and the worker keeps going.
+    """
+    requester = AsyncMock(spec=Requester)
+    requester.send.return_value = httpx.Response(200)
+    manager = SkaleManager(requester=requester)
+    seen = []
+
+    def on_result(result):
+        seen.append(result.tag)
+        raise ValueError("bad sink")
+
+    reported = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: reported.append(context))
+    try:
+        pipeline = RequestPipeline(manager, workers=1, on_result=on_result)
+        pipeline.start()
+        for tag in range(3):
+            await pipeline.put("GET", "https://example.com", tag=tag)
+        await asyncio.wait_for(pipeline.join(), 1)
+        await pipeline.stop()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert seen == [0, 1, 2]
+    assert len(reported) == 3
+    assert isinstance(reported[0]["exception"], ValueError)
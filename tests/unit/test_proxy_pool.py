@@ -85,3 +85,111 @@ async def test_get_next_returns_none_when_all_blocked(monkeypatch):
     pool.block("proxy2", ttl=60)
 
     assert pool.get_next() is None
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_during_rotation():
+    """
+    Test that proxies can be added and removed mid-rotation without
+    breaking round-robin order.
+    """
+    pool = ProxyPool(["proxy1", "proxy2", "proxy3"])
+
+    assert pool.get_next() == "proxy1"
+    pool.remove("proxy2")
+    assert pool.get_next() == "proxy3"
+
+    pool.add("proxy4")
+    assert pool.get_next() == "proxy1"
+    assert pool.get_next() == "proxy3"
+    assert pool.get_next() == "proxy4"
+
+    assert len(pool) == 3
+    assert "proxy2" not in pool
+
+    with pytest.raises(KeyError):
+        pool.remove("proxy2")
+
+
+@pytest.mark.asyncio
+async def test_remove_last_proxy():
+    """
+    Test that removing every proxy leaves an empty, usable pool.
+    """
+    pool = ProxyPool(["proxy1"])
+    pool.remove("proxy1")
+
+    assert pool.get_next() is None
+    pool.add("proxy2")
+    assert pool.get_next() == "proxy2"
+
+
+@pytest.mark.asyncio
+async def test_weighted_rotation():
+    """
+    Test that a proxy with weight n is picked n times in a row.
+    """
+    pool = ProxyPool(["proxy1", "proxy2"])
+    pool.reweight("proxy1", 3)
+
+    picks = [pool.get_next() for _ in range(8)]
+    assert picks == ["proxy1"] * 3 + ["proxy2"] + ["proxy1"] * 3 + ["proxy2"]
+
+    with pytest.raises(ValueError):
+        pool.reweight("proxy1", 0)
+
+
+@pytest.mark.asyncio
+async def test_readded_proxy_starts_with_fresh_state():
+    """
+    Test that a proxy re-added after removal does not inherit the block,
+    latency or weight of the proxy whose slot it reuses.
+    """
+    pool = ProxyPool(["proxy1", "proxy2"])
+    pool.reweight("proxy1", 3)
+    pool.set_latency("proxy1", 0.5)
+    pool.block("proxy1", ttl=60)
+    pool.remove("proxy1")
+
+    pool.add("proxy3")
+    assert pool.weight("proxy3") == 1
+    assert pool.latency("proxy3") is None
+    assert sorted(pool.get_next() for _ in range(2)) == ["proxy2", "proxy3"]
+
+
+@pytest.mark.asyncio
+async def test_lookups_survive_growth_and_removal():
+    """
+    Test that every proxy stays reachable by URL while the pool grows past
+    its index size and proxies are removed from the middle of probe runs.
+    """
+    urls = [f"http://proxy{i}.example:8080" for i in range(500)]
+    pool = ProxyPool(urls)
+    for url in urls[::3]:
+        pool.remove(url)
+
+    kept = [url for i, url in enumerate(urls) if i % 3]
+    assert all(url in pool for url in kept)
+    assert not any(url in pool for url in urls[::3])
+    assert sorted(pool.proxies) == sorted(kept)
+
+    for url in urls[::3]:
+        pool.add(url, weight=2)
+    assert all(pool.weight(url) == 2 for url in urls[::3])
+    assert all(pool.weight(url) == 1 for url in kept)
+    assert len(pool) == len(urls)
+
+
+@pytest.mark.asyncio
+async def test_weight_out_of_range_is_rejected():
+    """
+    Test that weights and boosts must fit the pool's per-proxy storage.
+    """
+    pool = ProxyPool(["proxy1"])
+    with pytest.raises(ValueError):
+        pool.add("proxy2", weight=0)
+    with pytest.raises(ValueError):
+        pool.reweight("proxy1", 70000)
+    with pytest.raises(ValueError):
+        pool.boost("proxy1", 70000)
+    assert "proxy2" not in pool
@@ -0,0 +1,116 @@
+import asyncio
+import socket
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from skaler import ProxyPool, ProxyProber, Requester, SkaleManager
+
+
+def _dead_port() -> int:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+@pytest_asyncio.fixture
+async def live_proxy():
+    server = await asyncio.start_server(
+        lambda reader, writer: writer.close(), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_probe_blocks_dead_proxies_and_ranks_live_ones(live_proxy):
+    """
+    Test that a proxy refusing connections is blocked, a live one records
+    a latency, and a recovered proxy is unblocked on the next round.
+    """
+    dead = f"http://127.0.0.1:{_dead_port()}"
+    pool = ProxyPool([dead, live_proxy])
+    manager = SkaleManager(proxies=pool, requester=AsyncMock(spec=Requester))
+    prober = ProxyProber(manager, timeout=1.0)
+
+    results = await prober.probe()
+
+    assert results[dead] is None
+    assert results[live_proxy] is not None
+    assert pool.latency(live_proxy) == results[live_proxy]
+    assert pool.ranked() == [live_proxy]
+    assert pool.get_next() == live_proxy
+    assert pool.get_next() == live_proxy
+
+    pool.block(live_proxy)  # e.g. after a transient proxy error
+    await prober.probe()
+    assert pool.ranked() == [live_proxy]
+
+
+@pytest.mark.asyncio
+async def test_probe_fails_proxies_banned_on_test_url(live_proxy):
+    """
+    Test that an error status from the test URL fails the check and that
+    healthy proxies are pre-warmed through their own client.
+    """
+    other = live_proxy.replace("127.0.0.1", "localhost")
+    pool = ProxyPool([live_proxy, other])
+
+    async def send(method, url, proxy, timeout):
+        if method == "GET" and proxy == other:
+            return httpx.Response(403)
+        return httpx.Response(200)
+
+    requester = AsyncMock(spec=Requester)
+    requester.send.side_effect = send
+    manager = SkaleManager(proxies=pool, requester=requester)
+    prober = ProxyProber(
+        manager,
+        test_url="https://example.com/health",
+        warm_urls=["https://api.example.com"]
+    )
+
+    results = await prober.probe()
+
+    assert results[other] is None
+    assert pool.ranked() == [live_proxy]
+    requester.send.assert_any_await(
+        method="HEAD", url="https://api.example.com",
+        proxy=live_proxy, timeout=prober.timeout
+    )
+    warmed = [c.kwargs["proxy"] for c in requester.send.await_args_list
+              if c.kwargs["method"] == "HEAD"]
+    assert warmed == [live_proxy]
+
+
+@pytest.mark.asyncio
+async def test_probe_reweights_by_speed(monkeypatch):
+    """
+    Test that proxies are boosted in proportion to their speed relative
+    to the fastest one when 'max_weight' is set, on top of configured
+    weights.
+    """
+    pool = ProxyPool(["http://fast", "http://slow"])
+    pool.reweight("http://slow", 2)
+    manager = SkaleManager(proxies=pool, requester=AsyncMock(spec=Requester))
+    prober = ProxyProber(manager, max_weight=4)
+    latencies = {"http://fast": 0.01, "http://slow": 0.04}
+    monkeypatch.setattr(
+        prober, "check", AsyncMock(side_effect=latencies.get)
+    )
+
+    await prober.probe()
+
+    assert [pool.get_next() for _ in range(6)] == [
+        "http://fast"] * 4 + ["http://slow"] * 2
+    assert pool.weight("http://slow") == 2
+
+    pool.reweight("http://fast", 1)  # Configured weight, boost kept
+    assert pool.weight("http://fast") == 1
+    assert [pool.get_next() for _ in range(4)] == ["http://fast"] * 4
@@ -0,0 +1,160 @@
+import time
+
+import httpx
+import pytest
+
+from skaler import APIProvider
+from skaler.backend import InMemoryBackend
+from skaler.core.rate_limit import AdaptiveLimit, RateLimitInfo, parse_seconds
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("12", 12.0),
+        ("0.5", 0.5),
+        ("6m0s", 360.0),
+        ("1m30.5s", 90.5),
+        ("20ms", 0.02),
+        ("soon", None),
+    ],
+)
+def test_parse_seconds(value, expected):
+    """
+    Test that reset values in seconds and Go-style durations are parsed.
+    """
+    assert parse_seconds(value) == expected
+
+
+def test_parse_seconds_absolute_times(monkeypatch):
+    """
+    Test that epoch timestamps and RFC 3339 dates are converted to a delay
+    from now.
+    """
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
+
+    assert parse_seconds("1700000030") == 30.0
+    assert parse_seconds("2023-11-14T22:13:40Z") == 20.0
+
+
+def test_rate_limit_info_from_headers():
+    """
+    Test that OpenAI-style and generic headers are recognised.
+    """
+    openai = RateLimitInfo.from_headers(httpx.Headers({
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-remaining-requests": "499",
+        "x-ratelimit-reset-requests": "120ms",
+    }))
+    assert (openai.limit, openai.remaining, openai.reset) == (500, 499, 0.12)
+
+    generic = RateLimitInfo.from_headers(httpx.Headers({
+        "X-RateLimit-Limit": "60",
+        "X-RateLimit-Remaining": "0",
+        "Retry-After": "7",
+    }))
+    assert (generic.limit, generic.remaining) == (60, 0)
+    assert generic.retry_after == 7.0
+
+    empty = RateLimitInfo.from_headers(httpx.Headers())
+    assert empty.limit is None and empty.remaining is None
+
+
+def test_adaptive_limit_aimd():
+    """
+    Test that the limit halves on throttling and grows by about one per
+    window of successes, never above the advertised ceiling.
+    """
+    limit = AdaptiveLimit(100)
+
+    limit.on_throttled()
+    limit.on_throttled()  # Same burst, within the cooldown
+    assert limit.limit == 50
+
+    for _ in range(60):
+        limit.on_success()
+    assert limit.limit == 51
+
+    limit.on_advertised(40)
+    assert limit.limit == 40
+    for _ in range(1000):
+        limit.on_success()
+    assert limit.limit == 40
+
+
+@pytest.mark.asyncio
+async def test_provider_observe_blocks_on_429():
+    """
+    Test that a 429 blocks the provider and, for adaptive providers, cuts
+    its limit.
+    """
+    provider = APIProvider(
+        name="p1", key="sk", limit_per_minute=100, adaptive=True
+    )
+    response = httpx.Response(429, headers={"retry-after": "30"})
+
+    await provider.observe(response)
+
+    assert provider.limit == 50
+    assert await provider.is_available() is False
+
+
+@pytest.mark.asyncio
+async def test_provider_learns_advertised_limit():
+    """
+    Test that an adaptive provider adopts the limit advertised in headers
+    and a static provider keeps its configured limit.
+    """
+    headers = {"x-ratelimit-limit": "500", "x-ratelimit-remaining": "499"}
+
+    adaptive = APIProvider(name="a", key="k", limit_per_minute=60,
+                           adaptive=True)
+    await adaptive.observe(httpx.Response(200, headers=headers))
+    assert adaptive.limit == 500
+
+    static = APIProvider(name="s", key="k", limit_per_minute=60)
+    await static.observe(httpx.Response(200, headers=headers))
+    assert static.limit == 60
+    assert await static.is_available() is True
+
+
+@pytest.mark.asyncio
+async def test_provider_usage_resets_each_window(monkeypatch):
+    """
+    Test that usage is counted per one-minute window.
+    """
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    provider = APIProvider(name="p", key="k", limit_per_minute=1)
+
+    await provider.record_usage()
+    assert await provider.is_available() is False
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert await provider.is_available() is True
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_windows_are_not_reset_per_provider(monkeypatch):
+    """
+    Test that providers sharing a backend share its usage windows, so one
+    provider instance cannot wipe usage another has recorded.
+    """
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    backend = InMemoryBackend()
+    first = APIProvider(name="p", key="k", limit_per_minute=2,
+                        backend=backend)
+    await first.record_usage()
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    second = APIProvider(name="p", key="k", limit_per_minute=2,
+                         backend=backend)
+    await second.record_usage()
+
+    assert await first.is_available() is False
+    assert await second.is_available() is False
+    assert await backend.get_usage("p") == 2
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+    assert await backend.get_usage("p") == 0  # Window 960-1020 has ended
@@ -1,9 +1,12 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, patch
 
 import httpx
 import pytest
+import pytest_asyncio
 
-from skaler import Requester
+from skaler import Requester, TransportConfig
+from skaler.http.transport import CachingDNSBackend
 
 
 @pytest.mark.asyncio
@@ -29,14 +32,16 @@ async def test_send_basic_request():
             method="GET",
             url="https://example.com",
             headers=None,
-            json=None,
-            timeout=10,
-            proxies=None
+            params=None,
+            content=None,
+            timeout=httpx.USE_CLIENT_DEFAULT
         )
 
         assert response.status_code == 200
         assert response.json() == {"message": "ok"}
 
+    await requester.aclose()
+
 @pytest.mark.asyncio
 async def test_send_with_headers_and_json():
     """
@@ -66,29 +71,36 @@ async def test_send_with_headers_and_json():
         mock_request.assert_awaited_once_with(
             method="POST",
             url="https://example.com/api",
-            headers=headers,
-            json=json_payload,
-            timeout=10,
-            proxies=None,
+            headers=ANY,
+            params=None,
+            content=requester.serializer.encode(json_payload),
+            timeout=httpx.USE_CLIENT_DEFAULT,
         )
+        sent_headers = mock_request.await_args.kwargs["headers"]
+        assert sent_headers["Authorization"] == "Bearer token"
+        assert sent_headers["Content-Type"] == "application/json"
+        assert headers == {"Authorization": "Bearer token"}
         assert response.status_code == 201
         assert response.json() == {"created": True}
 
+    await requester.aclose()
+
 @pytest.mark.asyncio
 async def test_send_with_proxy():
     """
-    Test that Requester.send sends a GET request using a specified HTTP proxy,
-    and returns the expected response.
+    Test that Requester.send sends a GET request through a client bound to
+    the specified HTTP proxy, and returns the expected response.
     """
     requester = Requester()
+    proxy_url = "http://127.0.0.1:8080"
+    proxy_client = requester._get_client(proxy_url)
 
     with patch.object(
-        requester.client, "request", new_callable=AsyncMock
+        proxy_client, "request", new_callable=AsyncMock
     ) as mock_request:
         mock_response = httpx.Response(200)
         mock_request.return_value = mock_response
 
-        proxy_url = "http://127.0.0.1:8080"
         response = await requester.send(
             "GET", "https://example.com", proxy=proxy_url
         )
@@ -97,12 +109,18 @@ async def test_send_with_proxy():
             method="GET",
             url="https://example.com",
             headers=None,
-            json=None,
-            timeout=10,
-            proxies={"http": proxy_url, "https": proxy_url},
+            params=None,
+            content=None,
+            timeout=httpx.USE_CLIENT_DEFAULT,
         )
         assert response.status_code == 200
 
+    # The proxy client is created once and reused
+    assert requester._get_client(proxy_url) is proxy_client
+    assert requester._get_client(None) is requester.client
+
+    await requester.aclose()
+
 
 @pytest.mark.asyncio
 async def test_send_raises_request_error():
@@ -119,3 +137,128 @@ async def test_send_raises_request_error():
 
         with pytest.raises(httpx.RequestError):
             await requester.send("GET", "https://example.com")
+
+    await requester.aclose()
+
+
+@pytest.mark.asyncio
+async def test_send_with_explicit_timeout():
+    """
+    Test that an explicit timeout passed to Requester.send overrides the
+    transport timeouts.
+    """
+    requester = Requester()
+
+    with patch.object(
+        requester.client, "request", new_callable=AsyncMock
+    ) as mock_request:
+        mock_request.return_value = httpx.Response(200)
+
+        await requester.send("GET", "https://example.com", timeout=3)
+
+        assert mock_request.await_args.kwargs["timeout"] == 3
+
+    await requester.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transport_config_applied_to_client():
+    """
+    Test that TransportConfig limits and granular timeouts are applied to
+    the clients built by the Requester.
+    """
+    transport = TransportConfig(
+        max_connections=10,
+        max_keepalive_connections=5,
+        connect_timeout=1.0,
+        read_timeout=2.0,
+        write_timeout=3.0,
+        pool_timeout=4.0
+    )
+    requester = Requester(transport)
+
+    assert requester.client.timeout == httpx.Timeout(
+        connect=1.0, read=2.0, write=3.0, pool=4.0
+    )
+    pool = requester.client._transport._pool
+    assert pool._max_connections == 10
+    assert pool._max_keepalive_connections == 5
+
+    await requester.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transport_config_dns_cache():
+    """
+    Test that a positive dns_cache_ttl wraps the network backend with the
+    caching resolver.
+    """
+    client = TransportConfig(dns_cache_ttl=30).build_client()
+    backend = client._transport._pool._network_backend
+    assert isinstance(backend, CachingDNSBackend)
+
+    await client.aclose()
+
+
+class KeepAliveServer:
+    """
+    Answers every HTTP/1.1 request with an empty 200, keeping connections
+    open, and counts the connections clients still hold.
+    """
+
+    def __init__(self) -> None:
+        self.open = 0
+        self.server = None
+
+    async def handle(self, reader, writer) -> None:
+        self.open += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.open -= 1
+            writer.close()
+
+
+@pytest_asyncio.fixture
+async def keepalive_server():
+    upstream = KeepAliveServer()
+    upstream.server = await asyncio.start_server(
+        upstream.handle, "127.0.0.1", 0
+    )
+    port = upstream.server.sockets[0].getsockname()[1]
+    upstream.url = f"http://127.0.0.1:{port}"
+    yield upstream
+    upstream.server.close()
+    await upstream.server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_every_connection(keepalive_server):
+    """
+    Test that closing a requester closes the pooled connections of its
+    direct client and of every proxy client, and that a closed requester
+    refuses new requests.
+    """
+    url = keepalive_server.url
+    async with Requester() as requester:
+        await requester.send("GET", url)
+        # The server doubles as an HTTP proxy for plain http:// targets
+        await requester.send("GET", url, proxy=url)
+        await asyncio.sleep(0.01)
+        assert keepalive_server.open == 2
+
+    await asyncio.sleep(0.01)
+    assert keepalive_server.open == 0
+    assert requester.closed
+
+    with pytest.raises(RuntimeError):
+        await requester.send("GET", url)
+
+    # Closing twice is harmless
+    await requester.aclose()
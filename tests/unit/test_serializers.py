@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+
+import httpx
+import pytest
+
+from skaler import Requester
+from skaler.http.serializers import (
+    MsgspecSerializer,
+    OrjsonSerializer,
+    Serializer,
+    StdlibSerializer,
+    default_serializer,
+)
+
+
+@dataclass
+class Completion:
+    id: str
+    tokens: int
+
+
+def _serializers():
+    """
+    Returns the serializers that can be built in this environment.
+    """
+    serializers = [StdlibSerializer()]
+    for serializer_class in (OrjsonSerializer, MsgspecSerializer):
+        try:
+            serializers.append(serializer_class())
+        except ImportError:
+            pass
+    return serializers
+
+
+@pytest.mark.parametrize("serializer", _serializers(), ids=lambda s: s.name)
+def test_round_trip(serializer):
+    """
+    Test that every serializer encodes to compact JSON bytes and decodes
+    bytes and memoryviews back to the same value.
+    """
+    payload = {"prompt": "héllo", "max_tokens": 10, "stop": ["\n"]}
+
+    encoded = serializer.encode(payload)
+    assert isinstance(encoded, bytes)
+    assert serializer.decode(encoded) == payload
+    assert serializer.decode(memoryview(encoded)) == payload
+
+
+@pytest.mark.parametrize("serializer", _serializers(), ids=lambda s: s.name)
+def test_encodes_whatever_the_stdlib_accepts(serializer):
+    """
+    Test that payloads the standard library accepts, such as non-string
+    keys and integers wider than 64 bits, encode with every serializer.
+    """
+    payload = {1: "a", "big": 2 ** 70}
+
+    encoded = serializer.encode(payload)
+    assert serializer.decode(encoded) == {"1": "a", "big": 2 ** 70}
+
+
+@pytest.mark.parametrize("serializer", _serializers(), ids=lambda s: s.name)
+def test_decode_into_type(serializer):
+    """
+    Test that every serializer can decode an object into a typed class.
+    """
+    completion = serializer.decode(b'{"id": "c1", "tokens": 5}', Completion)
+    assert completion == Completion(id="c1", tokens=5)
+
+
+def test_msgspec_decodes_typed_structs():
+    """
+    Test that the msgspec serializer validates and decodes straight into
+    msgspec structs, including containers of structs.
+    """
+    msgspec = pytest.importorskip("msgspec")
+
+    class Choice(msgspec.Struct):
+        text: str
+
+    serializer = MsgspecSerializer()
+    choices = serializer.decode(b'[{"text": "a"}, {"text": "b"}]', list[Choice])
+    assert choices == [Choice("a"), Choice("b")]
+
+    with pytest.raises(msgspec.ValidationError):
+        serializer.decode(b'[{"text": 1}]', list[Choice])
+
+
+def test_default_serializer_prefers_fast_libraries():
+    """
+    Test that the default serializer is orjson or msgspec when either is
+    installed, and the stdlib otherwise.
+    """
+    names = {s.name for s in _serializers()}
+    expected = next(
+        (name for name in ("orjson", "msgspec") if name in names), "json"
+    )
+    assert default_serializer().name == expected
+
+
+def test_requester_decode_uses_serializer():
+    """
+    Test that Requester.decode parses the raw response body with the
+    configured serializer.
+    """
+    requester = Requester(serializer=StdlibSerializer())
+    response = httpx.Response(200, content=b'{"id": "c2", "tokens": 7}')
+
+    assert requester.decode(response) == {"id": "c2", "tokens": 7}
+    assert requester.decode(response, Completion) == Completion("c2", 7)
+
+
+def test_serializer_base_is_abstract():
+    """
+    Test that the base class cannot be used without implementing both
+    encode() and decode().
+    """
+    with pytest.raises(TypeError):
+        Serializer()
+
+    class EncodeOnly(Serializer):
+        def encode(self, obj):
+            return b"{}"
+
+    with pytest.raises(TypeError):
+        EncodeOnly()
+
+
+def test_encode_json_headers_cannot_be_changed_for_later_requests():
+    """
+    Test that the default JSON headers handed to callers are read-only.
+    """
+    requester = Requester()
+    _, headers = requester.encode_json({"a": 1})
+
+    with pytest.raises(TypeError):
+        headers["Content-Type"] = "text/plain"
+    assert requester.encode_json({"a": 1})[1]["Content-Type"] == (
+        "application/json"
+    )